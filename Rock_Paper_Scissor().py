@@ -1,43 +1,124 @@
 import customtkinter as ctk
-import random
 from tkinter import messagebox, TclError
+import argparse
 import math
-import pygame
 import time
+import rps_analytics
+import rps_anim
+import rps_audio
+import rps_engine
+import rps_fonts
+import rps_history
+import rps_log
+import rps_opponent
+import rps_particles
+import rps_ranking
+import rps_remote
+import rps_replay
+import rps_scene
+import rps_server
+import rps_sprites
+import rps_store
+import rps_trace
+
+log = rps_log.get_logger("ui")
+game_log = rps_log.get_logger("game")
 
 class RockPaperScissorsApp:
     BUTTON_CLICK_SOUND = "RPC_click.wav.mp3"
     BACKGROUND_MUSIC = "RPC_bg_music.mp3.wav"
-
-    def __init__(self, root):
-        print("Initializing RockPaperScissorsApp")
-        try:
-            pygame.mixer.init()
-        except pygame.error as e:
-            print(f"Error initializing pygame.mixer: {e}")
-        self.music_playing = False
-        self.click_sound = None
+    LEADERBOARD_FILE = "rps_leaderboard.json"
+    SAVE_FILE = "rps_save.json"
+    HISTORY_FILE = "rps_history.bin"
+    LAST_SESSION_FILE = "rps_last_session.json"
+    # name: (file, channel pool category, max simultaneous voices); add "stinger" effects once their files ship.
+    SOUND_EFFECTS = {
+        "click": (BUTTON_CLICK_SOUND, "ui", 2),
+    }
+    PULSING_BUTTONS = ("Start Game", "Reset", "Rock", "Paper", "Scissors")
+    # Screens are built on first use and then only shown/hidden.
+    SCREEN_BUILDERS = {
+        "welcome": "setup_welcome_screen",
+        "rounds": "setup_rounds_screen",
+        "game": "setup_game_screen",
+    }
+    # Methods timed as spans when tracing is on (--trace).
+    TRACED_METHODS = ("play", "animate_gestures", "display_result", "start_game", "clear_main_ui",
+                      "show_game_over_popup")
+    # Screens drawn over the welcome background canvas.
+    BACKDROP_SCREENS = ("welcome", "rounds")
+    # Indexed by rps_engine outcome code: (result text, label color, log prefix)
+    RESULT_STYLES = {
+        rps_engine.TIE: ("It's a Tie! ⚔️", "#FFA500", "Tie"),
+        rps_engine.WIN: ("You Win! 🏆", "#00FF00", "Player wins"),
+        rps_engine.LOSE: ("PC Wins! 😈", "#FF0000", "Computer wins"),
+    }
+
+    def __init__(self, root, max_fps=rps_anim.FrameClock.DEFAULT_MAX_FPS, server=None, pvp=False,
+                 trace=None, fps_overlay=False):
+        log.info("Initializing RockPaperScissorsApp")
+        # The mixer starts and decodes on a worker thread; requests made before
+        # it is ready are queued and played once loading finishes.
+        self.audio = rps_audio.AudioService(self.SOUND_EFFECTS, music=self.BACKGROUND_MUSIC)
         self.load_sounds()
         self.play_background_music()
+        # Leaderboard/save files are loaded and written on the store's own thread.
+        self.store = rps_store.GameStore(self.LEADERBOARD_FILE, self.SAVE_FILE)
+        self.ranking = rps_ranking.RankingEngine()
+        self.store.listeners.append(self.ranking.update_many)
+        self.store.start()
 
         self.root = root
         self.root.geometry("600x450")
         self.root.title("Rock Paper Scissors Deluxe")
         self.root.resizable(False, False)
+        self.closed = False
+        self.root.protocol("WM_DELETE_WINDOW", self.shutdown)
         self.is_animating = False
         self.last_click_time = 0
         self.click_cooldown = 0.5
         self.is_running = True
-        self.after_ids = []
+        self.animation_clock = rps_anim.FrameClock(self.root, max_fps=max_fps)
+        self.text_reveal = rps_anim.TextReveal(self.animation_clock)
         self.animated_widgets = []
-
-        self.choices = ["Rock", "Paper", "Scissors"]
-        self.player_score = 0
-        self.computer_score = 0
-        self.current_round = 1
-        self.max_rounds = 5
-        self.round_wins = {'player': 0, 'computer': 0}
+        # Optional tracing: spans written to `trace` as Chrome trace JSON on exit, and/or
+        # the frame-time histogram behind the FPS overlay. Off, it leaves every method as is.
+        self.trace_path = trace
+        self.tracer = rps_trace.Tracer(enabled=trace is not None)
+        self.fps_overlay = fps_overlay
+        self.frame_overlay = None
+        self.round_span = None
+        self.rounds_started = 0
+        if trace or fps_overlay:
+            self.animation_clock.frame_observer = self.tracer.frame
+        self.tracer.instrument(self, self.TRACED_METHODS)
+
+        self.choices = list(rps_engine.GESTURES)
+        self.match = rps_engine.MatchState(max_rounds=5)
+        self.history = rps_history.MatchHistory(self.HISTORY_FILE)
+        self.analytics = rps_analytics.Analytics()
+        self.difficulty = rps_opponent.DEFAULT_DIFFICULTY
+        self.session = rps_replay.SessionRNG()
+        self.opponent = rps_opponent.make_opponent(self.difficulty, self.session.logic)
+        self.session_record = rps_replay.SessionRecord(self.session.seed, self.match.max_rounds,
+                                                       opponent=self.difficulty)
+        self.replaying = False
+        # Optional rps_server match server ("host:port") used instead of the local CPU.
+        self.server_address = server
+        self.pvp = pvp
+        self.remote = None
+        self.remote_poll = None  # clock handle of the poll waiting for the server's ROUND
+        self.keyframe_cache = rps_scene.KeyframeCache()
+        self.sprite_atlas = rps_sprites.SpriteAtlas(frame_count=self.keyframe_cache.frame_count)
+        self.sprite_atlas.prepare_async()
+        self.fonts = rps_fonts.FontCache(rps_fonts.tk_font_factory(self.root))
+        self.fonts.prepare(rps_scene.gesture_font_specs(self.keyframe_cache.frame_count))
+        # Welcome and popup icons: ("Arial", 40) pulsing by up to 10% (trophy) and 5% (tie).
+        self.fonts.prepare(self.fonts.sizes("Arial", rps_fonts.pulse_sizes(40, 0.1)))
+        self.label_fonts = rps_fonts.FontCache(rps_fonts.ctk_font_factory(), prefix="rps-label")
+        self.label_fonts.prepare(self.label_fonts.sizes("Impact", rps_fonts.pulse_sizes(16, 0.05), "bold"))
         self.player_name = None
+        self.load_analytics()
 
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
@@ -50,119 +131,89 @@ class RockPaperScissorsApp:
         self.main_container_frame.pack(fill='both', expand=True)
         self.root.update_idletasks()
 
-        self.setup_welcome_screen()
+        self.screens = {}
+        self.current_screen = None
+        self.welcome_icon_handle = None
+        self.popup_animation_handles = []
+        self.show_screen("welcome")
 
     def load_sounds(self):
-        try:
-            self.click_sound = pygame.mixer.Sound(self.BUTTON_CLICK_SOUND)
-            print("Button click sound loaded")
-        except pygame.error as e:
-            print(f"Error loading button click sound '{self.BUTTON_CLICK_SOUND}': {e}, skipping sound")
+        self.audio.start()
 
     def play_background_music(self):
-        try:
-            pygame.mixer.music.load(self.BACKGROUND_MUSIC)
-            pygame.mixer.music.set_volume(0.2)
-            pygame.mixer.music.play(-1)
-            self.music_playing = True
-            print("Background music started")
-        except pygame.error as e:
-            print(f"Error playing background music '{self.BACKGROUND_MUSIC}': {e}, skipping music")
+        self.audio.play_music()
 
     def stop_background_music(self):
-        if self.music_playing:
-            try:
-                pygame.mixer.music.stop()
-                self.music_playing = False
-                print("Background music stopped")
-            except pygame.error as e:
-                print(f"Error stopping background music: {e}")
+        self.audio.stop_music()
+
+    @property
+    def music_playing(self):
+        return self.audio.music_playing
 
     def ease_out_sine(self, t):
-        return math.sin((t * math.pi) / 2)
+        return rps_scene.ease_out_sine(t)
 
     def cancel_animations(self):
-        print("Cancelling animations")
-        for after_id in self.after_ids[:]:  # Copy to avoid modifying while iterating
-            try:
-                self.root.after_cancel(after_id)
-                self.after_ids.remove(after_id)
-            except TclError:
-                pass
-        for widget in self.animated_widgets[:]:
+        log.debug("Cancelling animations (%s live)", self.animation_clock.live_count())
+        self.animation_clock.cancel_all()
+        for widget in self.animated_widgets:
             try:
                 if widget.winfo_exists():
                     widget.configure(hover=False)
-                self.animated_widgets.remove(widget)
             except TclError:
                 pass
-        print("All animations cancelled")
+        self.animated_widgets.clear()
+        log.debug("All animations cancelled")
 
     def clear_main_ui(self):
-        print("Clearing main UI")
-        self.cancel_animations()
+        log.debug("Clearing main UI")
         try:
-            if hasattr(self, 'welcome_background_canvas') and self.welcome_background_canvas.winfo_exists():
-                self.welcome_background_canvas.destroy()
-            if hasattr(self, 'round_input_frame') and self.round_input_frame.winfo_exists():
-                self.round_input_frame.destroy()
-            if hasattr(self, 'game_over_popup') and self.game_over_popup.winfo_exists():
-                self.game_over_popup.destroy()
-            for widget in self.main_container_frame.winfo_children():
-                try:
-                    if widget.winfo_exists():
-                        widget.destroy()
-                        print(f"Destroyed widget: {widget}")
-                except TclError as e:
-                    print(f"TclError destroying widget {widget}: {e}")
-            self.main_container_frame.pack_forget()
-            self.main_container_frame = ctk.CTkFrame(self.root, fg_color="transparent")
-            self.main_container_frame.pack(fill='both', expand=True)
-            self.root.update_idletasks()
-            print("Main UI cleared")
+            self.hide_game_over_popup()
+            if self.current_screen is not None and self.current_screen.winfo_exists():
+                self.current_screen.pack_forget()
+            self.current_screen = None
+            if self.welcome_background_canvas.winfo_exists():
+                self.welcome_background_canvas.pack_forget()
+            log.debug("Main UI cleared")
         except Exception as e:
-            print(f"Error in clear_main_ui: {e}")
-
-    def draw_confetti(self, canvas):
-        emojis = ['🎉', '✨', '🌟', '🎊']
-        for _ in range(10):
-            x = random.randint(0, canvas.winfo_width())
-            y = random.randint(0, canvas.winfo_height() // 2)
-            emoji = random.choice(emojis)
-            canvas.create_text(x, y, text=emoji, font=("Arial", 16), fill="white")
-
-    def draw_particles(self, canvas, player_type, progress):
-        if not canvas.winfo_exists():
-            return
-        canvas_width = canvas.winfo_width()
-        canvas_height = canvas.winfo_height()
-        x_offset = canvas_width * 0.25 if player_type == "player" else canvas_width * 0.75
-        y_offset = canvas_height * 0.5
-        for _ in range(5):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(10, 30) * progress
-            size = random.uniform(1, 4)
-            x = x_offset + distance * math.cos(angle)
-            y = y_offset + distance * math.sin(angle)
-            alpha = max(0, 1 - progress)
-            color = f"#{(int(255 * alpha)):02x}{(int(255 * alpha)):02x}ff"
-            canvas.create_oval(x - size, y - size, x + size, y + size, fill=color, outline="")
+            log.error("Error in clear_main_ui: %s", e)
+
+    def show_screen(self, name):
+        log.debug("Showing screen: %s", name)
+        screen = self.screens.get(name)
+        if screen is None or not screen.winfo_exists():
+            screen = getattr(self, self.SCREEN_BUILDERS[name])()
+            if screen is None:
+                log.error("Failed to build screen: %s", name)
+                return None
+            self.screens[name] = screen
+            log.debug("Screen built: %s", name)
+        if self.current_screen is not None and self.current_screen is not screen:
+            self.current_screen.pack_forget()
+        if name in self.BACKDROP_SCREENS:
+            if not self.welcome_background_canvas.winfo_manager():
+                self.welcome_background_canvas.pack(fill="both", expand=True, pady=(20, 0),
+                                                    before=self.main_container_frame)
+            self.start_welcome_icon()
+        else:
+            self.welcome_background_canvas.pack_forget()
+        screen.pack(expand=True, fill='both', pady=0, anchor="center")
+        self.current_screen = screen
+        return screen
 
     def create_glowing_button(self, master, text, command, fg_color, hover_color, width=100, height=30, text_color="#FFFFFF"):
+        pulsing = text in self.PULSING_BUTTONS
         def wrapped_command():
             current_time = time.time()
             if current_time - self.last_click_time < self.click_cooldown:
                 return
             self.last_click_time = current_time
-            if self.click_sound:
-                try:
-                    self.click_sound.play()
-                except pygame.error as e:
-                    print(f"Error playing button click sound: {e}")
+            self.audio.play("click")
             try:
                 command()
             except Exception as e:
-                print(f"Error executing command for button {text}: {e}")
+                log.error("Error executing command for button %s: %s", text, e)
+        wrapped_command = self.tracer.wrap(wrapped_command, f"click {text}", "input")
 
         glowing_button = ctk.CTkButton(
             master,
@@ -174,110 +225,50 @@ class RockPaperScissorsApp:
             text_color=text_color,
             corner_radius=8,
             border_color="#FFFFFF",
-            border_width=1,
+            border_width=2 if pulsing else 1,
             width=width,
             height=height
         )
         self.animated_widgets.append(glowing_button)
-        glowing_button._pulse_after_id = None
+        glowing_button._pulse_handle = None
+
+        # The glow only recolors the border, so the button never changes size and
+        # the parent's pack geometry is left alone.
+        palette = rps_anim.pulse_palette(fg_color, "#FFFFFF", period=20)
+        last_color = [None]
 
-        def pulse(step=0):
+        def pulse(step):
             if not self.is_running or not glowing_button.winfo_exists():
-                return
-            try:
-                if text in ["Start Game", "Reset", "Rock", "Paper", "Scissors"]:
-                    scale = 1.0 + 0.05 * math.sin(step * 0.1 * math.pi)
-                    glowing_button.configure(width=int(width * scale), height=int(height * scale))
-                glowing_button._pulse_after_id = glowing_button.after(100, lambda: pulse(step + 1))
-                self.after_ids.append(glowing_button._pulse_after_id)
-            except TclError:
-                pass
+                return False
+            if not glowing_button.winfo_ismapped():
+                return True
+            color = palette[step % len(palette)]
+            if color != last_color[0]:
+                glowing_button.configure(border_color=color)
+                last_color[0] = color
+            return True
 
         def custom_destroy():
             try:
-                if glowing_button._pulse_after_id:
-                    glowing_button.after_cancel(glowing_button._pulse_after_id)
-                    self.after_ids.remove(glowing_button._pulse_after_id) if glowing_button._pulse_after_id in self.after_ids else None
+                if glowing_button._pulse_handle:
+                    self.animation_clock.cancel(glowing_button._pulse_handle)
                 if glowing_button in self.animated_widgets:
                     self.animated_widgets.remove(glowing_button)
                 ctk.CTkButton.destroy(glowing_button)
             except TclError as e:
-                print(f"TclError in custom_destroy for button {text}: {e}")
+                log.error("TclError in custom_destroy for button %s: %s", text, e)
 
         glowing_button.destroy = custom_destroy
 
-        if text in ["Start Game", "Reset", "Rock", "Paper", "Scissors"]:
-            pulse()
+        if pulsing:
+            glowing_button._pulse_handle = self.animation_clock.add(pulse, 100)
         return glowing_button
 
-    def draw_gesture(self, canvas, gesture, player_type, progress):
-        if not canvas.winfo_exists():
-            return
-        canvas_width = canvas.winfo_width()
-        canvas_height = canvas.winfo_height()
-        x_offset = canvas_width * 0.25 if player_type == "player" else canvas_width * 0.75
-        y_offset = canvas_height * 0.5
-        eased = self.ease_out_sine(progress)
-        scale_factor = 0.8 + 0.5 * eased * (1 + 0.2 * math.sin(progress * 4 * math.pi))
-        alpha = min(1.0, progress * 2)
-        color_intensity = int(255 * alpha)
-        glow_intensity = int(255 * (0.5 + 0.4 * math.sin(progress * 6 * math.pi)))
-
-        self.draw_particles(canvas, player_type, progress)
-
-        if gesture == "Rock":
-            radius = 25 * scale_factor
-            color = f"#{color_intensity:02x}{color_intensity:02x}{color_intensity:02x}"
-            glow_color = f"#{glow_intensity:02x}{glow_intensity:02x}ff"
-            canvas.create_oval(x_offset - radius - 5, y_offset - radius - 5, x_offset + radius + 5,
-                               y_offset + radius + 5, outline=glow_color, width=4)
-            canvas.create_oval(x_offset - radius - 3, y_offset - radius - 3, x_offset + radius + 3,
-                               y_offset + radius + 3, outline="#FFFFFF", width=3)
-            canvas.create_oval(x_offset - radius, y_offset - radius, x_offset + radius, y_offset + radius, fill=color,
-                               outline="#FFD700", width=2)
-            canvas.create_text(x_offset, y_offset + 30, text="✊", font=("Arial", int(20 * scale_factor)), fill="#FFD700")
-
-        elif gesture == "Paper":
-            size = 35 * scale_factor
-            color = f"#{color_intensity:02x}{color_intensity:02x}ff"
-            glow_color = f"#{glow_intensity:02x}ff{glow_intensity:02x}"
-            canvas.create_rectangle(x_offset - size / 2 - 5, y_offset - size / 2 - 5, x_offset + size / 2 + 5,
-                                    y_offset + size / 2 + 5, outline=glow_color, width=4)
-            canvas.create_rectangle(x_offset - size / 2 - 3, y_offset - size / 2 - 3, x_offset + size / 2 + 3,
-                                    y_offset + size / 2 + 3, outline="#FFFFFF", width=3)
-            canvas.create_rectangle(x_offset - size / 2, y_offset - size / 2, x_offset + size / 2, y_offset + size / 2,
-                                    fill=color, outline="#00FFFF", width=2)
-            canvas.create_text(x_offset, y_offset + 30, text="📄", font=("Arial", int(20 * scale_factor)), fill="#00FFFF")
-
-        elif gesture == "Scissors":
-            angle = 15 * math.sin(progress * 3 * math.pi)
-            color = f"#{color_intensity:02x}0000"
-            glow_color = f"#ff{glow_intensity:02x}{glow_intensity:02x}"
-            line_width = 5
-            canvas.create_line(x_offset, y_offset, x_offset + 30 * scale_factor * math.cos(math.radians(angle)),
-                               y_offset + 30 * scale_factor * math.sin(math.radians(angle)), width=line_width + 2,
-                               fill=glow_color)
-            canvas.create_line(x_offset, y_offset, x_offset + 30 * scale_factor * math.cos(math.radians(-angle)),
-                               y_offset + 30 * scale_factor * math.sin(math.radians(-angle)), width=line_width + 2,
-                               fill=glow_color)
-            canvas.create_line(x_offset, y_offset, x_offset + 25 * scale_factor * math.cos(math.radians(angle)),
-                               y_offset + 25 * scale_factor * math.sin(math.radians(angle)), width=line_width,
-                               fill=color)
-            canvas.create_line(x_offset, y_offset, x_offset + 25 * scale_factor * math.cos(math.radians(-angle)),
-                               y_offset + 25 * scale_factor * math.sin(math.radians(-angle)), width=line_width,
-                               fill=color)
-            canvas.create_text(x_offset, y_offset + 30, text="✂️", font=("Arial", int(20 * scale_factor)), fill="#FF4500")
-
     def setup_welcome_screen(self):
-        print("Setting up welcome screen")
+        log.debug("Setting up welcome screen")
         try:
-            self.clear_main_ui()
-            self.welcome_background_canvas = ctk.CTkCanvas(self.root, width=200, height=50, bg="#1C2526", highlightthickness=0)
-            self.welcome_background_canvas.pack(fill="both", expand=True, pady=(20,0))
             self.welcome_content_frame = ctk.CTkFrame(self.main_container_frame, fg_color="transparent")
-            self.welcome_content_frame.pack(expand=True, fill='both', pady=0, anchor="center")
-            self.root.update_idletasks()
-            print("Welcome content frame created")
+            log.debug("Welcome content frame created")
 
             self.welcome_title_label = ctk.CTkLabel(self.welcome_content_frame,
                                               text="🎮 Rock Paper Scissors Deluxe! ✨",
@@ -307,7 +298,7 @@ class RockPaperScissorsApp:
             self.player_name_entry.pack()
             self.player_name_entry.bind("<Return>", lambda event: self.submit_name())
             self.player_name_entry.focus_set()
-            print("Player name entry created")
+            log.debug("Player name entry created")
 
             self.start_button_container_frame = ctk.CTkFrame(self.welcome_content_frame, fg_color="transparent")
             self.start_button_container_frame.pack(pady=(20, 0))
@@ -320,7 +311,7 @@ class RockPaperScissorsApp:
                                                width=150,
                                                height=40)
             self.start_game_button.pack(side='left', padx=10)
-            print("Start game button created")
+            log.debug("Start game button created")
 
             self.exit_button = self.create_glowing_button(self.start_button_container_frame,
                                          "Exit",
@@ -330,25 +321,39 @@ class RockPaperScissorsApp:
                                          width=150,
                                          height=40)
             self.exit_button.pack(side='right', padx=10)
-            print("Exit button created")
+            log.debug("Exit button created")
 
             self.welcome_gesture_icon = self.welcome_background_canvas.create_text(self.welcome_background_canvas.winfo_width() / 2,
                                                            self.welcome_background_canvas.winfo_height() * 0.2,
-                                                           text="✊", font=("Arial", 40), fill="#00FFFF")
+                                                           text="✊", font=self.fonts.get(("Arial", 40)), fill="#00FFFF")
             self.gesture_step = 0
-            self.animate_gesture_icon()
-
-            self.root.update()
-            print("Welcome screen setup complete")
+            self.animation_clock.add(lambda step: self.prefill_player_name(), 100)
+            log.debug("Welcome screen setup complete")
+            return self.welcome_content_frame
         except TclError as e:
-            print(f"TclError in setup_welcome_screen: {e}")
+            log.error("TclError in setup_welcome_screen: %s", e)
         except Exception as e:
-            print(f"Error in setup_welcome_screen: {e}")
-
-    def animate_gesture_icon(self):
-        if not self.is_running or not self.welcome_background_canvas.winfo_exists():
-            return
-        self.gesture_step += 1
+            log.error("Error in setup_welcome_screen: %s", e)
+
+    def start_welcome_icon(self):
+        if self.welcome_icon_handle is None or not self.animation_clock.is_live(self.welcome_icon_handle):
+            self.welcome_icon_handle = self.animation_clock.add(self.animate_gesture_icon, 150)
+
+    def prefill_player_name(self):
+        """Fill the name entry from rps_save.json once the store has loaded it."""
+        if not self.store.loaded.is_set():
+            return True
+        name = self.store.last_save().get("player_name")
+        if name and self.player_name_entry.winfo_exists() and not self.player_name_entry.get():
+            self.player_name_entry.insert(0, name)
+            log.debug("Prefilled player name: %s", name)
+        return False
+
+    def animate_gesture_icon(self, step):
+        if not self.is_running or not self.welcome_background_canvas.winfo_exists() \
+                or not self.welcome_background_canvas.winfo_manager():
+            return False
+        self.gesture_step = step + 1
         try:
             self.welcome_background_canvas.delete(self.welcome_gesture_icon)
             gestures = ["✊", "📄", "✂️"]
@@ -357,141 +362,267 @@ class RockPaperScissorsApp:
             canvas_width = self.welcome_background_canvas.winfo_width()
             canvas_height = self.welcome_background_canvas.winfo_height()
             self.welcome_gesture_icon = self.welcome_background_canvas.create_text(canvas_width / 2, canvas_height * 0.2,
-                                                           text=current_gesture, font=("Arial", 40), fill="#00FFFF",
+                                                           text=current_gesture, font=self.fonts.get(("Arial", 40)), fill="#00FFFF",
                                                            angle=angle)
-            after_id = self.welcome_background_canvas.after(150, self.animate_gesture_icon)
-            self.after_ids.append(after_id)
+            return True
         except TclError as e:
-            print(f"TclError animating gesture icon: {e}")
+            log.error("TclError animating gesture icon: %s", e)
         except Exception as e:
-            print(f"Error animating gesture icon: {e}")
+            log.error("Error animating gesture icon: %s", e)
+        return False
 
     def submit_name(self):
-        print("submit_name called")
+        game_log.debug("submit_name called")
         try:
             name = self.player_name_entry.get().strip()
             if not name:
-                print("Empty name entered")
+                game_log.debug("Empty name entered")
                 messagebox.showwarning("Input Error", "Please enter your name, warrior!")
                 return
             self.player_name = name
-            print(f"Player name set to: {self.player_name}")
+            game_log.info("Player name set to: %s", self.player_name)
             self.prompt_rounds()
         except TclError as e:
-            print(f"TclError in submit_name: {e}")
+            game_log.error("TclError in submit_name: %s", e)
         except Exception as e:
-            print(f"Error in submit_name: {e}")
+            game_log.error("Error in submit_name: %s", e)
 
     def prompt_rounds(self):
-        print("prompt_rounds called")
+        log.debug("prompt_rounds called")
         try:
-            if hasattr(self, 'welcome_content_frame') and self.welcome_content_frame.winfo_exists():
-                self.welcome_content_frame.pack_forget()
-                print("Welcome content frame hidden")
-
-            self.round_input_frame = ctk.CTkFrame(self.main_container_frame, fg_color="transparent")
-            self.round_input_frame.pack(expand=True, fill='both', pady=0, anchor="center")
-            print("Round input frame created")
-
-            title_label = ctk.CTkLabel(self.round_input_frame,
-                                       text="🎮 Enter Number of Rounds! 🎲",
-                                       font=("Impact", 34, "bold"),
-                                       text_color="#FFD700")
-            title_label.pack(pady=(0, 20))
-
-            tagline_label = ctk.CTkLabel(self.round_input_frame,
-                                         text="How Many Rounds Will You Battle? (1-100)",
-                                         font=("jell", 14, "italic"),
-                                         text_color="#FF69B4")
-            tagline_label.pack(pady=10)
-
-            self.rounds_entry = ctk.CTkEntry(self.round_input_frame,
-                                             placeholder_text="Enter Rounds (e.g., 5)",
-                                             font=("jell", 14, "bold"),
-                                             width=250,
-                                             height=35,
-                                             fg_color="#2A2A2A",
-                                             border_color="#00FFFF",
-                                             border_width=2,
-                                             text_color="#FFFFFF",
-                                             corner_radius=8)
-            self.rounds_entry.pack(pady=(0, 10))
-            self.rounds_entry.bind("<Return>", lambda event: self.submit_rounds())
+            self.show_screen("rounds")
+            self.rounds_entry.delete(0, 'end')
             self.rounds_entry.focus_set()
-            print("Rounds entry created")
-
-            self.submit_rounds_button = self.create_glowing_button(self.round_input_frame,
-                                                                  "Submit Rounds",
-                                                                  self.submit_rounds,
-                                                                  "#00CED1",
-                                                                  "#0097A7",
-                                                                  width=150,
-                                                                  height=40)
-            self.submit_rounds_button.pack(pady=(20, 0))
-            print("Submit rounds button created")
-
-            self.root.update_idletasks()
-            self.root.update()
-            print("Round input UI updated")
+            log.debug("Round input UI shown")
         except TclError as e:
-            print(f"TclError in prompt_rounds: {e}")
+            log.error("TclError in prompt_rounds: %s", e)
         except Exception as e:
-            print(f"Error in prompt_rounds: {e}")
+            log.error("Error in prompt_rounds: %s", e)
             messagebox.showerror("Error", f"Failed to show round input: {e}")
 
+    def setup_rounds_screen(self):
+        log.debug("Setting up rounds screen")
+        self.round_input_frame = ctk.CTkFrame(self.main_container_frame, fg_color="transparent")
+        log.debug("Round input frame created")
+
+        title_label = ctk.CTkLabel(self.round_input_frame,
+                                   text="🎮 Enter Number of Rounds! 🎲",
+                                   font=("Impact", 34, "bold"),
+                                   text_color="#FFD700")
+        title_label.pack(pady=(0, 20))
+
+        tagline_label = ctk.CTkLabel(self.round_input_frame,
+                                     text="How Many Rounds Will You Battle? (1-100)",
+                                     font=("jell", 14, "italic"),
+                                     text_color="#FF69B4")
+        tagline_label.pack(pady=10)
+
+        self.rounds_entry = ctk.CTkEntry(self.round_input_frame,
+                                         placeholder_text="Enter Rounds (e.g., 5)",
+                                         font=("jell", 14, "bold"),
+                                         width=250,
+                                         height=35,
+                                         fg_color="#2A2A2A",
+                                         border_color="#00FFFF",
+                                         border_width=2,
+                                         text_color="#FFFFFF",
+                                         corner_radius=8)
+        self.rounds_entry.pack(pady=(0, 10))
+        self.rounds_entry.bind("<Return>", lambda event: self.submit_rounds())
+        log.debug("Rounds entry created")
+
+        self.difficulty_selector = ctk.CTkSegmentedButton(self.round_input_frame,
+                                                          values=[level.title() for level in rps_opponent.DIFFICULTIES],
+                                                          command=self.set_difficulty,
+                                                          font=("jell", 13, "bold"),
+                                                          selected_color="#00CED1",
+                                                          selected_hover_color="#0097A7")
+        self.difficulty_selector.set(self.difficulty.title())
+        self.difficulty_selector.pack(pady=(10, 0))
+
+        self.submit_rounds_button = self.create_glowing_button(self.round_input_frame,
+                                                              "Submit Rounds",
+                                                              self.submit_rounds,
+                                                              "#00CED1",
+                                                              "#0097A7",
+                                                              width=150,
+                                                              height=40)
+        self.submit_rounds_button.pack(pady=(20, 0))
+        log.debug("Submit rounds button created")
+        return self.round_input_frame
+
+    def set_difficulty(self, label):
+        self.difficulty = label.lower()
+        game_log.info("Difficulty set to: %s", self.difficulty)
+
     def submit_rounds(self):
-        print("submit_rounds called")
+        game_log.debug("submit_rounds called")
         try:
             rounds = int(self.rounds_entry.get().strip())
             if rounds < 1 or rounds > 100:
-                print("Invalid rounds entered")
+                game_log.debug("Invalid rounds entered")
                 messagebox.showwarning("Input Error", "Please enter a number between 1 and 100!")
                 return
-            self.max_rounds = rounds
-            print(f"max_rounds set to: {self.max_rounds}")
+            self.match.max_rounds = rounds
+            game_log.info("max_rounds set to: %s", self.match.max_rounds)
             self.start_game()
         except ValueError:
-            print("Non-numeric rounds entered")
+            game_log.debug("Non-numeric rounds entered")
             messagebox.showwarning("Input Error", "Please enter a valid number!")
         except TclError as e:
-            print(f"TclError in submit_rounds: {e}")
+            game_log.error("TclError in submit_rounds: %s", e)
         except Exception as e:
-            print(f"Error in submit_rounds: {e}")
+            game_log.error("Error in submit_rounds: %s", e)
             messagebox.showerror("Error", f"Failed to submit rounds: {e}")
 
-    def start_game(self):
-        print("start_game called")
+    def start_game(self, seed=None, difficulty=None):
+        log.debug("start_game called")
         try:
-            self.clear_main_ui()
+            self.hide_game_over_popup()
             self.is_running = True
-            self.main_container_frame.configure(fg_color="#1C2526")
-            self.setup_top_panel()
-            self.setup_game_canvas()
-            self.setup_round_info()
-            self.setup_choice_buttons_panel()
-            self.setup_control_buttons_panel()
-            self.setup_commentator()
-            self.setup_footer()
-            self.init_result_label()
-            self.enable_choice_buttons()
-            self.update_score_display()
-            self.root.update()
-            print("Game UI set up")
+            self.begin_session(seed, difficulty)
+            self.show_screen("game")
+            self.refresh_game_screen()
+            if self.remote is not None and self.remote.connecting:
+                self.show_commentator("Connecting to the match server... Playing the local CPU until then.")
+            log.debug("Game UI shown")
         except TclError as e:
-            print(f"TclError in start_game: {e}")
+            log.error("TclError in start_game: %s", e)
         except Exception as e:
-            print(f"Error in start_game: {e}")
+            log.error("Error in start_game: %s", e)
+
+    def begin_session(self, seed=None, difficulty=None):
+        """Give the new match its own seeded logic and visual random streams and a fresh opponent."""
+        difficulty = difficulty or self.difficulty
+        self.cancel_remote_poll()
+        self.session = rps_replay.SessionRNG(seed)
+        self.opponent = rps_opponent.make_opponent(difficulty, self.session.logic)
+        self.session_record = rps_replay.SessionRecord(self.session.seed, self.match.max_rounds,
+                                                       opponent=difficulty)
+        remote = self.remote_opponent()
+        if remote is not None and remote.connected:
+            self.use_remote(remote)
+        if hasattr(self, 'game_scene'):
+            self.game_scene.rng = self.session.visual
+        if not self.replaying:
+            self.history.begin_session(self.player_name)
+            self.analytics.begin_session(self.player_name)
+        game_log.info("Session seed: %s, opponent: %s", self.session.seed, difficulty)
+
+    def remote_opponent(self):
+        """The match server connection, opened in the background on first use; None to play the local CPU."""
+        if self.server_address is None or self.replaying:
+            return None
+        if self.remote is None or not (self.remote.connected or self.remote.connecting):
+            try:
+                self.remote = rps_remote.RemoteOpponent(self.server_address, self.player_name)
+            except ValueError as e:
+                log.warning("Bad match server address '%s': %s. Playing the local CPU.", self.server_address, e)
+                self.server_address = None
+                self.remote = None
+                return None
+            log.info("Connecting to match server %s", self.remote.address)
+            self.animation_clock.add(self.watch_remote_connection, 100)
+        return self.remote
+
+    def watch_remote_connection(self, step):
+        """Wait for the background connect; the server takes over at once if this match has no rounds yet."""
+        remote = self.remote
+        if remote is None:
+            return False
+        event = remote.poll()
+        if event is None:
+            return True
+        kind, value = event
+        if kind == "connected":
+            log.info("Connected to match server %s", value)
+            if (self.is_running and not self.replaying and not self.is_animating
+                    and not self.session_record and self.opponent is not remote):
+                self.use_remote(remote)
+                self.show_commentator("Connected to the match server!")
+            else:
+                self.show_commentator("Connected to the match server. Online play starts with the next match.")
+            return False
+        log.warning("Error connecting to match server '%s': %s. Playing the local CPU.", self.server_address, value)
+        self.show_commentator("Could not reach the match server. Playing the local CPU.")
+        self.server_address = None
+        self.remote = None
+        return False
+
+    def use_remote(self, remote):
+        """Play this session against the match server; its record cannot be replayed locally."""
+        difficulty = self.session_record.opponent
+        remote.begin_match(self.match.max_rounds, rps_server.HUMAN if self.pvp else difficulty)
+        self.opponent = remote
+        self.session_record.replayable = False
+
+    def cancel_remote_poll(self):
+        if self.remote_poll is not None:
+            self.animation_clock.cancel(self.remote_poll)
+            self.remote_poll = None
+
+    def load_analytics(self):
+        """Rebuild per-player stats from earlier sessions in the background and add them to the live ones."""
+        try:
+            rebuild = rps_analytics.BackgroundRebuild(self.HISTORY_FILE)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            game_log.error("Error reading match history for analytics: %s", e)
+            return
+
+        def merge_when_done(step):
+            if not rebuild.done():
+                return True
+            if rebuild.error is not None:
+                log.error("Error rebuilding analytics: %s", rebuild.error)
+            else:
+                self.analytics.merge(rebuild.result)
+                log.info("Analytics rebuilt from %s recorded rounds", rebuild.limit)
+            return False
+
+        self.animation_clock.add(merge_when_done, 100)
+
+    def setup_game_screen(self):
+        log.debug("Setting up game screen")
+        self.game_screen_frame = ctk.CTkFrame(self.main_container_frame, fg_color="#1C2526")
+        self.setup_top_panel()
+        self.setup_game_canvas()
+        self.setup_round_info()
+        self.setup_choice_buttons_panel()
+        self.setup_control_buttons_panel()
+        self.setup_commentator()
+        self.setup_footer()
+        self.init_result_label()
+        log.debug("Game screen setup complete")
+        return self.game_screen_frame
+
+    def refresh_game_screen(self):
+        """Bring the cached game screen back to the state of a freshly started match."""
+        self.is_animating = False
+        display_name = self.player_name if self.player_name else "—"
+        self.player_name_label.configure(text=f"Player: {display_name}")
+        self.current_round_label.configure(text=f"Round {self.match.current_round} of {self.match.max_rounds}",
+                                           text_color="#FF69B4")
+        self.game_result_label.configure(text="Choose Your Move!", text_color="#00FFFF",
+                                         font=("Impact", 16, "bold"))
+        self.text_reveal.cancel("commentary")
+        self.commentator_text_label.configure(text="")
+        self.init_background_stars()
+        self.game_scene.build(self.star_positions)
+        self.enable_choice_buttons()
+        self.update_score_display()
 
     def init_result_label(self):
-        self.game_result_label = ctk.CTkLabel(self.main_container_frame,
+        self.game_result_label = ctk.CTkLabel(self.game_screen_frame,
                                          text="Choose Your Move!",
                                          font=("Impact", 16, "bold"),
                                          text_color="#00FFFF")
         self.game_result_label.pack(pady=10)
 
     def setup_top_panel(self):
-        print("Setting up top panel")
-        self.top_info_panel_frame = ctk.CTkFrame(self.main_container_frame, fg_color="transparent")
+        log.debug("Setting up top panel")
+        self.top_info_panel_frame = ctk.CTkFrame(self.game_screen_frame, fg_color="transparent")
         self.top_info_panel_frame.pack(fill='x', pady=(10, 0))
 
         self.game_title_label = ctk.CTkLabel(self.top_info_panel_frame,
@@ -511,50 +642,49 @@ class RockPaperScissorsApp:
         self.player_name_label.pack(side='left', padx=10)
 
         self.score_display_label = ctk.CTkLabel(self.info_container_frame,
-                                        text=f"Score - You: {self.player_score} | CPU: {self.computer_score}",
+                                        text=f"Score - You: {self.match.player_score} | CPU: {self.match.computer_score}",
                                         font=("Impact", 20, "bold"),
                                         text_color="#FFD700")
         self.score_display_label.pack(side='right', padx=10)
-        print("Top panel setup complete")
+        log.debug("Top panel setup complete")
 
     def setup_game_canvas(self):
-        self.game_canvas = ctk.CTkCanvas(self.main_container_frame,
+        self.game_canvas = ctk.CTkCanvas(self.game_screen_frame,
                                     width=400,
                                     height=150,
                                     bg="#1C2526",
                                     highlightthickness=1,
                                     highlightbackground="#00FFFF")
         self.game_canvas.pack(pady=(0, 10))
-        self.game_canvas.create_rectangle(0, 0, 400, 150, fill="#000000", stipple="gray25")
+        self.game_scene = rps_scene.GestureScene(self.game_canvas, rng=self.session.visual,
+                                                 keyframes=self.keyframe_cache, atlas=self.sprite_atlas,
+                                                 clock=self.animation_clock, fonts=self.fonts)
+        self.tracer.instrument(self.game_scene, ("render_frame",), "scene")
+        if self.fps_overlay:
+            self.frame_overlay = rps_trace.FrameOverlay(self.game_canvas, self.tracer.frames, self.animation_clock)
+        self.game_canvas.bind("<Configure>", lambda event: self.game_scene.invalidate())
         self.init_background_stars()
+        self.game_scene.build(self.star_positions)
 
     def init_background_stars(self):
         canvas_width = max(self.game_canvas.winfo_width(), 400)
         canvas_height = max(self.game_canvas.winfo_height(), 150)
-        self.star_positions = [(random.randint(0, canvas_width), random.randint(0, canvas_height)) for _ in range(20)]
-
-    def draw_background_stars(self, progress):
-        if not self.game_canvas.winfo_exists():
-            return
-        canvas_width = max(self.game_canvas.winfo_width(), 400)
-        canvas_height = max(self.game_canvas.winfo_height(), 150)
-        for x, y in self.star_positions:
-            size = 1.0 + 0.8 * math.sin(progress * 2 * math.pi + x)
-            self.game_canvas.create_oval(x - size, y - size, x + size, y + size, fill="#FFFFFF", outline="")
+        rng = self.session.visual
+        self.star_positions = [(rng.randint(0, canvas_width), rng.randint(0, canvas_height)) for _ in range(20)]
 
     def setup_round_info(self):
-        self.round_info_container_frame = ctk.CTkFrame(self.main_container_frame, fg_color="transparent")
+        self.round_info_container_frame = ctk.CTkFrame(self.game_screen_frame, fg_color="transparent")
         self.round_info_container_frame.pack(fill='x', pady=(0, 10))
 
         self.current_round_label = ctk.CTkLabel(self.round_info_container_frame,
-                                        text=f"Round {self.current_round} of {self.max_rounds}",
+                                        text=f"Round {self.match.current_round} of {self.match.max_rounds}",
                                         font=("Impact", 14, "bold"),
                                         text_color="#FF69B4")
         self.current_round_label.pack(side='left', padx=15)
 
     def setup_choice_buttons_panel(self):
-        print("Setting up choice buttons panel")
-        self.choice_buttons_container_frame = ctk.CTkFrame(self.main_container_frame, fg_color="transparent")
+        log.debug("Setting up choice buttons panel")
+        self.choice_buttons_container_frame = ctk.CTkFrame(self.game_screen_frame, fg_color="transparent")
         self.choice_buttons_container_frame.pack(fill='x', pady=(0, 10))
 
         colors = {
@@ -575,16 +705,16 @@ class RockPaperScissorsApp:
                 height=40
             )
             self.choice_buttons[choice].pack(side='left', expand=True, padx=10)
-        print("Choice buttons panel setup complete")
+        log.debug("Choice buttons panel setup complete")
 
     def setup_control_buttons_panel(self):
-        print("Setting up control buttons panel")
-        self.control_buttons_container_frame = ctk.CTkFrame(self.main_container_frame, fg_color="transparent")
+        log.debug("Setting up control buttons panel")
+        self.control_buttons_container_frame = ctk.CTkFrame(self.game_screen_frame, fg_color="transparent")
         self.control_buttons_container_frame.pack(fill='x', pady=(10, 15))
 
         self.reset_game_button = self.create_glowing_button(self.control_buttons_container_frame,
                                                 "Reset",
-                                                self.reset_game,
+                                                self.restart_game,
                                                 "#FFA500",
                                                 "#EF6C00",
                                                 width=100,
@@ -599,10 +729,10 @@ class RockPaperScissorsApp:
                                                width=100,
                                                height=40)
         self.exit_game_button.pack(side='right', expand=True, padx=30)
-        print("Control buttons panel setup complete")
+        log.debug("Control buttons panel setup complete")
 
     def setup_commentator(self):
-        self.commentator_text_label = ctk.CTkLabel(self.main_container_frame,
+        self.commentator_text_label = ctk.CTkLabel(self.game_screen_frame,
                                               text="",
                                               font=("jell", 12, "italic"),
                                               text_color="#FF69B4",
@@ -610,7 +740,7 @@ class RockPaperScissorsApp:
         self.commentator_text_label.pack(fill='x', padx=20, pady=(0, 10))
 
     def setup_footer(self):
-        self.footer_copyright_label = ctk.CTkLabel(self.main_container_frame,
+        self.footer_copyright_label = ctk.CTkLabel(self.game_screen_frame,
                                          text="© 2025 Ishan's Rock Paper Scissors Deluxe",
                                          font=("jell", 8),
                                          text_color=("gray70", "gray30"))
@@ -634,130 +764,275 @@ class RockPaperScissorsApp:
         if player_choice not in self.choices or self.is_animating:
             return
         self.is_animating = True
+        self.rounds_started += 1
+        self.round_span = self.rounds_started
+        self.tracer.begin("round", self.round_span)
+        self.text_reveal.cancel("commentary")
         self.disable_choice_buttons()
-        computer_choice = random.choice(self.choices)
-        self.game_canvas.delete("all")
-        self.game_canvas.create_rectangle(0, 0, self.game_canvas.winfo_width(), self.game_canvas.winfo_height(), fill="#000000",
-                                     stipple="gray25")
+        if isinstance(self.opponent, rps_remote.RemoteOpponent):
+            self.wait_for_remote_move(player_choice)
+            return
+        self.animate_round(player_choice, rps_engine.decode(self.opponent.next_move()))
+
+    def animate_round(self, player_choice, computer_choice):
+        self.game_scene.begin_round(player_choice, computer_choice)
         self.animation_frame = 0
-        self.animate_gestures(player_choice, computer_choice)
+        self.animation_clock.add(lambda step: self.animate_gestures(player_choice, computer_choice, step), 30)
+
+    def wait_for_remote_move(self, player_choice):
+        """Send the move to the match server and start the round once the opponent's move is back."""
+        remote = self.opponent
+        remote.send_move(rps_engine.encode(player_choice))
+        # Tie the poll to this session: a Reset or new match starts a new record and cancels the poll.
+        record = self.session_record
+
+        def poll(step):
+            if not self.is_running or self.opponent is not remote or self.session_record is not record:
+                return False
+            event = remote.poll()
+            if event is None:
+                return True
+            kind, value = event
+            if kind == "wait":
+                self.show_commentator("Waiting for an opponent to join...")
+                return True
+            self.remote_poll = None
+            if kind == "round":
+                self.animate_round(player_choice, rps_engine.decode(value))
+                return False
+            log.info("Online match ended: %s", value)
+            self.show_commentator(f"Online match ended ({value}). Playing the local CPU.")
+            # The record stays non-replayable: it now mixes server and local CPU rounds.
+            self.opponent = rps_opponent.make_opponent(self.difficulty, self.session.logic)
+            if self.round_span is not None:
+                self.tracer.end("round", self.round_span)
+                self.round_span = None
+            self.is_animating = False
+            self.enable_choice_buttons()
+            return False
+
+        self.remote_poll = self.animation_clock.add(poll, 50)
 
-    def animate_gestures(self, player_choice, computer_choice):
+    def animate_gestures(self, player_choice, computer_choice, step):
         if not self.is_running or not self.game_canvas.winfo_exists():
             self.is_animating = False
-            return
-        self.animation_frame += 1
-        progress = self.animation_frame / 40
-        if progress > 1:
+            return False
+        frame_count = self.keyframe_cache.frame_count
+        if self.animation_frame >= frame_count:
             self.display_result(player_choice, computer_choice)
-            return
-
-        self.game_canvas.delete("all")
-        self.game_canvas.create_rectangle(0, 0, self.game_canvas.winfo_width(), self.game_canvas.winfo_height(), fill="#000000",
-                                     stipple="gray25")
-        self.draw_background_stars(progress)
-        self.draw_gesture(self.game_canvas, player_choice, "player", progress)
-        self.draw_gesture(self.game_canvas, computer_choice, "computer", progress)
+            return False
 
-        after_id = self.root.after(30, lambda: self.animate_gestures(player_choice, computer_choice))
-        self.after_ids.append(after_id)
+        # Frames follow elapsed time; a late tick jumps ahead but the last frame is always shown.
+        self.animation_frame = min(step + 1, frame_count)
+        self.game_scene.render_frame(self.animation_frame)
+        return True
 
     def display_result(self, player_choice, computer_choice):
         try:
-            if player_choice == computer_choice:
-                result = "It's a Tie! ⚔️"
-                color = "#FFA500"
-                print(f"Tie: player_score={self.player_score}, computer_score={self.computer_score}")
-            elif (player_choice == "Rock" and computer_choice == "Scissors") or \
-                 (player_choice == "Paper" and computer_choice == "Rock") or \
-                 (player_choice == "Scissors" and computer_choice == "Paper"):
-                result = "You Win! 🏆"
-                self.player_score += 1
-                self.round_wins['player'] += 1
-                color = "#00FF00"
-                self.draw_confetti(self.game_canvas)
-                print(f"Player wins: player_score={self.player_score}, computer_score={self.computer_score}")
-            else:
-                result = "PC Wins! 😈"
-                self.computer_score += 1
-                self.round_wins['computer'] += 1
-                color = "#FF0000"
-                print(f"Computer wins: player_score={self.player_score}, computer_score={self.computer_score}")
+            player_code = rps_engine.encode(player_choice)
+            computer_code = rps_engine.encode(computer_choice)
+            outcome = self.match.record(rps_engine.resolve(player_code, computer_code))
+            self.session_record.add(player_code, computer_code)
+            # Learn from the round now so the next prediction is ready before the next click.
+            self.opponent.observe(player_code, computer_code)
+            if not self.replaying:
+                self.history.record(player_code, computer_code, outcome)
+                self.analytics.record(player_code, computer_code, outcome)
+            result, color, log_prefix = self.RESULT_STYLES[outcome]
+            if outcome == rps_engine.WIN:
+                self.game_scene.celebrate()
+            game_log.debug("%s: player_score=%s, computer_score=%s", log_prefix, self.match.player_score, self.match.computer_score)
 
             self.game_result_label.configure(text=f"You: {player_choice} \nComputer: {computer_choice}\n{result}", text_color=color)
             self.update_score_display()
             self.is_animating = False
             self.animate_result_label()
             self.show_commentator(f"You picked {player_choice}. Computer picked {computer_choice}. {result}")
+            if self.round_span is not None:
+                self.tracer.end("round", self.round_span)
+                self.round_span = None
             self.check_round_completion()
         except TclError as e:
-            print(f"TclError in display_result: {e}")
+            game_log.error("TclError in display_result: %s", e)
         except Exception as e:
-            print(f"Error in display_result: {e}")
+            game_log.error("Error in display_result: %s", e)
 
     def animate_result_label(self):
-        def scale_text(step=0):
+        def scale_text(step):
             if step > 3 or self.is_animating or not self.game_result_label.winfo_exists():
-                return
-            try:
-                scale = 1.0 + 0.05 * math.sin(step * math.pi / 1.5)
-                self.game_result_label.configure(font=("Impact", int(16 * scale), "bold"))
-                after_id = self.root.after(50, lambda: scale_text(step + 1))
-                self.after_ids.append(after_id)
-            except TclError:
-                pass
+                return False
+            scale = 1.0 + 0.05 * math.sin(step * math.pi / 1.5)
+            self.game_result_label.configure(font=self.label_fonts.get(("Impact", int(16 * scale), "bold")))
+            return True
 
-        scale_text()
+        self.animation_clock.add(scale_text, 50)
 
     def update_score_display(self):
         try:
             if hasattr(self, 'score_display_label') and self.score_display_label.winfo_exists():
-                self.score_display_label.configure(text=f"Score - You: {self.player_score} | CPU: {self.computer_score}")
-                print(f"Score updated: You={self.player_score}, CPU={self.computer_score}")
+                self.score_display_label.configure(text=f"Score - You: {self.match.player_score} | CPU: {self.match.computer_score}")
+                game_log.debug("Score updated: You=%s, CPU=%s", self.match.player_score, self.match.computer_score)
         except TclError as e:
-            print(f"TclError updating score display: {e}")
+            game_log.error("TclError updating score display: %s", e)
         except Exception as e:
-            print(f"Error updating score display: {e}")
+            game_log.error("Error updating score display: %s", e)
 
     def check_round_completion(self):
         try:
-            if self.current_round >= self.max_rounds:
+            if not self.match.advance():
                 self.end_game()
             else:
-                self.current_round += 1
-                self.player_score = 0
-                self.computer_score = 0
                 if hasattr(self, 'current_round_label') and self.current_round_label.winfo_exists():
-                    self.current_round_label.configure(text=f"Round {self.current_round} of {self.max_rounds}")
-                    print(f"Advanced to round {self.current_round}")
+                    self.current_round_label.configure(text=f"Round {self.match.current_round} of {self.match.max_rounds}")
+                    game_log.debug("Advanced to round %s", self.match.current_round)
                 self.update_score_display()
                 self.game_result_label.configure(text="Choose Your Move!", text_color="#00FFFF")
                 self.enable_choice_buttons()
         except TclError as e:
-            print(f"TclError in check_round_completion: {e}")
+            game_log.error("TclError in check_round_completion: %s", e)
         except Exception as e:
-            print(f"Error in check_round_completion: {e}")
+            game_log.error("Error in check_round_completion: %s", e)
 
     def end_game(self):
         try:
-            winner = "You" if self.round_wins['player'] > self.round_wins['computer'] else \
-                     "Computer" if self.round_wins['computer'] > self.round_wins['player'] else "It's a Tie"
+            winner = self.match.winner()
+            if self.replaying:
+                self.replaying = False
+                game_log.info("Replay finished: %s", winner)
+                self.show_game_over_popup(winner)
+                return
+            ranking_generation = self.ranking.generation
+            self.store.record_game(self.player_name, winner)
+            self.history.flush()
+            if self.session_record.replayable:
+                self.save_last_session()
             self.show_game_over_popup(winner)
+            self.show_player_rank(ranking_generation)
         except TclError as e:
-            print(f"TclError in end_game: {e}")
+            game_log.error("TclError in end_game: %s", e)
         except Exception as e:
-            print(f"Error in end_game: {e}")
+            game_log.error("Error in end_game: %s", e)
 
-    def show_game_over_popup(self, winner):
+    def save_last_session(self):
+        """Keep the seed and moves of the last match so it can be replayed with --replay."""
         try:
-            self.game_over_popup = ctk.CTkToplevel(self.root)
-            self.game_over_popup.geometry("500x450")
-            self.game_over_popup.title("Game Over")
-            self.game_over_popup.configure(fg_color="#1C2526")
-            self.game_over_popup.transient(self.root)
-            self.game_over_popup.grab_set()
+            self.session_record.save(self.LAST_SESSION_FILE)
+        except OSError as e:
+            log.error("Error saving session record: %s", e)
+
+    def replay_session(self, record, interval_ms=400):
+        """Play a recorded match back on screen, one recorded move whenever the board is idle."""
+        self.match.reset()
+        self.match.max_rounds = record.max_rounds
+        self.replaying = True
+        self.start_game(seed=record.seed, difficulty=record.opponent)
+        moves = iter(record.player_moves)
+        game_log.info("Replaying %s rounds from seed %s", len(record), record.seed)
+
+        def step(_):
+            if not self.is_running or not self.replaying:
+                return False
+            if self.is_animating:
+                return True
+            move = next(moves, None)
+            if move is None:
+                return False
+            self.play(rps_engine.decode(move))
+            return True
+
+        self.animation_clock.add(step, interval_ms, delay_ms=interval_ms)
+
+    def setup_game_over_popup(self):
+        log.debug("Setting up game over popup")
+        popup = ctk.CTkToplevel(self.root)
+        popup.geometry("500x540")
+        popup.title("Game Over")
+        popup.configure(fg_color="#1C2526")
+        popup.transient(self.root)
+        popup.protocol("WM_DELETE_WINDOW", self.close_popup)
+        self.game_over_popup = popup
+
+        self.game_over_title_label = ctk.CTkLabel(popup,
+                                                  text="",
+                                                  font=("Impact", 24, "bold"),
+                                                  text_color="#FFD700")
+        self.game_over_title_label.pack(pady=20)
+
+        self.game_over_animation_canvas = ctk.CTkCanvas(popup, width=350, height=150, bg="#1C2526",
+                                                        highlightthickness=0)
+        self.game_over_animation_canvas.pack(pady=10)
+        self.popup_confetti = rps_particles.ParticleSystem(self.game_over_animation_canvas, "text",
+                                                           rps_particles.POPUP_CONFETTI.count,
+                                                           clock=self.animation_clock, interval_ms=50,
+                                                           tags=("confetti",))
+
+        self.game_over_rank_label = ctk.CTkLabel(popup,
+                                                 text="",
+                                                 font=("jell", 14, "bold"),
+                                                 text_color="#00FFFF")
+        self.game_over_rank_label.pack()
+
+        self.game_over_stats_label = ctk.CTkLabel(popup,
+                                                  text="",
+                                                  font=("jell", 12),
+                                                  text_color="#B0BEC5",
+                                                  justify="center",
+                                                  wraplength=460)
+        self.game_over_stats_label.pack(pady=(5, 0))
+
+        self.game_over_buttons_frame = ctk.CTkFrame(popup, fg_color="transparent")
+        self.play_again_button = self.create_glowing_button(self.game_over_buttons_frame,
+                                                            "Play Again",
+                                                            self.prompt_rounds_in_popup,
+                                                            "#00CED1",
+                                                            "#0097A7",
+                                                            width=100,
+                                                            height=40)
+        self.play_again_button.pack(pady=10)
+
+        self.back_button = self.create_glowing_button(self.game_over_buttons_frame,
+                                                      "Back",
+                                                      self.return_to_game,
+                                                      "#FF0000",
+                                                      "#B71C1C",
+                                                      width=100,
+                                                      height=40)
+        self.back_button.pack(pady=10)
+
+        self.popup_rounds_frame = ctk.CTkFrame(popup, fg_color="transparent")
+        label = ctk.CTkLabel(self.popup_rounds_frame, text="Enter Number of Rounds (1-100):",
+                             font=("jell", 14, "bold"), text_color="#FFD700")
+        label.pack(pady=10)
+
+        self.popup_rounds_entry = ctk.CTkEntry(self.popup_rounds_frame, placeholder_text="e.g., 5",
+                                               font=("jell", 12), width=150, height=30)
+        self.popup_rounds_entry.pack(pady=10)
+        self.popup_rounds_entry.bind("<Return>", lambda event: self.submit_rounds_in_popup())
+
+        submit_button = self.create_glowing_button(self.popup_rounds_frame, "Submit",
+                                                  self.submit_rounds_in_popup, "#00CED1", "#0097A7",
+                                                  width=100, height=30)
+        submit_button.pack(pady=10)
+
+        popup.withdraw()
+        log.debug("Game over popup setup complete")
+        return popup
+
+    def hide_game_over_popup(self):
+        for handle in self.popup_animation_handles:
+            self.animation_clock.cancel(handle)
+        self.popup_animation_handles.clear()
+        if hasattr(self, 'popup_confetti'):
+            self.popup_confetti.clear()
+        self.text_reveal.cancel("popup_title")
+        if hasattr(self, 'game_over_popup') and self.game_over_popup.winfo_exists():
+            self.game_over_popup.grab_release()
+            self.game_over_popup.withdraw()
 
-            self.game_over_popup.protocol("WM_DELETE_WINDOW", self.close_popup)
+    def show_game_over_popup(self, winner):
+        try:
+            if not hasattr(self, 'game_over_popup') or not self.game_over_popup.winfo_exists():
+                self.game_over_popup = self.setup_game_over_popup()
 
             if winner == "You":
                 title_text = f"You Won, {self.player_name}! 🏆"
@@ -769,275 +1044,268 @@ class RockPaperScissorsApp:
                 title_text = f"It's a Tie, {self.player_name}! ⚖️"
                 title_color = "#FFA500"
 
-            self.game_over_title_label = ctk.CTkLabel(self.game_over_popup,
-                                       text=title_text,
-                                       font=("Impact", 24, "bold"),
-                                       text_color=title_color)
-            self.game_over_title_label.pack(pady=20)
-
-            self.game_over_animation_canvas = ctk.CTkCanvas(self.game_over_popup, width=350, height=150, bg="#1C2526",
-                                             highlightthickness=0)
-            self.game_over_animation_canvas.pack(pady=10)
+            # The loss animation moves the title with place(); put it back under pack.
+            self.game_over_title_label.place_forget()
+            self.game_over_title_label.pack(pady=20, before=self.game_over_animation_canvas)
+            self.game_over_title_label.configure(text_color=title_color)
+            self.text_reveal.reveal("popup_title", self.game_over_title_label, title_text, chars_per_second=30)
+            # Kept up to date round by round, so this is a read of a few counters.
+            self.game_over_stats_label.configure(text=self.analytics.summary(self.player_name))
+
+            self.game_over_animation_canvas.delete("all")
+            self.popup_confetti.invalidate()
+            self.game_over_animation_canvas.configure(bg="#1C2526")
+            self.popup_rounds_frame.pack_forget()
+            self.game_over_buttons_frame.pack(pady=10)
+            self.game_over_popup.deiconify()
+            self.game_over_popup.grab_set()
 
             if winner == "You":
-                confetti_positions = [(random.randint(0, 350), random.randint(0, 150)) for _ in range(20)]
-                confetti_emojis = ['🎉', '✨', '🌟', '🎊']
-                confetti_items = []
-                for x, y in confetti_positions:
-                    emoji = random.choice(confetti_emojis)
-                    item = self.game_over_animation_canvas.create_text(x, y, text=emoji, font=("Arial", 20),
-                                                        fill="white")
-                    confetti_items.append((item, y, random.uniform(0.5, 1.0)))
-
-                self.winner_trophy_icon = self.game_over_animation_canvas.create_text(175, 75, text="🏆", font=("Arial", 40),
+                self.popup_confetti.rng = self.session.visual
+                self.popup_confetti.emit(rps_particles.POPUP_CONFETTI, 0, 0, 350, 150)
+
+                self.winner_trophy_icon = self.game_over_animation_canvas.create_text(175, 75, text="🏆", font=self.fonts.get(("Arial", 40)),
                                                       fill="#FFD700")
 
-                def animate_confetti_and_trophy(step=0):
+                def animate_confetti_and_trophy(step):
                     if step > 30 or not self.game_over_animation_canvas.winfo_exists():
-                        return
-                    try:
-                        for item, start_y, speed in confetti_items:
-                            self.game_over_animation_canvas.move(item, 0, speed)
-                        scale = 1.0 + 0.1 * math.sin(step * 0.2 * math.pi)
-                        self.game_over_animation_canvas.delete(self.winner_trophy_icon)
-                        self.winner_trophy_icon = self.game_over_animation_canvas.create_text(175, 75, text="🏆", font=("Arial", int(40 * scale)), fill="#FFD700")
-                        glow = int(255 * (0.5 + 0.5 * math.sin(step * 0.1 * math.pi)))
-                        self.game_over_title_label.configure(text_color=f"#{glow:02x}{glow:02x}00")
-                        after_id = self.game_over_popup.after(50, lambda: animate_confetti_and_trophy(step + 1))
-                        self.after_ids.append(after_id)
-                    except TclError:
-                        pass
-
-                animate_confetti_and_trophy()
+                        return False
+                    scale = 1.0 + 0.1 * math.sin(step * 0.2 * math.pi)
+                    self.game_over_animation_canvas.delete(self.winner_trophy_icon)
+                    self.winner_trophy_icon = self.game_over_animation_canvas.create_text(175, 75, text="🏆", font=self.fonts.get(("Arial", int(40 * scale))), fill="#FFD700")
+                    glow = int(255 * (0.5 + 0.5 * math.sin(step * 0.1 * math.pi)))
+                    self.game_over_title_label.configure(text_color=f"#{glow:02x}{glow:02x}00")
+                    return True
+
+                self.popup_animation_handles.append(self.animation_clock.add(animate_confetti_and_trophy, 50))
 
             elif winner == "Computer":
-                self.loser_sad_emoji_icon = self.game_over_animation_canvas.create_text(175, 75, text="😢", font=("Arial", 40),
+                self.loser_sad_emoji_icon = self.game_over_animation_canvas.create_text(175, 75, text="😢", font=self.fonts.get(("Arial", 40)),
                                                          fill="#FF4500")
-                bg_opacity = 0
-
-                def animate_loss(steps=0):
-                    nonlocal bg_opacity
+                def animate_loss(steps):
                     if steps > 50 or not self.game_over_animation_canvas.winfo_exists():
-                        return
-                    try:
-                        bounce = 3 * math.sin(steps * 0.3 * math.pi)
-                        self.game_over_animation_canvas.delete(self.loser_sad_emoji_icon)
-                        self.loser_sad_emoji_icon = self.game_over_animation_canvas.create_text(175, 75 + bounce, text="😢", font=("Arial", 40), fill="#FF4500")
-                        bg_opacity = min(255, bg_opacity + 5)
-                        bg_color = f"#{int(bg_opacity):02x}{int(bg_opacity):02x}{int(bg_opacity):02x}"
-                        self.game_over_animation_canvas.configure(bg=bg_color)
-                        offset = 1 * math.sin(steps * 0.5 * math.pi)
-                        self.game_over_title_label.configure(text_color="#FF4500")
-                        self.game_over_title_label.place_configure(relx=0.5, rely=0.1, anchor="center", x=offset)
-                        after_id = self.game_over_popup.after(50, lambda: animate_loss(steps + 1))
-                        self.after_ids.append(after_id)
-                    except TclError:
-                        pass
-
-                animate_loss()
+                        return False
+                    bounce = 3 * math.sin(steps * 0.3 * math.pi)
+                    self.game_over_animation_canvas.delete(self.loser_sad_emoji_icon)
+                    self.loser_sad_emoji_icon = self.game_over_animation_canvas.create_text(175, 75 + bounce, text="😢", font=self.fonts.get(("Arial", 40)), fill="#FF4500")
+                    bg_opacity = min(255, 5 * (steps + 1))
+                    bg_color = f"#{int(bg_opacity):02x}{int(bg_opacity):02x}{int(bg_opacity):02x}"
+                    self.game_over_animation_canvas.configure(bg=bg_color)
+                    offset = 1 * math.sin(steps * 0.5 * math.pi)
+                    self.game_over_title_label.configure(text_color="#FF4500")
+                    self.game_over_title_label.place_configure(relx=0.5, rely=0.1, anchor="center", x=offset)
+                    return True
+
+                self.popup_animation_handles.append(self.animation_clock.add(animate_loss, 50))
 
             else:
-                self.tie_balance_icon = self.game_over_animation_canvas.create_text(175, 75, text="⚖️", font=("Arial", 40),
+                self.tie_balance_icon = self.game_over_animation_canvas.create_text(175, 75, text="⚖️", font=self.fonts.get(("Arial", 40)),
                                                         fill="#FFA500")
 
-                def animate_tie(step=0):
+                def animate_tie(step):
                     if step > 20 or not self.game_over_animation_canvas.winfo_exists():
-                        return
-                    try:
-                        scale = 1.0 + 0.05 * math.sin(step * 0.2 * math.pi)
-                        self.game_over_animation_canvas.delete(self.tie_balance_icon)
-                        self.tie_balance_icon = self.game_over_animation_canvas.create_text(175, 75, text="⚖️", font=("Arial", int(40 * scale)), fill="#FFA500")
-                        after_id = self.game_over_popup.after(50, lambda: animate_tie(step + 1))
-                        self.after_ids.append(after_id)
-                    except TclError:
-                        pass
-
-                animate_tie()
-
-            self.play_again_button = self.create_glowing_button(self.game_over_popup,
-                                               "Play Again",
-                                               self.prompt_rounds_in_popup,
-                                               "#00CED1",
-                                               "#0097A7",
-                                               width=100,
-                                               height=40)
-            self.play_again_button.pack(pady=10)
+                        return False
+                    scale = 1.0 + 0.05 * math.sin(step * 0.2 * math.pi)
+                    self.game_over_animation_canvas.delete(self.tie_balance_icon)
+                    self.tie_balance_icon = self.game_over_animation_canvas.create_text(175, 75, text="⚖️", font=self.fonts.get(("Arial", int(40 * scale))), fill="#FFA500")
+                    return True
+
+                self.popup_animation_handles.append(self.animation_clock.add(animate_tie, 50))
 
-            self.back_button = self.create_glowing_button(self.game_over_popup,
-                                         "Back",
-                                         self.return_to_game,
-                                         "#FF0000",
-                                         "#B71C1C",
-                                         width=100,
-                                         height=40)
-            self.back_button.pack(pady=10)
         except TclError as e:
-            print(f"TclError in show_game_over_popup: {e}")
+            log.error("TclError in show_game_over_popup: %s", e)
         except Exception as e:
-            print(f"Error in show_game_over_popup: {e}")
+            log.error("Error in show_game_over_popup: %s", e)
+
+    def show_player_rank(self, since_generation, timeout_steps=20):
+        """Show the player's leaderboard rank once the store has ranked this game's result."""
+        self.game_over_rank_label.configure(text="")
+
+        def wait_for_rank(step):
+            if not self.game_over_rank_label.winfo_exists():
+                return False
+            if self.ranking.generation == since_generation and step < timeout_steps:
+                return True
+            rank = self.ranking.rank(self.player_name)
+            if rank is not None:
+                self.game_over_rank_label.configure(
+                    text=f"🏅 Leaderboard rank #{rank} of {len(self.ranking)} by wins")
+            return False
+
+        self.popup_animation_handles.append(self.animation_clock.add(wait_for_rank, 100))
 
     def close_popup(self):
         try:
-            print("close_popup called")
-            self.clear_main_ui()
+            log.debug("close_popup called")
             self.reset_game()
-            self.is_running = True
-            self.main_container_frame.configure(fg_color="#1C2526")
-            self.setup_top_panel()
-            self.setup_game_canvas()
-            self.setup_round_info()
-            self.setup_choice_buttons_panel()
-            self.setup_control_buttons_panel()
-            self.setup_commentator()
-            self.setup_footer()
-            self.init_result_label()
-            self.enable_choice_buttons()
-            self.update_score_display()
-            self.root.update()
-            print("Game UI restored after popup close")
+            self.start_game()
+            log.debug("Game UI restored after popup close")
         except TclError as e:
-            print(f"TclError in close_popup: {e}")
+            log.error("TclError in close_popup: %s", e)
         except Exception as e:
-            print(f"Error in close_popup: {e}")
+            log.error("Error in close_popup: %s", e)
 
     def return_to_game(self):
         try:
-            print("return_to_game called")
-            self.clear_main_ui()
+            log.debug("return_to_game called")
             self.reset_game()
-            self.is_running = True
-            self.main_container_frame.configure(fg_color="#1C2526")
-            self.setup_top_panel()
-            self.setup_game_canvas()
-            self.setup_round_info()
-            self.setup_choice_buttons_panel()
-            self.setup_control_buttons_panel()
-            self.setup_commentator()
-            self.setup_footer()
-            self.init_result_label()
-            self.enable_choice_buttons()
-            self.update_score_display()
-            self.root.update()
-            print("Game UI restored")
+            self.start_game()
+            log.debug("Game UI restored")
         except TclError as e:
-            print(f"TclError in return_to_game: {e}")
+            log.error("TclError in return_to_game: %s", e)
         except Exception as e:
-            print(f"Error in return_to_game: {e}")
+            log.error("Error in return_to_game: %s", e)
 
     def prompt_rounds_in_popup(self):
-        print("prompt_rounds_in_popup called")
+        log.debug("prompt_rounds_in_popup called")
         try:
-            self.play_again_button.destroy()
-            self.back_button.destroy()
-
-            label = ctk.CTkLabel(self.game_over_popup, text="Enter Number of Rounds (1-100):",
-                                 font=("jell", 14, "bold"), text_color="#FFD700")
-            label.pack(pady=10)
-
-            self.rounds_entry = ctk.CTkEntry(self.game_over_popup, placeholder_text="e.g., 5",
-                                             font=("jell", 12), width=150, height=30)
-            self.rounds_entry.pack(pady=10)
-            self.rounds_entry.bind("<Return>", lambda event: self.submit_rounds_in_popup())
-            self.rounds_entry.focus_set()
-
-            submit_button = self.create_glowing_button(self.game_over_popup, "Submit",
-                                                      self.submit_rounds_in_popup, "#00CED1", "#0097A7",
-                                                      width=100, height=30)
-            submit_button.pack(pady=10)
-            self.game_over_popup.update()
-            print("Round input popup updated")
+            self.game_over_buttons_frame.pack_forget()
+            self.popup_rounds_frame.pack(pady=10)
+            self.popup_rounds_entry.delete(0, 'end')
+            self.popup_rounds_entry.focus_set()
+            log.debug("Round input popup shown")
         except TclError as e:
-            print(f"TclError in prompt_rounds_in_popup: {e}")
+            log.error("TclError in prompt_rounds_in_popup: %s", e)
         except Exception as e:
-            print(f"Error in prompt_rounds_in_popup: {e}")
+            log.error("Error in prompt_rounds_in_popup: %s", e)
 
     def submit_rounds_in_popup(self):
-        print("submit_rounds_in_popup called")
+        log.debug("submit_rounds_in_popup called")
         try:
-            rounds = int(self.rounds_entry.get().strip())
+            rounds = int(self.popup_rounds_entry.get().strip())
             if rounds < 1 or rounds > 100:
                 messagebox.showwarning("Input Error", "Please enter a number between 1 and 100!")
                 return
-            self.max_rounds = rounds
-            self.clear_main_ui()
+            self.match.max_rounds = rounds
             self.reset_game()
             self.start_game()
         except ValueError:
             messagebox.showwarning("Input Error", "Please enter a valid number!")
         except TclError as e:
-            print(f"TclError in submit_rounds_in_popup: {e}")
+            log.error("TclError in submit_rounds_in_popup: %s", e)
         except Exception as e:
-            print(f"Error in submit_rounds_in_popup: {e}")
+            log.error("Error in submit_rounds_in_popup: %s", e)
 
     def reset_game(self):
         try:
-            print("reset_game called")
-            self.player_score = 0
-            self.computer_score = 0
-            self.current_round = 1
-            self.round_wins = {'player': 0, 'computer': 0}
+            game_log.debug("reset_game called")
+            self.match.reset()
+            self.replaying = False
             if hasattr(self, 'game_result_label') and self.game_result_label.winfo_exists():
                 self.game_result_label.configure(text="Game Reset! Choose Again! 💪", text_color="#00FFFF")
             if hasattr(self, 'current_round_label') and self.current_round_label.winfo_exists():
-                self.current_round_label.configure(text=f"Round {self.current_round} of {self.max_rounds}", text_color="#FF69B4")
-                print(f"Reset to Round {self.current_round} of {self.max_rounds}")
+                self.current_round_label.configure(text=f"Round {self.match.current_round} of {self.match.max_rounds}", text_color="#FF69B4")
+                game_log.debug("Reset to Round %s of %s", self.match.current_round, self.match.max_rounds)
             if hasattr(self, 'game_canvas') and self.game_canvas.winfo_exists():
-                self.game_canvas.delete("all")
-                self.game_canvas.create_rectangle(0, 0, self.game_canvas.winfo_width(), self.game_canvas.winfo_height(), fill="#000000",
-                                             stipple="gray25")
                 self.init_background_stars()
+                self.game_scene.build(self.star_positions)
             self.update_score_display()
             self.enable_choice_buttons()
         except TclError as e:
-            print(f"TclError in reset_game: {e}")
+            game_log.error("TclError in reset_game: %s", e)
         except Exception as e:
-            print(f"Error in reset_game: {e}")
+            game_log.error("Error in reset_game: %s", e)
+
+    def restart_game(self):
+        """Reset button: a new match with the same settings; start_game begins its session."""
+        self.reset_game()
+        self.start_game()
+        if hasattr(self, 'game_result_label') and self.game_result_label.winfo_exists():
+            self.game_result_label.configure(text="Game Reset! Choose Again! 💪", text_color="#00FFFF")
 
     def show_commentator(self, text):
         if self.is_animating:
             return
-        self.commentator_text = text
-        self.commentator_index = 0
         if hasattr(self, 'commentator_text_label') and self.commentator_text_label.winfo_exists():
-            self.commentator_text_label.configure(text="")
-            self._typewriter_step()
+            self.text_reveal.reveal("commentary", self.commentator_text_label, text, chars_per_second=20)
 
-    def _typewriter_step(self):
-        if self.is_animating or self.commentator_index >= len(self.commentator_text):
+    def set_low_power(self, enabled):
+        fps = rps_anim.FrameClock.LOW_POWER_FPS if enabled else rps_anim.FrameClock.DEFAULT_MAX_FPS
+        self.animation_clock.set_max_fps(fps)
+        log.info("Animation frame cap: %s FPS", fps)
+
+    def finish_trace(self):
+        if self.tracer.frames.total:
+            log.info("Frame times: %s", self.tracer.frames.summary())
+        if not self.trace_path:
             return
+        for name, (count, total_ms, max_ms) in sorted(self.tracer.span_stats().items()):
+            log.info("Span %s: %s calls, %.2f ms mean, %.2f ms max", name, count, total_ms / count, max_ms)
         try:
-            current_text = self.commentator_text_label.cget("text")
-            next_char = self.commentator_text[self.commentator_index]
-            self.commentator_text_label.configure(text=current_text + next_char)
-            self.commentator_index += 1
-            after_id = self.root.after(50, self._typewriter_step)
-            self.after_ids.append(after_id)
-        except TclError:
-            pass
+            count = self.tracer.export_chrome(self.trace_path)
+            log.info("Wrote %s trace events to %s", count, self.trace_path)
+        except OSError as e:
+            log.error("Error writing trace '%s': %s", self.trace_path, e)
 
     def exit_game(self):
         try:
-            print("exit_game called")
+            log.debug("exit_game called")
             confirm = messagebox.askyesno("Exit Game", "Sure you want to quit? 😢")
             if confirm:
-                self.cancel_animations()
-                self.is_running = False
-                self.stop_background_music()
-                self.clear_main_ui()
-                try:
-                    self.root.destroy()
-                    print("Application closed")
-                except TclError as e:
-                    print(f"TclError during root.destroy: {e}")
+                self.shutdown()
         except TclError as e:
-            print(f"TclError in exit_game: {e}")
+            log.error("TclError in exit_game: %s", e)
+        except Exception as e:
+            log.error("Error in exit_game: %s", e)
+
+    def shutdown(self):
+        """Stop the services, write the trace and close the window; also the title-bar close button."""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.cancel_animations()
+            self.is_running = False
+            self.stop_background_music()
+            self.audio.shutdown()
+            self.store.close()
+            self.history.flush()
+            if self.remote is not None:
+                self.remote.close()
+            self.finish_trace()
+            log.info("Font cache: canvas %s, labels %s", self.fonts.stats, self.label_fonts.stats)
+            self.clear_main_ui()
         except Exception as e:
-            print(f"Error in exit_game: {e}")
+            log.error("Error in shutdown: %s", e)
+        try:
+            self.root.destroy()
+            log.info("Application closed")
+        except TclError as e:
+            log.error("TclError during root.destroy: %s", e)
 
 if __name__ == "__main__":
     try:
+        parser = argparse.ArgumentParser(description="Rock Paper Scissors Deluxe")
+        parser.add_argument("--replay", metavar="SESSION_JSON", help="play back a saved session record")
+        parser.add_argument("--max-fps", type=int, default=rps_anim.FrameClock.DEFAULT_MAX_FPS,
+                            help="cap on animation frames per second (0: uncapped)")
+        parser.add_argument("--low-power", action="store_true",
+                            help=f"cap animations at {rps_anim.FrameClock.LOW_POWER_FPS} FPS")
+        parser.add_argument("--server", metavar="HOST:PORT",
+                            help="play on an rps_server match server instead of the local CPU")
+        parser.add_argument("--pvp", action="store_true", help="with --server, play another person, not a bot")
+        parser.add_argument("--log-level", default="info", metavar="LEVELS",
+                            help="debug, info, warning or error, optionally per subsystem, e.g. info,game=debug")
+        parser.add_argument("--trace", metavar="TRACE_JSON",
+                            help="time the hot paths and write a Chrome trace (chrome://tracing, Perfetto) on exit")
+        parser.add_argument("--fps-overlay", action="store_true",
+                            help="show FPS and p95 frame time on the game canvas")
+        args = parser.parse_args()
+        if args.max_fps < 0:
+            parser.error("--max-fps must be 0 (uncapped) or more")
+        try:
+            rps_log.configure(args.log_level)
+        except ValueError as e:
+            parser.error(str(e))
         app = ctk.CTk()
-        game = RockPaperScissorsApp(app)
+        game = RockPaperScissorsApp(app, max_fps=args.max_fps, server=args.server, pvp=args.pvp,
+                                    trace=args.trace, fps_overlay=args.fps_overlay)
+        if args.low_power:
+            game.set_low_power(True)
+        if args.replay:
+            game.replay_session(rps_replay.SessionRecord.load(args.replay))
         app.mainloop()
+        game.shutdown()  # no-op unless the loop ended without exit_game or the close button
     except Exception as e:
-        print(f"Error starting application: {e}")
\ No newline at end of file
+        log.error("Error starting application: %s", e)
+    rps_log.shutdown()
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""Cost of the per-player analytics: live updates, rebuilds and the popup read.
+
+Writes a history of many short sessions for a handful of players, then
+times Analytics.record() per round, a full rebuild() with NumPy and with the
+scalar fallback (checking both agree with the live aggregates), summary()
+as the game-over popup calls it, and a CSV export. Finally it fuzzes both
+rebuild paths against each other on small files cut at random points, so
+records can come before the first session start (a truncated file) and
+streaks can cross chunk borders.
+Run from the repository root: python benchmarks/bench_analytics.py [rounds]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rps_analytics
+import rps_engine
+import rps_history
+
+PLAYERS = ("ana", "bo", "cyd", "dee", "")
+
+
+def write_history(path, rounds, seed=21):
+    """Record `rounds` rounds into `path`, feeding a live Analytics alongside; returns it."""
+    rng = random.Random(seed)
+    history = rps_history.MatchHistory(path, flush_every=4096)
+    live = rps_analytics.Analytics()
+    elapsed = 0.0
+    remaining = rounds
+    while remaining:
+        name = rng.choice(PLAYERS)
+        history.begin_session(name)
+        live.begin_session(name)
+        for _ in range(min(remaining, rng.randint(3, 12))):
+            player, computer = rng.randrange(3), rng.randrange(3)
+            outcome = rps_engine.resolve(player, computer)
+            history.record(player, computer, outcome)
+            start = time.perf_counter()
+            live.record(player, computer, outcome)
+            elapsed += time.perf_counter() - start
+            remaining -= 1
+    history.flush()
+    return live, elapsed
+
+
+def snapshot(analytics):
+    return {name: (stats.sessions, stats.moves, stats.outcomes, stats.wins_vs, stats.openers,
+                   stats.streak_histogram(), stats.best_streak)
+            for name, stats in analytics.players.items()}
+
+
+def fuzz_rebuild_paths(cases=300, seed=7):
+    """Count the cases where the NumPy and scalar rebuilds disagree."""
+    numpy_module = rps_analytics.np
+    if numpy_module is None:
+        return None
+    rng = random.Random(seed)
+    mismatches = 0
+    with tempfile.TemporaryDirectory() as directory:
+        full = os.path.join(directory, "full.bin")
+        cut = os.path.join(directory, "cut.bin")
+        for case in range(cases):
+            for path in (full, full + rps_history.ROSTER_SUFFIX):
+                if os.path.exists(path):
+                    os.remove(path)
+            write_history(full, rng.randint(1, 60), seed=case)
+            with open(full, "rb") as f:
+                data = f.read()
+            header, body = data[:rps_history.HEADER.size], data[rps_history.HEADER.size:]
+            drop = rng.randrange(len(body) // rps_history.RECORD_SIZE) * rps_history.RECORD_SIZE
+            with open(cut, "wb") as f:
+                f.write(header + body[drop:])
+            chunk = rng.choice((1, 2, 3, 7, 4096))
+            results = []
+            for module in (numpy_module, None):
+                rps_analytics.np = module
+                results.append(snapshot(rps_analytics.rebuild(cut, chunk_records=chunk)))
+            rps_analytics.np = numpy_module
+            mismatches += results[0] != results[1]
+    return mismatches
+
+
+def check_truncated_header():
+    """BackgroundRebuild, as load_analytics starts it, must reject a file cut inside its header with ValueError."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "history.bin")
+        with open(path, "wb") as f:
+            f.write(rps_history.MAGIC[:3])
+        try:
+            rps_analytics.BackgroundRebuild(path)
+        except ValueError:
+            return
+    raise SystemExit("BackgroundRebuild accepted a truncated history header")
+
+
+def main(rounds):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "history.bin")
+        live, elapsed = write_history(path, rounds)
+        print(f"record(): {elapsed / rounds * 1e6:.2f} us/round over {rounds:,} rounds")
+
+        numpy_module = rps_analytics.np
+        for label in ("numpy", "scalar"):
+            if label == "numpy" and numpy_module is None:
+                print("numpy not installed: skipping the vectorized rebuild")
+                continue
+            rps_analytics.np = numpy_module if label == "numpy" else None
+            start = time.perf_counter()
+            rebuilt = rps_analytics.rebuild(path)
+            seconds = time.perf_counter() - start
+            status = "matches live" if snapshot(rebuilt) == snapshot(live) else "MISMATCH"
+            print(f"rebuild ({label:<6}): {seconds * 1e3:8.1f} ms, {rounds / seconds:,.0f} rounds/sec, {status}")
+        rps_analytics.np = numpy_module
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            live.summary("ana")
+        print(f"summary(): {(time.perf_counter() - start) * 1e3:.1f} us per popup")
+
+        start = time.perf_counter()
+        live.export_csv(os.path.join(directory, "players.csv"))
+        print(f"export_csv(): {(time.perf_counter() - start) * 1e3:.2f} ms for {len(live.players)} players")
+
+    check_truncated_header()
+    mismatches = fuzz_rebuild_paths()
+    if mismatches is not None:
+        print(f"rebuild fuzz (truncated files, small chunks): {mismatches} mismatches in 300 cases")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
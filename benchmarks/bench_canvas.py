@@ -0,0 +1,136 @@
+"""Frame time of the 40-frame gesture animation across the drawing paths.
+
+Compares delete("all") redraws, the retained scene computing every frame,
+the retained scene reading precomputed keyframe tables, and the scene
+drawing each side from the pre-rasterized sprite atlas.
+
+Uses a real Tk canvas when $DISPLAY is set and a RecordingCanvas otherwise.
+Run from the repository root: python benchmarks/bench_canvas.py
+"""
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+
+import rps_scene
+import rps_sprites
+from fake_canvas import RecordingCanvas, flush, live_items, make_canvas
+
+FRAMES = 40
+ROUNDS = 50
+
+
+def make_stars(rng):
+    return [(rng.randint(0, 400), rng.randint(0, 150)) for _ in range(20)]
+
+
+def draw_particles(canvas, player_type, progress, rng):
+    x_offset, y_offset = rps_scene.side_anchor(player_type, canvas.winfo_width(), canvas.winfo_height())
+    for _ in range(rps_scene.PARTICLES_PER_SIDE):
+        angle = rng.uniform(0, 2 * math.pi)
+        distance = rng.uniform(10, 30) * progress
+        size = rng.uniform(1, 4)
+        x = x_offset + distance * math.cos(angle)
+        y = y_offset + distance * math.sin(angle)
+        alpha = max(0, 1 - progress)
+        color = f"#{(int(255 * alpha)):02x}{(int(255 * alpha)):02x}ff"
+        canvas.create_oval(x - size, y - size, x + size, y + size, fill=color, outline="")
+
+
+def old_frame(canvas, stars, player, computer, progress, rng):
+    width, height = canvas.winfo_width(), canvas.winfo_height()
+    canvas.delete("all")
+    canvas.create_rectangle(0, 0, width, height, fill="#000000", stipple="gray25")
+    for x, y in stars:
+        size = 1.0 + 0.8 * math.sin(progress * 2 * math.pi + x)
+        canvas.create_oval(x - size, y - size, x + size, y + size, fill="#FFFFFF", outline="")
+    for side, gesture in (("player", player), ("computer", computer)):
+        draw_particles(canvas, side, progress, rng)
+        rps_scene.draw_gesture_immediate(canvas, gesture, side, progress, width, height)
+
+
+def run_old(canvas, root, rounds):
+    rng = random.Random(7)
+    stars = make_stars(rng)
+    times = []
+    for _ in range(rounds):
+        player = rng.choice(list(rps_scene.ITEM_LAYOUT))
+        computer = rng.choice(list(rps_scene.ITEM_LAYOUT))
+        for frame in range(1, FRAMES + 1):
+            start = time.perf_counter()
+            old_frame(canvas, stars, player, computer, frame / FRAMES, rng)
+            flush(canvas, root)
+            times.append(time.perf_counter() - start)
+    return times
+
+
+def run_scene(canvas, root, rounds, keyframes=False, atlas=None):
+    rng = random.Random(7)
+    scene = rps_scene.GestureScene(canvas, rng=rng, atlas=atlas)
+    scene.build(make_stars(rng))
+    times = []
+    for _ in range(rounds):
+        player = rng.choice(list(rps_scene.ITEM_LAYOUT))
+        computer = rng.choice(list(rps_scene.ITEM_LAYOUT))
+        scene.begin_round(player, computer)
+        for frame in range(1, FRAMES + 1):
+            start = time.perf_counter()
+            if keyframes:
+                scene.render_frame(frame)
+            else:
+                scene.render(frame / FRAMES)
+            flush(canvas, root)
+            times.append(time.perf_counter() - start)
+    return times
+
+
+def report(label, times, canvas):
+    ordered = sorted(times)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    ops = getattr(canvas, "ops", None)
+    creates = ""
+    if ops is not None:
+        frame_ops = sum(ops.values()) / len(times)
+        creates = f"  creates={ops['create']}  canvas ops/frame={frame_ops:.1f}"
+    print(f"{label:<22} mean={statistics.mean(times) * 1e3:.3f} ms  p95={p95 * 1e3:.3f} ms  "
+          f"live items={live_items(canvas)}{creates}")
+
+
+if __name__ == "__main__":
+    canvas, root = make_canvas()
+    report("delete('all') path", run_old(canvas, root, ROUNDS), canvas)
+    if root is not None:
+        root.destroy()
+    canvas, root = make_canvas()
+    report("retained scene", run_scene(canvas, root, ROUNDS), canvas)
+    if root is not None:
+        root.destroy()
+    canvas, root = make_canvas()
+    report("scene + keyframes", run_scene(canvas, root, ROUNDS, keyframes=True), canvas)
+    if root is not None:
+        root.destroy()
+
+    canvas, root = make_canvas()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Without Tk there are no PhotoImages; stand-in names still exercise the scene's sprite path.
+        loader = rps_sprites.tk_frames if not isinstance(canvas, RecordingCanvas) else (
+            lambda path, frame_count, cell: [f"{path}#{i}" for i in range(frame_count + 1)])
+        atlas = rps_sprites.SpriteAtlas(cache_dir, frame_count=FRAMES, image_loader=loader)
+        start = time.perf_counter()
+        atlas.build_missing()
+        built = time.perf_counter() - start
+        start = time.perf_counter()
+        for gesture in rps_scene.ITEM_LAYOUT:
+            atlas.frames(gesture)
+        loaded = time.perf_counter() - start
+        print(f"sprite atlas: rasterized + written in {built * 1e3:.0f} ms (once per theme), "
+              f"loaded in {loaded * 1e3:.1f} ms")
+        report("scene + sprite atlas", run_scene(canvas, root, ROUNDS, keyframes=True, atlas=atlas), canvas)
+    if root is not None:
+        root.destroy()
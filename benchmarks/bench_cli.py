@@ -0,0 +1,84 @@
+"""Startup time, throughput and memory of the headless rps_cli pipeline.
+
+Times `python rps_cli.py` on empty input against bare `python -c pass`
+and checks that it imports neither customtkinter, pygame nor NumPy. It then
+pushes line and packed move streams through the generator pipeline in
+process, reporting rounds/sec and the tracemalloc peak, which depends on the
+chunk size and should stay the same as the stream grows. tracemalloc slows the
+pipeline several times over; the CLI's own stderr summary gives the true rate.
+Run from the repository root: python benchmarks/bench_cli.py [rounds]
+"""
+import io
+import os
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import rps_cli
+
+CHUNK_SIZE = 4096  # small enough that both stream lengths span many chunks
+
+
+def startup_ms(args, runs=5):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=ROOT, stdin=subprocess.DEVNULL,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def heavy_imports():
+    probe = ("import sys, runpy; sys.argv = ['rps_cli.py', '/dev/null']; sys.stderr = open('/dev/null', 'w')\n"
+             "try:\n    runpy.run_path('rps_cli.py', run_name='__main__')\nexcept SystemExit:\n    pass\n"
+             "print(sorted(m for m in ('customtkinter', 'pygame', 'numpy', 'tkinter') if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def stream(rounds, fmt, seed=23):
+    rng = random.Random(seed)
+    if fmt == "packed":
+        return io.BytesIO(bytes(rng.randrange(3) for _ in range(rounds)))
+    return io.BytesIO("".join("RPS"[rng.randrange(3)] + "\n" for _ in range(rounds)).encode())
+
+
+def run_pipeline(data, fmt, output):
+    stats = {"rounds": 0, "invalid": 0, "matches": 0, "outcomes": [0, 0, 0]}
+    parse = rps_cli.parse_packed if fmt == "packed" else rps_cli.parse_lines
+    sink = io.StringIO()
+    tracemalloc.start()
+    start = time.perf_counter()
+    for text in rps_cli.play(parse(rps_cli.read_chunks(data, CHUNK_SIZE), stats), rps_cli.make_opponent("normal", 0),
+                             stats, match_rounds=5, output=output):
+        sink.write(text)
+        sink.seek(0)
+        sink.truncate()  # stand-in for stdout: keep nothing
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return stats["rounds"] / elapsed, peak
+
+
+def main(rounds):
+    print(f"python -c pass:         {startup_ms(['-c', 'pass']):6.1f} ms")
+    print(f"rps_cli.py (no input):  {startup_ms(['rps_cli.py', '/dev/null']):6.1f} ms")
+    print(f"heavy modules imported: {heavy_imports()}")
+    for fmt in ("lines", "packed"):
+        for output in ("rounds", "none"):
+            peaks = []
+            for size in (rounds // 10, rounds):
+                rate, peak = run_pipeline(stream(size, fmt), fmt, output)
+                peaks.append(peak)
+            print(f"{fmt:<6} output={output:<6}: {rate:>10,.0f} rounds/sec, peak memory "
+                  f"{peaks[0] / 1024:.0f} KiB at {rounds // 10:,} rounds, {peaks[1] / 1024:.0f} KiB at {rounds:,}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
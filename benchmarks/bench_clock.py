@@ -0,0 +1,107 @@
+"""Duration of the 40-frame gesture animation on fast and slow machines.
+
+A slow machine is simulated by making every frame busy-wait for a fixed
+render cost. The old pattern, a fixed after(30) rescheduled after each
+frame, stretches the animation by the render cost on every frame. The
+time-based FrameClock keeps the nominal 1.2 s and drops frames instead.
+The low-power row caps the clock at 15 FPS.
+Runs without a display: a small event loop stands in for Tk's after().
+Run from the repository root: python benchmarks/bench_clock.py
+"""
+import heapq
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rps_anim
+
+FRAMES = 40
+INTERVAL_MS = 30
+
+
+class LoopRoot:
+    """Just enough of Tk's after()/after_cancel() to drive a FrameClock."""
+
+    def __init__(self):
+        self.queue = []
+        self.cancelled = set()
+        self._ids = itertools.count()
+
+    def after(self, delay_ms, callback):
+        after_id = next(self._ids)
+        heapq.heappush(self.queue, (time.monotonic() + delay_ms / 1000, after_id, callback))
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.cancelled.add(after_id)
+
+    def run(self):
+        while self.queue:
+            due, after_id, callback = heapq.heappop(self.queue)
+            if after_id in self.cancelled:
+                continue
+            wait = due - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            callback()
+
+
+def render(cost_ms):
+    end = time.perf_counter() + cost_ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+def fixed_tick(cost_ms):
+    root = LoopRoot()
+    rendered = [0]
+
+    def frame():
+        rendered[0] += 1
+        render(cost_ms)
+        if rendered[0] < FRAMES:
+            root.after(INTERVAL_MS, frame)
+
+    start = time.monotonic()
+    root.after(INTERVAL_MS, frame)
+    root.run()
+    return time.monotonic() - start, rendered[0], 0
+
+
+def time_based(cost_ms, max_fps=rps_anim.FrameClock.DEFAULT_MAX_FPS):
+    root = LoopRoot()
+    clock = rps_anim.FrameClock(root, max_fps=max_fps)
+    shown = [0]
+
+    def animate(step):
+        # Same shape as animate_gestures: the last frame is always shown, then the animation ends.
+        if shown[0] >= FRAMES:
+            return False
+        shown[0] = min(step + 1, FRAMES)
+        render(cost_ms)
+        return True
+
+    start = time.monotonic()
+    clock.add(animate, INTERVAL_MS, delay_ms=INTERVAL_MS)
+    root.run()
+    stats = clock.stats()
+    # The final call only ends the animation; it renders nothing.
+    return time.monotonic() - start, stats["frames"] - 1, stats["dropped"]
+
+
+def main():
+    print(f"{FRAMES} frames every {INTERVAL_MS} ms (nominal {FRAMES * INTERVAL_MS / 1000:.2f} s)")
+    print(f"{'render cost':>12} {'clock':>22} {'duration':>9} {'rendered':>9} {'dropped':>8}")
+    for cost in (1, 10, 25, 50):
+        rows = (("fixed after(30)", fixed_tick(cost)),
+                ("time-based, 60 FPS cap", time_based(cost)),
+                ("time-based, 15 FPS", time_based(cost, rps_anim.FrameClock.LOW_POWER_FPS)))
+        for label, (duration, rendered, dropped) in rows:
+            print(f"{cost:>9} ms {label:>22} {duration:>7.2f} s {rendered:>9} {dropped:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Rounds/sec for the scalar and batch paths of rps_engine.
+
+Run from the repository root: python benchmarks/bench_engine.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rps_engine
+
+
+def bench_scalar(rounds):
+    rng = random.Random(1)
+    players = [rng.randrange(3) for _ in range(rounds)]
+    computers = [rng.randrange(3) for _ in range(rounds)]
+    resolve = rps_engine.resolve
+    start = time.perf_counter()
+    for p, c in zip(players, computers):
+        resolve(p, c)
+    return rounds / (time.perf_counter() - start)
+
+
+def bench_if_chain(rounds):
+    # The string if-chain display_result used before the engine existed.
+    rng = random.Random(1)
+    players = [rng.choice(rps_engine.GESTURES) for _ in range(rounds)]
+    computers = [rng.choice(rps_engine.GESTURES) for _ in range(rounds)]
+    start = time.perf_counter()
+    for p, c in zip(players, computers):
+        if p == c:
+            pass
+        elif (p == "Rock" and c == "Scissors") or (p == "Paper" and c == "Rock") or \
+             (p == "Scissors" and c == "Paper"):
+            pass
+    return rounds / (time.perf_counter() - start)
+
+
+def bench_batch(rounds):
+    if rps_engine.np is not None:
+        rng = rps_engine.np.random.default_rng(1)
+        players = rng.integers(0, 3, rounds, dtype=rps_engine.np.uint8)
+        computers = rng.integers(0, 3, rounds, dtype=rps_engine.np.uint8)
+    else:
+        rng = random.Random(1)
+        players = [rng.randrange(3) for _ in range(rounds)]
+        computers = [rng.randrange(3) for _ in range(rounds)]
+    start = time.perf_counter()
+    outcomes = rps_engine.resolve_batch(players, computers)
+    rps_engine.tally(outcomes)
+    return rounds / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    scalar_rounds = 1_000_000
+    batch_rounds = 10_000_000 if rps_engine.np is not None else 1_000_000
+    print(f"if-chain (strings): {bench_if_chain(scalar_rounds):>14,.0f} rounds/sec")
+    print(f"scalar resolve():   {bench_scalar(scalar_rounds):>14,.0f} rounds/sec")
+    backend = "numpy" if rps_engine.np is not None else "array fallback"
+    print(f"resolve_batch() [{backend}]: {bench_batch(batch_rounds):>14,.0f} rounds/sec")
@@ -0,0 +1,88 @@
+"""Font lookups made by the animations, with and without rps_fonts.FontCache.
+
+Plays the font requests of a session (gesture emoji per keyframe, the result
+label pulse, the trophy pulse) against a FontCache primed the way the app
+primes it, and reports hits, misses and evictions. With a display it also
+times canvas.itemconfigure(font=...) with a fresh tuple against a cached
+tkinter.font.Font.
+Run from the repository root: python benchmarks/bench_fonts.py [rounds]
+"""
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rps_fonts
+import rps_scene
+
+
+class CountingFactory:
+    """Stands in for Tk when there is no display; counts the fonts created."""
+
+    def __init__(self):
+        self.created = 0
+
+    def __call__(self, name, family, size, weight, slant):
+        self.created += 1
+        return (name, family, size, weight, slant)
+
+
+def session_requests(rounds):
+    """The font specs a session of `rounds` rounds asks for, in order."""
+    frame_count = rps_scene.ANIMATION_FRAMES
+    for _ in range(rounds):
+        for frame in range(frame_count + 1):
+            font = rps_scene.gesture_frame("Rock", "player", frame / frame_count, 400, 150)[-1][1]["font"]
+            yield font
+            yield font
+        for step in range(4):
+            yield ("Impact", int(16 * (1.0 + 0.05 * math.sin(step * math.pi / 1.5))), "bold")
+    for step in range(31):
+        yield ("Arial", int(40 * (1.0 + 0.1 * math.sin(step * 0.2 * math.pi))))
+
+
+def bench_cache(rounds):
+    factory = CountingFactory()
+    cache = rps_fonts.FontCache(factory)
+    cache.prepare(rps_scene.gesture_font_specs())
+    cache.prepare(cache.sizes("Arial", rps_fonts.pulse_sizes(40, 0.1)))
+    cache.prepare(cache.sizes("Impact", rps_fonts.pulse_sizes(16, 0.05), "bold"))
+    prepared = factory.created
+    requests = list(session_requests(rounds))
+    start = time.perf_counter()
+    for spec in requests:
+        cache.get(spec)
+    elapsed = time.perf_counter() - start
+    print(f"{rounds} rounds: {len(requests)} font requests, {prepared} fonts prepared up front")
+    print(f"  hits={cache.stats['hits']} misses={cache.stats['misses']} evictions={cache.stats['evictions']} "
+          f"fonts alive={len(cache.fonts)}")
+    print(f"  lookup: {elapsed / len(requests) * 1e6:.2f} us/request")
+
+
+def bench_tk(iterations=2000):
+    if not os.environ.get("DISPLAY"):
+        print("No display: skipping the Tk itemconfigure comparison")
+        return
+    import tkinter
+    root = tkinter.Tk()
+    canvas = tkinter.Canvas(root, width=400, height=150)
+    canvas.pack()
+    item = canvas.create_text(200, 75, text="✊")
+    root.update()
+    cache = rps_fonts.FontCache(rps_fonts.tk_font_factory(root))
+    sizes = list(rps_fonts.pulse_sizes(40, 0.1))
+    for label, font_for in (("tuple", lambda size: ("Arial", size)),
+                            ("cached Font", lambda size: cache.get(("Arial", size)))):
+        start = time.perf_counter()
+        for i in range(iterations):
+            canvas.itemconfigure(item, font=font_for(sizes[i % len(sizes)]))
+            root.update_idletasks()
+        print(f"itemconfigure with {label:<12}: {(time.perf_counter() - start) / iterations * 1e6:8.1f} us/frame")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    bench_cache(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
+    bench_tk()
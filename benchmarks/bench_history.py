@@ -0,0 +1,103 @@
+"""Memory per round and scan speed of the packed match history.
+
+Compares the bytes held per recorded round by MatchHistory with a list of
+per-round dicts, checks that the buffer stays flat across an endless session
+(it is flushed every flush_every rounds), and times a zero-copy mmap scan.
+It also checks that a file cut short inside its header is reported as a
+ValueError and rewritten by the next flush.
+Run from the repository root: python benchmarks/bench_history.py [rounds]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rps_engine
+import rps_history
+
+
+def moves(rounds, seed=5):
+    rng = random.Random(seed)
+    for _ in range(rounds):
+        p, c = rng.randrange(3), rng.randrange(3)
+        yield p, c, rps_engine.resolve(p, c)
+
+
+def dict_log_bytes(rounds):
+    tracemalloc.start()
+    log = [{"player": rps_engine.GESTURES[p], "computer": rps_engine.GESTURES[c],
+            "outcome": rps_engine.OUTCOME_NAMES[o], "time": time.time()} for p, c, o in moves(rounds)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del log
+    return size
+
+
+def packed_bytes(rounds):
+    with tempfile.TemporaryDirectory() as directory:
+        history = rps_history.MatchHistory(os.path.join(directory, "h.bin"), flush_every=10 ** 9)
+        tracemalloc.start()
+        for p, c, o in moves(rounds):
+            history.record(p, c, o)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return size
+
+
+def endless_session(rounds, path):
+    history = rps_history.MatchHistory(path, flush_every=256)
+    peak_buffer = 0
+    start = time.perf_counter()
+    for p, c, o in moves(rounds):
+        history.record(p, c, o)
+        peak_buffer = max(peak_buffer, history.buffer_bytes())
+    history.flush()
+    return peak_buffer, rounds / (time.perf_counter() - start)
+
+
+def check_truncated_header():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "h.bin")
+        with open(path, "wb") as f:
+            f.write(rps_history.MAGIC[:3])
+        try:
+            rps_history.HistoryFile(path).close()
+        except ValueError as e:
+            print(f"truncated header: {e}")
+        else:
+            raise SystemExit("truncated header was accepted")
+        if rps_history.count_session_starts(path) != 0:
+            raise SystemExit("count_session_starts read a truncated header")
+        history = rps_history.MatchHistory(path)
+        history.begin_session("ann")
+        history.record(0, 1, rps_engine.resolve(0, 1))
+        history.flush()
+        with rps_history.HistoryFile(path) as history_file:
+            if len(history_file) != 1:
+                raise SystemExit("flush did not rewrite a truncated header")
+        print("truncated header: rewritten by the next flush")
+
+
+def main(rounds):
+    sample = 100_000
+    print(f"list of dicts:  {dict_log_bytes(sample) / sample:7.1f} bytes/round")
+    print(f"packed array:   {packed_bytes(sample) / sample:7.1f} bytes/round")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "history.bin")
+        peak, rate = endless_session(rounds, path)
+        print(f"{rounds:,}-round session: peak buffer {peak / 1024:.1f} KiB, record() {rate:,.0f} rounds/sec, "
+              f"file {os.path.getsize(path) / 1024:.0f} KiB")
+        start = time.perf_counter()
+        with rps_history.HistoryFile(path) as history_file:
+            counts = history_file.outcome_counts()
+        print(f"mmap scan of {rounds:,} rounds: {(time.perf_counter() - start) * 1e3:.1f} ms -> "
+              f"ties/wins/losses {counts}")
+    check_truncated_header()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,87 @@
+"""Per-round cost of the app's logging: print() against rps_log at INFO and DEBUG.
+
+Each simulated round makes the calls that display_result,
+update_score_display and check_round_completion make. The output goes to a
+line-buffered pipe drained by `cat`, as when the game runs with its output
+piped or on a terminal. Modes:
+- print: the f-string print() calls the app used before rps_log;
+- info:  rps_log at the default level, where these calls are no-ops;
+- debug: rps_log at DEBUG, with records buffered and written by its thread.
+Reported per round, on the calling (UI) thread: mean and p95 over batches of
+--batch rounds. For debug it also gives the flush after each batch, i.e.
+the formatting and writing moved off the UI thread.
+Run from the repository root: python benchmarks/bench_log.py [--rounds N] [--batch N]
+"""
+import argparse
+import io
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rps_log
+
+game_log = rps_log.get_logger("game")
+PREFIXES = ("Tie", "Player wins", "Computer wins")
+
+
+def print_round(i, stream):
+    player, computer = i // 3, i // 2
+    print(f"{PREFIXES[i % 3]}: player_score={player}, computer_score={computer}", file=stream)
+    print(f"Score updated: You={player}, CPU={computer}", file=stream)
+    print(f"Advanced to round {i + 1}", file=stream)
+
+
+def log_round(i, stream):
+    player, computer = i // 3, i // 2
+    game_log.debug("%s: player_score=%s, computer_score=%s", PREFIXES[i % 3], player, computer)
+    game_log.debug("Score updated: You=%s, CPU=%s", player, computer)
+    game_log.debug("Advanced to round %s", i + 1)
+
+
+def run(mode, rounds, batch, stream):
+    if mode != "print":
+        rps_log.configure(mode, stream=stream)
+    play = print_round if mode == "print" else log_round
+    samples = []
+    flush_s = 0.0
+    for start in range(0, rounds, batch):
+        began = time.perf_counter()
+        for i in range(start, start + batch):
+            play(i, stream)
+        samples.append((time.perf_counter() - began) / batch * 1e6)
+        # In the app rounds are seconds apart and the log thread writes in
+        # between; flushing here keeps this loop from outrunning the ring.
+        began = time.perf_counter()
+        rps_log.flush()
+        flush_s += time.perf_counter() - began
+    flush_us = flush_s / rounds * 1e6
+    ordered = sorted(samples)
+    return statistics.mean(samples), ordered[int(len(ordered) * 0.95)], flush_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description="rps_log per-round overhead")
+    parser.add_argument("--rounds", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+    sink = subprocess.Popen(["cat"], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL)
+    stream = io.TextIOWrapper(sink.stdin, encoding="utf-8", line_buffering=True)
+    try:
+        for mode in ("print", "info", "debug"):
+            mean, p95, flush_us = run(mode, args.rounds, args.batch, stream)
+            extra = f", plus {flush_us:.2f} us/round on the log thread" if mode == "debug" else ""
+            print(f"{mode:<6} {mean:7.3f} us/round mean, {p95:7.3f} us/round p95 on the UI thread{extra}")
+        stats = rps_log.stats()
+        print(f"rps_log: {stats['records']:,} lines in {stats['flushes']:,} writes, {stats['dropped']} dropped")
+    finally:
+        rps_log.shutdown()
+        stream.close()
+        sink.wait()
+
+
+if __name__ == "__main__":
+    main()
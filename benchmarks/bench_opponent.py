@@ -0,0 +1,87 @@
+"""Per-move cost, memory and strength of the computer opponents.
+
+Times next_move() + observe() per round, checks the Markov tables do not grow
+over a long session, and plays each difficulty against a few scripted
+players: uniformly random, biased towards Rock, cycling R-P-S, and
+"win-stay, lose-shift".
+Run from the repository root: python benchmarks/bench_opponent.py [rounds]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rps_engine
+import rps_opponent
+
+
+def random_player(rng):
+    while True:
+        yield rng.randrange(3)
+
+
+def biased_player(rng):
+    while True:
+        yield rps_engine.ROCK if rng.random() < 0.5 else rng.randrange(3)
+
+
+def cycling_player(rng):
+    move = 0
+    while True:
+        yield move
+        move = (move + 1) % 3
+
+
+def win_stay_lose_shift(rng):
+    move = rng.randrange(3)
+    while True:
+        outcome = yield move
+        if outcome != rps_engine.WIN:
+            move = (move + 1) % 3
+
+
+PLAYERS = {"random": random_player, "biased": biased_player, "cycle": cycling_player,
+           "win-stay": win_stay_lose_shift}
+
+
+def play(difficulty, make_player, rounds, seed=14):
+    opponent = rps_opponent.make_opponent(difficulty, random.Random(seed))
+    player_moves = make_player(random.Random(seed + 1))
+    player = next(player_moves)
+    computer_wins = 0
+    for _ in range(rounds):
+        computer = opponent.next_move()
+        outcome = rps_engine.resolve(player, computer)
+        computer_wins += outcome == rps_engine.LOSE
+        opponent.observe(player, computer)
+        player = player_moves.send(outcome)
+    return computer_wins / rounds
+
+
+def per_move_cost(rounds):
+    opponent = rps_opponent.make_opponent("hard", random.Random(1))
+    rng = random.Random(2)
+    moves = [rng.randrange(3) for _ in range(rounds)]
+    before = opponent.table_bytes()
+    start = time.perf_counter()
+    for player in moves:
+        computer = opponent.next_move()
+        opponent.observe(player, computer)
+    elapsed = time.perf_counter() - start
+    print(f"next_move + observe: {elapsed / rounds * 1e6:.2f} us/round over {rounds:,} rounds; "
+          f"table memory {before} -> {opponent.table_bytes()} bytes")
+
+
+def main(rounds):
+    per_move_cost(rounds)
+    print("CPU win rate (a random CPU wins 33%):")
+    print(f"{'player':>10} " + " ".join(f"{level:>8}" for level in rps_opponent.DIFFICULTIES))
+    for name, make_player in PLAYERS.items():
+        rates = [play(level, make_player, 20_000) for level in rps_opponent.DIFFICULTIES]
+        print(f"{name:>10} " + " ".join(f"{rate:8.1%}" for rate in rates))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,104 @@
+"""Idle cost of the five pulsing buttons: resize pulse vs border-color glow.
+
+With a display and customtkinter installed, this packs five real CTkButtons
+and measures process CPU time over an idle period for each effect. Without a
+display it drives stand-in buttons and counts geometry-changing configure
+calls and per-tick Python time instead.
+Run from the repository root: python benchmarks/bench_pulse.py [seconds]
+"""
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rps_anim
+
+BUTTONS = (("Start Game", "#00CED1"), ("Reset", "#FFA500"), ("Rock", "#1E90FF"),
+           ("Paper", "#FF00FF"), ("Scissors", "#00CED1"))
+WIDTH, HEIGHT = 100, 40
+
+
+def resize_pulse(button, fg_color):
+    def pulse(step):
+        scale = 1.0 + 0.05 * math.sin(step * 0.1 * math.pi)
+        button.configure(width=int(WIDTH * scale), height=int(HEIGHT * scale))
+        return True
+    return pulse
+
+
+def glow_pulse(button, fg_color):
+    palette = rps_anim.pulse_palette(fg_color, "#FFFFFF", period=20)
+    last_color = [None]
+
+    def pulse(step):
+        color = palette[step % len(palette)]
+        if color != last_color[0]:
+            button.configure(border_color=color)
+            last_color[0] = color
+        return True
+    return pulse
+
+
+class StandInButton:
+    def __init__(self):
+        self.geometry_changes = 0
+        self.configures = 0
+
+    def configure(self, **options):
+        self.configures += 1
+        if "width" in options or "height" in options:
+            self.geometry_changes += 1
+
+
+def run_headless(make_pulse, ticks=10_000):
+    buttons = [StandInButton() for _ in BUTTONS]
+    pulses = [make_pulse(button, color) for button, (_, color) in zip(buttons, BUTTONS)]
+    start = time.perf_counter()
+    for step in range(ticks):
+        for pulse in pulses:
+            pulse(step)
+    elapsed = time.perf_counter() - start
+    return (elapsed / ticks * 1e6, sum(b.configures for b in buttons),
+            sum(b.geometry_changes for b in buttons))
+
+
+def run_tk(make_pulse, seconds):
+    import customtkinter as ctk
+    root = ctk.CTk()
+    root.geometry("600x200")
+    frame = ctk.CTkFrame(root, fg_color="transparent")
+    frame.pack(fill="x")
+    clock = rps_anim.FrameClock(root)
+    for text, color in BUTTONS:
+        button = ctk.CTkButton(frame, text=text, fg_color=color, border_color="#FFFFFF", border_width=2,
+                               width=WIDTH, height=HEIGHT)
+        button.pack(side="left", expand=True, padx=10)
+        clock.add(make_pulse(button, color), 100)
+    root.update()
+    cpu_start = time.process_time()
+    wall_end = time.monotonic() + seconds
+    while time.monotonic() < wall_end:
+        root.update()
+        time.sleep(0.005)
+    cpu = time.process_time() - cpu_start
+    root.destroy()
+    return cpu / seconds * 100
+
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    try:
+        if not os.environ.get("DISPLAY"):
+            raise RuntimeError("no $DISPLAY")
+        import customtkinter  # noqa: F401
+    except (ImportError, RuntimeError) as e:
+        print(f"Headless mode ({e})")
+        for label, make_pulse in (("resize pulse", resize_pulse), ("border glow", glow_pulse)):
+            per_tick, configures, geometry = run_headless(make_pulse)
+            print(f"{label:<13} {per_tick:6.2f} us/tick  configure calls={configures}  "
+                  f"geometry changes={geometry}")
+    else:
+        for label, make_pulse in (("resize pulse", resize_pulse), ("border glow", glow_pulse)):
+            print(f"{label:<13} idle CPU {run_tk(make_pulse, seconds):5.1f}% over {seconds:.0f}s")
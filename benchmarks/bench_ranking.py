@@ -0,0 +1,50 @@
+"""Ranking engine costs with 1M synthetic players.
+
+Times the bulk load, incremental score updates, top-10 queries, rank-of-player
+lookups and deep page reads for both ranking keys.
+Run from the repository root: python benchmarks/bench_ranking.py [players]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rps_ranking
+
+
+def per_op(label, count, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed / count * 1e6:8.2f} us/op  ({count:,} ops)")
+
+
+def main(players):
+    rng = random.Random(11)
+    entries = [{"name": f"player{i}", "wins": int(rng.expovariate(1 / 40)), "streak": rng.randrange(25)}
+               for i in range(players)]
+    ranking = rps_ranking.RankingEngine()
+    start = time.perf_counter()
+    ranking.update_many(entries)
+    print(f"bulk load of {players:,} players: {time.perf_counter() - start:.2f} s")
+
+    names = [f"player{rng.randrange(players)}" for _ in range(100_000)]
+
+    def updates():
+        for name in names:
+            entry = ranking.entries[name]
+            ranking.update({"name": name, "wins": entry["wins"] + 1, "streak": entry["streak"]})
+
+    per_op("update (one game result)", len(names), updates)
+    per_op("rank(name) by wins", len(names), lambda: [ranking.rank(n) for n in names])
+    per_op("rank(name) by streak", len(names), lambda: [ranking.rank(n, "streak") for n in names])
+    per_op("top(10) by wins", 10_000, lambda: [ranking.top(10) for _ in range(10_000)])
+    per_op("top(10) by streak", 10_000, lambda: [ranking.top(10, "streak") for _ in range(10_000)])
+    pages = [rng.randrange(players // 10) for _ in range(10_000)]
+    per_op("page(n, 10) anywhere by wins", len(pages), lambda: [ranking.page(p, 10) for p in pages])
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
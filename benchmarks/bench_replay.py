@@ -0,0 +1,62 @@
+"""Render-free replay throughput and determinism check for rps_replay.
+
+Records a batch of seeded sessions the way the app does, then replays them
+with fast_forward and checks every replay reproduces the recorded computer
+moves exactly.
+Run from the repository root: python benchmarks/bench_replay.py [sessions] [rounds]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rps_engine
+import rps_opponent
+import rps_replay
+
+
+def record_sessions(count, rounds, seed=13):
+    players = random.Random(seed)
+    difficulties = list(rps_opponent.DIFFICULTIES)
+    records = []
+    for index in range(count):
+        session = rps_replay.SessionRNG(players.getrandbits(63))
+        difficulty = difficulties[index % len(difficulties)]
+        opponent = rps_opponent.make_opponent(difficulty, session.logic)
+        record = rps_replay.SessionRecord(session.seed, rounds, opponent=difficulty)
+        match = rps_engine.MatchState(rounds)
+        while True:
+            player = players.randrange(3)
+            computer = opponent.next_move()
+            # Animation draws from the visual stream between moves; it must not affect the logic stream.
+            for _ in range(players.randrange(50)):
+                session.visual.random()
+            match.record(rps_engine.resolve(player, computer))
+            opponent.observe(player, computer)
+            record.add(player, computer)
+            if not match.advance():
+                break
+        records.append(record)
+    return records
+
+
+def main(count, rounds):
+    records = record_sessions(count, rounds)
+    records = [rps_replay.SessionRecord.from_dict(r.to_dict()) for r in records]  # through the file format
+    start = time.perf_counter()
+    results = list(rps_replay.replay_many(records))
+    elapsed = time.perf_counter() - start
+    diverged = sum(result.diverged_at is not None for result in results)
+    mismatched = sum(result.computer_moves != record.computer_moves for result, record in zip(results, records))
+    print(f"{count:,} sessions x {rounds} rounds: {count / elapsed:,.0f} sessions/sec, "
+          f"{count * rounds / elapsed:,.0f} rounds/sec")
+    print(f"diverged: {diverged}, mismatched computer moves: {mismatched}")
+    if diverged or mismatched:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 5)
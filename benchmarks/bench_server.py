@@ -0,0 +1,137 @@
+"""Load test for rps_server: thousands of simultaneous matches on one core.
+
+Starts a MatchServer in-process on a free local port. It then connects
+--bots clients that each play a bot, plus --pairs pairs of clients that
+play each other. All matches are opened before the first move, and every
+client then plays its rounds in lockstep with the others, so every match
+stays live until the last round. Reported:
+- peak concurrent matches and round throughput;
+- server-side bytes per match, from the __slots__ objects a match owns;
+- with --trace-memory, total process memory per match, measured after the
+  first and the last round to show it does not grow with the rounds played
+  (tracemalloc slows the run about threefold, so it is off by default).
+
+Client and server share the one event loop (and core), so throughput is a
+lower bound for the server alone.
+Run from the repository root:
+    python benchmarks/bench_server.py [--bots N] [--pairs N] [--rounds N] [--trace-memory]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rps_server
+
+
+def deep_size(obj, seen=None):
+    """Bytes held by a match: slots objects, containers and arrays, not the clients it points at."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen or isinstance(obj, (rps_server.Client, type)) or callable(obj):
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(deep_size(item, seen) for item in obj)
+    for cls in type(obj).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            if hasattr(obj, name):
+                size += deep_size(getattr(obj, name), seen)
+    if hasattr(obj, "__dict__") and not isinstance(obj, type):
+        size += deep_size(vars(obj), seen)
+    return size
+
+
+async def open_client(port, name, rounds, opponent):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"HELLO {name}\nPLAY {rounds} {opponent}\n".encode())
+    return reader, writer
+
+
+async def expect(reader, verb):
+    while True:
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError("server closed the connection")
+        if line.startswith(verb):
+            return line
+
+
+async def run(bots, pairs, rounds):
+    server = rps_server.MatchServer(seed=22)
+    listener = await server.start("127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    start = time.perf_counter()
+    clients = [await open_client(port, f"bot{i}", rounds, "normal") for i in range(bots)]
+    for i in range(pairs):
+        clients.append(await open_client(port, f"a{i}", rounds, rps_server.HUMAN))
+        clients.append(await open_client(port, f"b{i}", rounds, rps_server.HUMAN))
+    await asyncio.gather(*(expect(reader, b"START") for reader, _ in clients))
+    print(f"opened {len(server.matches)} matches for {len(clients)} clients in {time.perf_counter() - start:.2f} s")
+
+    sample = list(server.matches.values())[:200]
+    per_match = sum(deep_size(match) for match in sample) / len(sample)
+    print(f"server state: {per_match:.0f} bytes/match (ServerMatch + MatchState + bot tables)")
+
+    memory = []
+    start = time.perf_counter()
+    for round_number in range(rounds):
+        for index, (_, writer) in enumerate(clients):
+            writer.write(b"MOVE " + b"RPS"[(index + round_number) % 3:][:1] + b"\n")
+        await asyncio.gather(*(expect(reader, b"ROUND") for reader, _ in clients))
+        if tracemalloc.is_tracing() and round_number in (0, rounds - 2):
+            memory.append(tracemalloc.get_traced_memory()[0])
+    elapsed = time.perf_counter() - start
+    await asyncio.gather(*(expect(reader, b"END") for reader, _ in clients))
+    matches = bots + pairs
+    print(f"{server.stats['rounds']:,} rounds in {elapsed:.2f} s: {server.stats['rounds'] / elapsed:,.0f} rounds/sec, "
+          f"peak {server.stats['peak_matches']} concurrent matches")
+    if len(memory) == 2:
+        print(f"process memory: {memory[0] / matches / 1024:.1f} KiB/match after round 1, "
+              f"{memory[1] / matches / 1024:.1f} KiB/match after round {rounds - 1} (both ends of every socket)")
+
+    for _, writer in clients:
+        writer.write(b"QUIT\n")
+        writer.close()
+    await asyncio.gather(*(writer.wait_closed() for _, writer in clients), return_exceptions=True)
+    while server.stats["clients"]:
+        await asyncio.sleep(0.01)
+    listener.close()
+    await listener.wait_closed()
+    print(f"server stats: {server.stats}")
+
+
+def raise_fd_limit(needed):
+    """Raise the soft descriptor limit towards `needed`, where the platform has one (POSIX)."""
+    try:
+        import resource
+    except ImportError:
+        print("resource module unavailable; leaving the open-file limit as it is")
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < needed:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(needed, hard), hard))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="rps_server load test")
+    parser.add_argument("--bots", type=int, default=2000, help="client-vs-bot matches")
+    parser.add_argument("--pairs", type=int, default=1000, help="client-vs-client matches")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--trace-memory", action="store_true", help="measure process memory per match")
+    args = parser.parse_args()
+    # Each client uses two descriptors in this process (client and server ends).
+    raise_fd_limit(2 * (args.bots + 2 * args.pairs) + 64)
+    if args.trace_memory:
+        tracemalloc.start()
+    asyncio.run(run(args.bots, args.pairs, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
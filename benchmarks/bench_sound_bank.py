@@ -0,0 +1,109 @@
+"""Per-play dispatch overhead of the sound bank under rapid input.
+
+Measures the UI-thread cost of AudioService.play (a queue put) and the
+worker-side SoundBank.play cost (channel pick + Channel.play), with bursts of
+overlapping clicks that force voice limiting and stealing. Uses pygame with
+the dummy SDL audio driver when pygame is installed and a stand-in mixer
+otherwise.
+Run from the repository root: python benchmarks/bench_sound_bank.py
+"""
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rps_audio
+
+CLICK = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "RPC_click.mp3")
+
+
+class StandInChannel:
+    def __init__(self):
+        self.busy_until = 0.0
+
+    def get_busy(self):
+        return time.monotonic() < self.busy_until
+
+    def play(self, sound):
+        self.busy_until = time.monotonic() + sound.length
+
+
+class StandInSound:
+    length = 0.15
+
+    def __init__(self, path):
+        pass
+
+    def set_volume(self, volume):
+        pass
+
+
+class StandInMixer:
+    Sound = StandInSound
+
+    def __init__(self):
+        self.channels = [StandInChannel() for _ in range(8)]
+
+    def get_num_channels(self):
+        return len(self.channels)
+
+    def set_num_channels(self, count):
+        self.channels += [StandInChannel() for _ in range(count - len(self.channels))]
+
+    def set_reserved(self, count):
+        pass
+
+    def Channel(self, index):
+        return self.channels[index]
+
+
+def make_mixer():
+    try:
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        import pygame
+        pygame.mixer.init()
+        pygame.mixer.Sound(CLICK)
+        return pygame.mixer, "pygame (dummy driver)"
+    except Exception as e:
+        return StandInMixer(), f"stand-in mixer ({e.__class__.__name__})"
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def bench_bank(mixer, plays=20_000):
+    bank = rps_audio.SoundBank(mixer)
+    bank.load("click", CLICK, "ui", max_voices=2)
+    bank.load("win", CLICK, "stinger", max_voices=1)
+    samples = []
+    for i in range(plays):
+        name = "win" if i % 10 == 0 else "click"
+        start = time.perf_counter()
+        bank.play(name)
+        samples.append(time.perf_counter() - start)
+    return samples, bank.stats
+
+
+def bench_submit(plays=100_000):
+    service = rps_audio.AudioService({})
+    samples = []
+    for _ in range(plays):
+        start = time.perf_counter()
+        service.play("click")
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+if __name__ == "__main__":
+    mixer, label = make_mixer()
+    submit = bench_submit()
+    print(f"AudioService.play (UI thread):  mean={statistics.mean(submit) * 1e6:.2f} us  "
+          f"p99={percentile(submit, 0.99) * 1e6:.2f} us")
+    samples, stats = bench_bank(mixer)
+    print(f"SoundBank.play [{label}]:  mean={statistics.mean(samples) * 1e6:.2f} us  "
+          f"p99={percentile(samples, 0.99) * 1e6:.2f} us  max={max(samples) * 1e6:.2f} us")
+    print(f"  plays={stats['plays']} voice_limited={stats['voice_limited']} steals={stats['steals']}")
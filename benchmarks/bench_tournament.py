@@ -0,0 +1,49 @@
+"""Scaling of rps_tournament with the number of worker processes.
+
+Runs the same tournament with 1, 2, 4, ... workers up to the core count and
+reports throughput, speedup and parallel efficiency. Results are identical for
+every worker count, which the script also checks.
+Run from the repository root: python benchmarks/bench_tournament.py [rounds per pairing]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rps_tournament
+
+
+def worker_counts():
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+def main(rounds):
+    print(f"{os.cpu_count()} cores, {len(rps_tournament.STRATEGIES)} strategies, {rounds:,} rounds per pairing")
+    baseline = None
+    reference = None
+    for workers in worker_counts():
+        start = time.perf_counter()
+        results = rps_tournament.run_tournament(rounds=rounds, match_rounds=10_000, workers=workers)
+        elapsed = time.perf_counter() - start
+        totals = {pairing: (r.wins_a, r.wins_b, r.ties) for pairing, r in results.items()}
+        if reference is None:
+            reference = totals
+        elif totals != reference:
+            print(f"results with {workers} workers differ from 1 worker")
+            sys.exit(1)
+        baseline = baseline or elapsed
+        speedup = baseline / elapsed
+        total = sum(sum(counts) for counts in totals.values())
+        print(f"{workers:3d} workers: {elapsed:6.2f} s  {total / elapsed:>12,.0f} rounds/sec  "
+              f"speedup {speedup:4.2f}x  efficiency {speedup / workers:4.0%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,113 @@
+"""Cost of rps_trace on the frame path, with tracing off and on.
+
+Drives animate_gestures (and so GestureScene.render_frame) on a headless
+app, as bench_ui does. Variants:
+- plain:   the app as it runs without --trace or --fps-overlay;
+- off:     Tracer(enabled=False).instrument(), which must leave the methods as is;
+- on:      Tracer(enabled=True), with a span per animate_gestures and render_frame call.
+It also times FrameClock ticks with and without the frame observer, and it
+exports the recorded trace to check the JSON and report its size. Finally
+it draws the FPS overlay once, from the tick histogram.
+Run from the repository root: python benchmarks/bench_trace.py [rounds]
+"""
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import rps_anim
+import rps_trace
+from bench_ui import headless_app, load_app_module, round_moves
+from fake_canvas import RecordingCanvas
+
+FRAME_METHODS = ("animate_gestures",)
+REPEATS = 5
+
+
+class IdleRoot:
+    """after() that never fires: ticks are driven by calling _tick() directly."""
+
+    def after(self, delay_ms, callback):
+        return 1
+
+    def after_cancel(self, after_id):
+        pass
+
+
+def frame_path(module, tracer, rounds):
+    """us per animate_gestures call over `rounds` rounds."""
+    app = headless_app(module, RecordingCanvas())
+    if tracer is not None:
+        tracer.instrument(app, FRAME_METHODS)
+        tracer.instrument(app.game_scene, ("render_frame",), "scene")
+    frames = app.keyframe_cache.frame_count
+    samples = []
+    for player, computer in round_moves(rounds):
+        app.game_scene.begin_round(player, computer)
+        app.animation_frame = 0
+        start = time.perf_counter()
+        for step in range(frames):
+            app.animate_gestures(player, computer, step)
+        samples.append((time.perf_counter() - start) / frames * 1e6)
+    return statistics.median(samples)
+
+
+def clock_ticks(observer, ticks=200_000):
+    """ns per FrameClock tick with one trivial animation due on every tick."""
+    clock = rps_anim.FrameClock(IdleRoot(), max_fps=None)
+    clock.frame_observer = observer
+    clock.add(lambda step: True, 1, delay_ms=-10_000)
+    entry = next(iter(clock.animations.values()))
+    start = time.perf_counter()
+    for _ in range(ticks):
+        entry[3] = 0  # due now
+        clock._tick()
+    return (time.perf_counter() - start) / ticks * 1e9
+
+
+def main(rounds):
+    module = load_app_module()
+    tracer = rps_trace.Tracer(enabled=True)
+    best = {"plain": [], "off": [], "on": []}
+    for _ in range(REPEATS):  # interleaved, best of REPEATS, to keep machine noise out of the differences
+        best["plain"].append(frame_path(module, None, rounds))
+        best["off"].append(frame_path(module, rps_trace.Tracer(enabled=False), rounds))
+        best["on"].append(frame_path(module, tracer, rounds))
+    plain, off, on = (min(best[name]) for name in ("plain", "off", "on"))
+    print(f"animate_gestures frame: plain {plain:.2f} us, tracing off {off:.2f} us, tracing on {on:.2f} us "
+          f"({on - plain:+.2f} us for 2 spans)")
+
+    for name, (count, total_ms, max_ms) in sorted(tracer.span_stats().items()):
+        print(f"  span {name:<16} {count:>8,} calls  {total_ms / count * 1000:7.2f} us mean  {max_ms:7.3f} ms max")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "trace.json")
+        start = time.perf_counter()
+        count = tracer.export_chrome(path)
+        elapsed = time.perf_counter() - start
+        with open(path, encoding="utf-8") as trace_file:
+            loaded = json.load(trace_file)
+        assert len(loaded["traceEvents"]) == count
+        print(f"Chrome trace: {count:,} events, {os.path.getsize(path) / 1024:.0f} KiB, "
+              f"written in {elapsed * 1000:.0f} ms")
+
+    bare = clock_ticks(None)
+    histogram_only = clock_ticks(rps_trace.Tracer(enabled=False).frame)
+    clock_tracer = rps_trace.Tracer(enabled=True)
+    traced = clock_ticks(clock_tracer.frame)
+    print(f"FrameClock tick: no observer {bare:.0f} ns, histogram {histogram_only:.0f} ns, "
+          f"histogram + span {traced:.0f} ns")
+    print(f"  frame histogram: {clock_tracer.frames.summary()}")
+
+    canvas = RecordingCanvas()
+    overlay = rps_trace.FrameOverlay(canvas, clock_tracer.frames, rps_anim.FrameClock(IdleRoot()))
+    overlay.update(0)
+    print(f"overlay: {canvas.items[overlay.item][2]['text']!r}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
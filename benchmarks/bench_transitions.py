@@ -0,0 +1,68 @@
+"""Screen transition latency: first (built) vs cached (shown) transitions.
+
+Before the screen cache every transition destroyed and rebuilt the whole
+game UI, so the "cold" column is what each Play Again / Back used to cost;
+the "cached" column is what they cost now.
+Needs a display plus customtkinter and pygame.
+Run from the repository root: python benchmarks/bench_transitions.py
+"""
+import importlib.util
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def load_app_module():
+    spec = importlib.util.spec_from_file_location("rps_app", os.path.join(ROOT, "Rock_Paper_Scissor().py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def timed(root, action):
+    start = time.perf_counter()
+    action()
+    root.update_idletasks()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main(repeats=20):
+    module = load_app_module()
+    root = module.ctk.CTk()
+    game = module.RockPaperScissorsApp(root)
+    root.update()
+    game.player_name = "bench"
+    game.match.max_rounds = 3
+
+    cold = {
+        "rounds prompt": timed(root, game.prompt_rounds),
+        "start game": timed(root, game.start_game),
+        "game over popup": timed(root, lambda: game.show_game_over_popup("You")),
+    }
+    warm = {name: [] for name in cold}
+    warm["back to game"] = []
+    for _ in range(repeats):
+        warm["back to game"].append(timed(root, game.return_to_game))
+        warm["game over popup"].append(timed(root, lambda: game.show_game_over_popup("Computer")))
+        warm["start game"].append(timed(root, lambda: (game.reset_game(), game.start_game())))
+        game.show_screen("welcome")
+        warm["rounds prompt"].append(timed(root, game.prompt_rounds))
+        game.start_game()
+
+    print(f"{'transition':<18}{'cold (built)':>14}{'cached median':>16}")
+    for name, samples in warm.items():
+        first = f"{cold[name]:.2f} ms" if name in cold else "-"
+        print(f"{name:<18}{first:>14}{statistics.median(samples):>13.2f} ms")
+    game.is_running = False
+    game.cancel_animations()
+    root.destroy()
+
+
+if __name__ == "__main__":
+    if not os.environ.get("DISPLAY"):
+        sys.exit("bench_transitions.py needs a display (e.g. run it under xvfb-run)")
+    main()
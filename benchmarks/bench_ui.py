@@ -0,0 +1,325 @@
+"""Regression suite for the UI hot paths.
+
+Drives the app's per-frame drawing (animate_gestures, the pooled sparks and
+confetti) and, when
+a display is available, its screen transitions (start_game, clear_main_ui,
+show_game_over_popup), then compares the results with the baselines stored in
+benchmarks/ui_baselines.json and exits non-zero on a regression.
+
+Without $DISPLAY it starts a private Xvfb if one is installed. Failing that,
+it runs in headless mode, where the frame paths draw on a RecordingCanvas and
+the transitions, which need real widgets, are skipped, and no real Tk drawing
+is timed. Baselines are kept per mode. After every measured frame or
+transition the suite also times a fixed calibration frame (CALIBRATION_ITEMS
+items moved and recoloured on a second canvas of the same kind). Timings are
+stored as ratios to the calibration median over the same stretch, so neither a
+faster machine nor clock drift during the run shifts them. Timings fail when
+their ratio exceeds baseline * --tolerance (and they are at least
+MIN_REGRESSION_MS slower). Canvas op and item counts are deterministic and
+fail on any increase.
+
+Run from the repository root:
+    python benchmarks/bench_ui.py            # compare against the baselines
+    python benchmarks/bench_ui.py --update   # record new baselines for this mode
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tkinter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import rps_engine
+import rps_replay
+import rps_scene
+from fake_canvas import RecordingCanvas
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ui_baselines.json")
+MIN_REGRESSION_MS = 0.01
+ROUNDS = 30
+CALIBRATION_ITEMS = 50
+
+
+def load_app_module():
+    spec = importlib.util.spec_from_file_location("rps_app", os.path.join(ROOT, "Rock_Paper_Scissor().py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def start_xvfb():
+    """Start a private Xvfb and point $DISPLAY at it; returns the process or None."""
+    if os.environ.get("DISPLAY") or not shutil.which("Xvfb"):
+        return None
+    display = ":97"
+    process = subprocess.Popen(["Xvfb", display, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    if process.poll() is not None:
+        return None
+    os.environ["DISPLAY"] = display
+    return process
+
+
+def summarize(samples_ms):
+    ordered = sorted(samples_ms)
+    return statistics.median(ordered), ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+class Calibration:
+    """A fixed reference frame, timed between the measured ones; its median is the unit for timings."""
+
+    def __init__(self, canvas, flush):
+        self.canvas = canvas
+        self.flush = flush
+        self.items = [canvas.create_oval(i, i, i + 4, i + 4, fill="#FFFFFF") for i in range(CALIBRATION_ITEMS)]
+        self.samples = []
+        self.all_samples = []
+        self.frames = 0
+
+    def frame(self):
+        canvas = self.canvas
+        self.frames += 1
+        start = time.perf_counter()
+        for i, item in enumerate(self.items):
+            x = (i * 7 + self.frames) % 390
+            canvas.coords(item, x, i, x + 4, i + 4)
+            canvas.itemconfigure(item, fill="#FFFFFF" if self.frames % 2 else "#00FFFF")
+        self.flush()
+        self.samples.append((time.perf_counter() - start) * 1e3)
+
+    def unit(self):
+        """Median calibration frame (ms) since the last call."""
+        samples, self.samples = self.samples, []
+        self.all_samples.extend(samples)
+        return statistics.median(samples)
+
+    def record(self, results):
+        results["calibration.frame_ms"] = {"kind": "calibration", "value": round(statistics.median(self.all_samples), 4)}
+
+
+def record_timing(results, name, samples_ms, unit_ms):
+    """p50 and p95 of the samples, as ratios to the calibration frames timed alongside them."""
+    p50, p95 = summarize(samples_ms)
+    results[f"{name}.p50"] = {"kind": "ratio", "value": round(p50 / unit_ms, 3)}
+    results[f"{name}.p95"] = {"kind": "ratio", "value": round(p95 / unit_ms, 3)}
+
+
+def record_count(results, name, value):
+    results[name] = {"kind": "count", "value": value}
+
+
+def round_moves(count, seed=16):
+    rng = rps_replay.SessionRNG(seed).logic
+    return [(rps_engine.decode(int(rng.random() * 3)), rps_engine.decode(int(rng.random() * 3)))
+            for _ in range(count)]
+
+
+def headless_app(module, canvas):
+    """An app instance with just the state the frame paths use, drawing on `canvas`."""
+    app = module.RockPaperScissorsApp.__new__(module.RockPaperScissorsApp)
+    app.session = rps_replay.SessionRNG(16)
+    app.keyframe_cache = rps_scene.KeyframeCache()
+    app.game_canvas = canvas
+    app.game_scene = rps_scene.GestureScene(canvas, rng=app.session.visual, keyframes=app.keyframe_cache)
+    app.is_running = True
+    app.init_background_stars()
+    app.game_scene.build(app.star_positions)
+    return app
+
+
+def bench_particles(app, canvas, results, flush, calibration):
+    """Per-frame particle update with a win burst every round, and the canvas item count over many rounds."""
+    scene = app.game_scene
+    samples = []
+    peak_items = 0
+    for player, computer in round_moves(ROUNDS * 4):
+        scene.begin_round(player, computer)
+        scene.celebrate()
+        for _ in range(app.keyframe_cache.frame_count):
+            start = time.perf_counter()
+            scene.sparks.update()
+            scene.confetti.update()
+            flush()
+            samples.append((time.perf_counter() - start) * 1e3)
+            calibration.frame()
+        if isinstance(canvas, RecordingCanvas):
+            peak_items = max(peak_items, len(canvas.items))
+    record_timing(results, "particles.frame", samples, calibration.unit())
+    if isinstance(canvas, RecordingCanvas):
+        record_count(results, "particles.peak_items", peak_items)
+    scene.clear_round()
+
+
+def bench_animate_gestures(app, canvas, results, flush, calibration):
+    frames = app.keyframe_cache.frame_count
+    samples = []
+    peak_items = 0
+    ops_before = sum(canvas.ops.values()) if isinstance(canvas, RecordingCanvas) else 0
+    for player, computer in round_moves(ROUNDS):
+        app.game_scene.begin_round(player, computer)
+        app.animation_frame = 0
+        # Stop before the final call, which hands over to display_result.
+        for step in range(frames):
+            start = time.perf_counter()
+            app.animate_gestures(player, computer, step)
+            flush()
+            samples.append((time.perf_counter() - start) * 1e3)
+            calibration.frame()
+        if isinstance(canvas, RecordingCanvas):
+            peak_items = max(peak_items, len(canvas.items))
+    record_timing(results, "animate_gestures.frame", samples, calibration.unit())
+    if isinstance(canvas, RecordingCanvas):
+        record_count(results, "animate_gestures.ops_per_frame",
+                     round((sum(canvas.ops.values()) - ops_before) / len(samples)))
+        record_count(results, "animate_gestures.peak_items", peak_items)
+
+
+def run_headless(module):
+    results = {}
+    canvas = RecordingCanvas()
+    app = headless_app(module, canvas)
+    calibration = Calibration(RecordingCanvas(), lambda: None)
+    bench_particles(app, canvas, results, lambda: None, calibration)
+    bench_animate_gestures(app, canvas, results, lambda: None, calibration)
+    calibration.record(results)
+    return results
+
+
+def run_display(module):
+    results = {}
+    root = module.ctk.CTk()
+    quiet = contextlib.redirect_stdout(io.StringIO())
+
+    def timed(action):
+        start = time.perf_counter()
+        with quiet:
+            action()
+        root.update_idletasks()
+        return (time.perf_counter() - start) * 1e3
+
+    with quiet:
+        app = module.RockPaperScissorsApp(root)
+    root.update()
+    app.player_name = "bench"
+    app.match.max_rounds = 3
+
+    # The calibration canvas gets its own window, out of reach of the app's screen changes.
+    window = tkinter.Toplevel(root)
+    calibration_canvas = tkinter.Canvas(window, width=400, height=150, highlightthickness=0)
+    calibration_canvas.pack()
+    flush = root.update_idletasks
+    calibration = Calibration(calibration_canvas, flush)
+    root.update()
+
+    cold_ms = timed(app.start_game)
+    calibration.frame()
+    root.update()
+    for _ in range(ROUNDS):
+        calibration.frame()
+    results["start_game.cold"] = {"kind": "ratio", "value": round(cold_ms / calibration.unit(), 3)}
+    with quiet:
+        bench_particles(app, app.game_canvas, results, flush, calibration)
+        bench_animate_gestures(app, app.game_canvas, results, flush, calibration)
+
+    transitions = {"start_game.warm": [], "show_game_over_popup": [], "clear_main_ui": []}
+    for _ in range(ROUNDS):
+        transitions["show_game_over_popup"].append(timed(lambda: app.show_game_over_popup("You")))
+        transitions["clear_main_ui"].append(timed(app.clear_main_ui))
+        transitions["start_game.warm"].append(timed(lambda: (app.reset_game(), app.start_game())))
+        calibration.frame()
+    unit = calibration.unit()
+    for name, samples in transitions.items():
+        record_timing(results, name, samples, unit)
+    calibration.record(results)
+
+    with quiet:
+        app.is_running = False
+        app.cancel_animations()
+        app.audio.shutdown()
+        app.store.close()
+    root.destroy()
+    return results
+
+
+def compare(baseline, results, tolerance):
+    failures = []
+    unit = results["calibration.frame_ms"]["value"]
+    print(f"{'metric':<36}{'baseline':>12}{'current':>12}")
+    for name, current in results.items():
+        expected = baseline.get(name)
+        value = current["value"]
+        if expected is None:
+            print(f"{name:<36}{'-':>12}{value:>12}  (new, no baseline)")
+            continue
+        limit = expected["value"]
+        if current["kind"] == "calibration":
+            regressed = False  # machine speed, for reference only
+        elif current["kind"] == "ratio":
+            regressed = value > limit * tolerance and (value - limit) * unit > MIN_REGRESSION_MS
+        else:
+            regressed = value > limit
+        print(f"{name:<36}{limit:>12}{value:>12}{'  REGRESSION' if regressed else ''}")
+        if regressed:
+            failures.append(name)
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UI hot-path benchmarks with stored baselines")
+    parser.add_argument("--update", action="store_true", help="store the results as this mode's baseline")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="allowed timing ratio over baseline")
+    args = parser.parse_args()
+
+    xvfb = start_xvfb()
+    module = load_app_module()
+    workdir = tempfile.mkdtemp(prefix="rps-bench-ui-")
+    previous = os.getcwd()
+    # The app writes its leaderboard, history and session files to the working directory.
+    os.chdir(workdir)
+    try:
+        if os.environ.get("DISPLAY"):
+            mode, results = "display", run_display(module)
+        else:
+            mode, results = "headless", run_headless(module)
+    finally:
+        os.chdir(previous)
+        shutil.rmtree(workdir, ignore_errors=True)
+        if xvfb is not None:
+            xvfb.terminate()
+
+    baselines = {}
+    if os.path.exists(BASELINES):
+        with open(BASELINES, encoding="utf-8") as f:
+            baselines = json.load(f)
+    print(f"mode: {mode}")
+    if mode == "headless":
+        print("headless: screen transitions and real Tk drawing of the gestures are not covered; "
+              "frame timings are Python-side only")
+    if args.update:
+        baselines[mode] = results
+        with open(BASELINES, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=4)
+            f.write("\n")
+        print(f"Stored {len(results)} {mode} baselines in {os.path.relpath(BASELINES, ROOT)}")
+        return
+    failures = compare(baselines.get(mode, {}), results, args.tolerance)
+    if failures:
+        print(f"{len(failures)} regression(s): {', '.join(failures)}")
+        sys.exit(1)
+    print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Canvas stand-ins for benchmarking drawing code without a display.
+
+make_canvas() returns a real tkinter.Canvas when a display is available and a
+RecordingCanvas otherwise. RecordingCanvas implements the subset of the Tk
+canvas API the game uses and counts every call, so op counts and live item
+counts can be compared even on a headless box.
+"""
+import itertools
+import os
+from collections import Counter
+
+
+class RecordingCanvas:
+    def __init__(self, width=400, height=150):
+        self.width = width
+        self.height = height
+        self.items = {}
+        self.ops = Counter()
+        self._ids = itertools.count(1)
+
+    def winfo_exists(self):
+        return True
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def _create(self, kind, coords, options):
+        self.ops["create"] += 1
+        item = next(self._ids)
+        self.items[item] = [kind, list(coords), dict(options)]
+        return item
+
+    def create_rectangle(self, *coords, **options):
+        return self._create("rectangle", coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self._create("oval", coords, options)
+
+    def create_line(self, *coords, **options):
+        return self._create("line", coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._create("text", coords, options)
+
+    def create_image(self, *coords, **options):
+        return self._create("image", coords, options)
+
+    def _matching(self, tag_or_id):
+        if tag_or_id == "all":
+            return list(self.items)
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        return [item for item, (_, _, opts) in self.items.items() if tag_or_id in opts.get("tags", ())]
+
+    def find_withtag(self, tag_or_id):
+        return tuple(self._matching(tag_or_id))
+
+    def delete(self, *tags):
+        self.ops["delete"] += 1
+        for tag in tags:
+            for item in self._matching(tag):
+                del self.items[item]
+
+    def coords(self, item, *coords):
+        self.ops["coords"] += 1
+        if coords:
+            self.items[item][1] = list(coords)
+        return self.items[item][1]
+
+    def move(self, tag_or_id, dx, dy):
+        self.ops["move"] += 1
+        for item in self._matching(tag_or_id):
+            c = self.items[item][1]
+            self.items[item][1] = [v + (dx if i % 2 == 0 else dy) for i, v in enumerate(c)]
+
+    def itemconfigure(self, item, **options):
+        self.ops["itemconfigure"] += 1
+        for target in self._matching(item):
+            self.items[target][2].update(options)
+
+    itemconfig = itemconfigure
+
+    def itemcget(self, item, option):
+        return self.items[item][2].get(option)
+
+    def configure(self, **options):
+        self.ops["configure"] += 1
+
+    def tag_raise(self, *args):
+        self.ops["tag_raise"] += 1
+
+    def tag_lower(self, *args):
+        self.ops["tag_lower"] += 1
+
+    def update_idletasks(self):
+        pass
+
+
+def make_canvas(width=400, height=150):
+    """Return (canvas, root); root is None for a RecordingCanvas."""
+    if os.environ.get("DISPLAY"):
+        try:
+            import tkinter
+            root = tkinter.Tk()
+            canvas = tkinter.Canvas(root, width=width, height=height, highlightthickness=0)
+            canvas.pack()
+            root.update()
+            return canvas, root
+        except Exception as e:
+            print(f"Falling back to RecordingCanvas: {e}")
+    return RecordingCanvas(width, height), None
+
+
+def flush(canvas, root):
+    if root is not None:
+        root.update_idletasks()
+
+
+def live_items(canvas):
+    if isinstance(canvas, RecordingCanvas):
+        return len(canvas.items)
+    return len(canvas.find_all())
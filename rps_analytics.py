@@ -0,0 +1,344 @@
+"""Per-player statistics over the match history.
+
+Analytics keeps, per player: move counts, outcome counts, rounds and wins
+by the computer's move, session openers and a histogram of win-streak
+lengths. The app feeds it live with begin_session()/record(), the same
+calls it makes on rps_history.MatchHistory. Each round touches a fixed
+handful of counters, so the game-over popup reads ready-made aggregates
+and never scans the history.
+
+rebuild() recomputes everything from a history file in one pass. It reads
+the memory-mapped records in chunks and, when NumPy is installed, reduces
+each chunk with bincounts. A win streak that runs across a chunk boundary is
+carried into the next chunk. Streaks never span sessions.
+
+Run: python rps_analytics.py [rps_history.bin] [--csv out.csv]
+"""
+
+import argparse
+import csv
+import threading
+import time
+
+import rps_engine
+import rps_history
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAX_STREAK = 10  # the last histogram bucket counts streaks of MAX_STREAK wins or more
+CHUNK_RECORDS = 1 << 16
+
+
+class PlayerStats:
+    __slots__ = ("name", "sessions", "moves", "outcomes", "rounds_vs", "wins_vs", "openers", "streaks",
+                 "best_streak", "current_streak")
+
+    def __init__(self, name):
+        self.name = name
+        self.sessions = 0
+        self.moves = [0, 0, 0]  # by player move
+        self.outcomes = [0, 0, 0]  # by rps_engine outcome code
+        self.rounds_vs = [0, 0, 0]  # by computer move
+        self.wins_vs = [0, 0, 0]  # by computer move
+        self.openers = [0, 0, 0]  # first move of each session
+        self.streaks = [0] * (MAX_STREAK + 1)  # streaks[n]: finished runs of n wins
+        self.best_streak = 0
+        self.current_streak = 0
+
+    @property
+    def rounds(self):
+        return sum(self.moves)
+
+    def win_rate(self):
+        return self.outcomes[rps_engine.WIN] / self.rounds if self.rounds else 0.0
+
+    def win_rate_vs(self, computer):
+        rounds = self.rounds_vs[computer]
+        return self.wins_vs[computer] / rounds if rounds else 0.0
+
+    def favorite_opener(self):
+        """(move, share of sessions) or None before the first session."""
+        total = sum(self.openers)
+        if not total:
+            return None
+        move = max(range(3), key=self.openers.__getitem__)
+        return move, self.openers[move] / total
+
+    def streak_histogram(self):
+        """Finished streaks plus the one in progress."""
+        histogram = list(self.streaks)
+        if self.current_streak:
+            histogram[min(self.current_streak, MAX_STREAK)] += 1
+        return histogram
+
+    def end_streak(self):
+        if self.current_streak:
+            self.streaks[min(self.current_streak, MAX_STREAK)] += 1
+            self.current_streak = 0
+
+    def add(self, other):
+        """Fold in another player's counts (other's streak in progress counts as finished)."""
+        self.sessions += other.sessions
+        for mine, theirs in ((self.moves, other.moves), (self.outcomes, other.outcomes),
+                             (self.rounds_vs, other.rounds_vs), (self.wins_vs, other.wins_vs),
+                             (self.openers, other.openers), (self.streaks, other.streak_histogram())):
+            for i, value in enumerate(theirs):
+                mine[i] += value
+        self.best_streak = max(self.best_streak, other.best_streak)
+
+
+class Analytics:
+    def __init__(self):
+        self.players = {}  # name -> PlayerStats
+        self.current = None  # the player of the session in progress
+        self._opening = False
+
+    def player(self, name):
+        stats = self.players.get(name)
+        if stats is None:
+            stats = self.players[name] = PlayerStats(name)
+        return stats
+
+    def begin_session(self, name=None):
+        if self.current is not None:
+            self.current.end_streak()
+        self.current = self.player(name or "")
+        self.current.sessions += 1
+        self._opening = True
+
+    def record(self, player, computer, outcome):
+        stats = self.current
+        if stats is None:
+            self.begin_session()
+            stats = self.current
+        stats.moves[player] += 1
+        stats.outcomes[outcome] += 1
+        stats.rounds_vs[computer] += 1
+        if self._opening:
+            stats.openers[player] += 1
+            self._opening = False
+        if outcome == rps_engine.WIN:
+            stats.wins_vs[computer] += 1
+            stats.current_streak += 1
+            if stats.current_streak > stats.best_streak:
+                stats.best_streak = stats.current_streak
+        elif stats.current_streak:
+            stats.end_streak()
+
+    def merge(self, other):
+        """Add the counts of `other`, e.g. a rebuild of earlier history, to this instance."""
+        for name, stats in other.players.items():
+            self.player(name).add(stats)
+
+    def summary(self, name):
+        """A few lines for the game-over popup, or "" before the player's first round."""
+        stats = self.players.get(name or "")
+        if stats is None or not stats.rounds:
+            return ""
+        gestures = rps_engine.GESTURES
+        rounds = stats.rounds
+        lines = [f"{rounds} rounds over {stats.sessions} games · win rate {stats.win_rate():.0%}",
+                 "Moves: " + " · ".join(f"{gestures[m]} {stats.moves[m] / rounds:.0%}" for m in range(3)),
+                 "Wins vs CPU " + " · ".join(f"{gestures[m]} {stats.win_rate_vs(m):.0%}" for m in range(3))]
+        opener = stats.favorite_opener()
+        streaks = stats.streak_histogram()
+        runs = " ".join(f"{n}{'+' if n == MAX_STREAK else ''}×{count}"
+                        for n, count in enumerate(streaks) if n and count)
+        extra = f"Best streak {stats.best_streak}" + (f" ({runs})" if runs else "")
+        if opener is not None:
+            extra = f"Favorite opener: {gestures[opener[0]]} ({opener[1]:.0%}) · " + extra
+        lines.append(extra)
+        return "\n".join(lines)
+
+    def csv_rows(self):
+        gestures = [g.lower() for g in rps_engine.GESTURES]
+        header = (["player", "sessions", "rounds", "wins", "losses", "ties", "best_streak"]
+                  + [f"played_{g}" for g in gestures]
+                  + [f"opened_{g}" for g in gestures]
+                  + [f"win_rate_vs_{g}" for g in gestures]
+                  + [f"streak_{n}" for n in range(1, MAX_STREAK)] + [f"streak_{MAX_STREAK}_plus"])
+        yield header
+        for name in sorted(self.players):
+            stats = self.players[name]
+            yield ([name, stats.sessions, stats.rounds, stats.outcomes[rps_engine.WIN],
+                    stats.outcomes[rps_engine.LOSE], stats.outcomes[rps_engine.TIE], stats.best_streak]
+                   + stats.moves + stats.openers
+                   + [f"{stats.win_rate_vs(m):.4f}" for m in range(3)]
+                   + stats.streak_histogram()[1:])
+
+    def export_csv(self, path):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(self.csv_rows())
+
+
+def rebuild(path, limit=None, chunk_records=CHUNK_RECORDS):
+    """Analytics for the first `limit` records (default: all) of a history file."""
+    analytics = Analytics()
+    with rps_history.HistoryFile(path) as history:
+        names = history.players()
+        count = len(history) if limit is None else min(limit, len(history))
+        if np is None:
+            _rebuild_scalar(analytics, history.records, count, names, chunk_records)
+        else:
+            records = history.as_array()
+            try:
+                _rebuild_numpy(analytics, records, count, names, chunk_records)
+            finally:
+                del records
+    return analytics
+
+
+class BackgroundRebuild:
+    """rebuild() on a daemon thread, over the records the file holds when it starts.
+
+    Rounds flushed later are the ones the app is already counting live, so
+    stopping at `limit` lets the result be merged without counting twice.
+    Poll done() from the UI thread, then read result (or error).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with rps_history.HistoryFile(path) as history:
+            self.limit = len(history)
+        self.result = None
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name="rps-analytics", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            self.result = rebuild(self.path, self.limit)
+        except (OSError, ValueError) as e:
+            self.error = e
+
+    def done(self):
+        return not self._thread.is_alive()
+
+
+def _rebuild_scalar(analytics, records, count, names, chunk_records):
+    session = 0
+    record = analytics.record
+    for start in range(0, count, chunk_records):
+        for value in records[start:min(count, start + chunk_records)]:
+            if value >> 8 & rps_history.FLAG_SESSION_START:
+                analytics.begin_session(names[session] if session < len(names) else "")
+                session += 1
+            record(value & 3, value >> 2 & 3, value >> 4 & 3)
+
+
+def _rebuild_numpy(analytics, records, count, names, chunk_records):
+    ids = {}
+    session_starts = int(np.count_nonzero(records[:count] >> 8 & rps_history.FLAG_SESSION_START))
+    roster = [ids.setdefault(names[s] if s < len(names) else "", len(ids)) for s in range(session_starts)]
+    # Records before the first session start (a truncated file) form an unnamed session, as
+    # Analytics.record() starts one implicitly: index -1, with its first record as the opener.
+    roster.append(ids.setdefault("", len(ids)))
+    implicit_start = count > 0 and not records[0] >> 8 & rps_history.FLAG_SESSION_START
+    session_player = np.array(roster, dtype=np.intp)
+    players = len(ids)
+    moves = np.zeros(players * 3, dtype=np.int64)
+    outcomes = np.zeros(players * 3, dtype=np.int64)
+    rounds_vs = np.zeros(players * 3, dtype=np.int64)
+    wins_vs = np.zeros(players * 3, dtype=np.int64)
+    openers = np.zeros(players * 3, dtype=np.int64)
+    sessions = np.zeros(players, dtype=np.int64)
+    streaks = np.zeros(players * (MAX_STREAK + 1), dtype=np.int64)
+    best = np.zeros(players, dtype=np.int64)
+    carry, carry_player = 0, -1  # open win streak at the end of the previous chunk
+    sessions_before = 0
+
+    for start in range(0, count, chunk_records):
+        chunk = records[start:min(count, start + chunk_records)]
+        n = len(chunk)
+        player = (chunk & 3).astype(np.intp)
+        computer = (chunk >> 2 & 3).astype(np.intp)
+        outcome = (chunk >> 4 & 3).astype(np.intp)
+        begins = (chunk >> 8 & rps_history.FLAG_SESSION_START).astype(bool)
+        pid = session_player[sessions_before - 1 + np.cumsum(begins)]
+        sessions_before += int(np.count_nonzero(begins))
+        opens = begins
+        if start == 0 and implicit_start:
+            opens = begins.copy()
+            opens[0] = True
+
+        row = pid * 3
+        moves += np.bincount(row + player, minlength=players * 3)
+        outcomes += np.bincount(row + outcome, minlength=players * 3)
+        rounds_vs += np.bincount(row + computer, minlength=players * 3)
+        win = outcome == rps_engine.WIN
+        wins_vs += np.bincount((row + computer)[win], minlength=players * 3)
+        openers += np.bincount((row + player)[opens], minlength=players * 3)
+        sessions += np.bincount(pid[opens], minlength=players)
+
+        # Runs of wins, cut at losses, ties and session starts.
+        previous = np.empty(n, dtype=bool)
+        previous[0] = carry > 0
+        previous[1:] = win[:-1]
+        run_begins = np.flatnonzero(win & (~previous | begins))
+        following = np.empty(n, dtype=bool)
+        following[:-1] = win[1:] & ~begins[1:]
+        following[-1] = True  # a run reaching the end of the chunk stays open
+        run_ends = np.flatnonzero(win & ~following)
+        continues = bool(win[0] and carry > 0 and not begins[0])
+        if carry and not continues:
+            streaks[carry_player * (MAX_STREAK + 1) + min(carry, MAX_STREAK)] += 1
+        if continues:
+            run_begins = np.concatenate(([0], run_begins))
+        lengths = run_ends - run_begins[:len(run_ends)] + 1
+        if continues and len(run_ends):
+            lengths[0] += carry
+        if len(lengths):
+            owners = pid[run_ends]
+            streaks += np.bincount(owners * (MAX_STREAK + 1) + np.minimum(lengths, MAX_STREAK),
+                                   minlength=players * (MAX_STREAK + 1))
+            np.maximum.at(best, owners, lengths)
+        if win[-1]:
+            open_length = n - int(run_begins[-1])
+            if continues and len(run_begins) == 1:
+                open_length += carry
+            carry, carry_player = open_length, int(pid[-1])
+            best[carry_player] = max(best[carry_player], carry)
+        else:
+            carry, carry_player = 0, -1
+
+    for name, index in ids.items():
+        stats = analytics.player(name)
+        stats.moves = moves[index * 3:index * 3 + 3].tolist()
+        stats.outcomes = outcomes[index * 3:index * 3 + 3].tolist()
+        stats.rounds_vs = rounds_vs[index * 3:index * 3 + 3].tolist()
+        stats.wins_vs = wins_vs[index * 3:index * 3 + 3].tolist()
+        stats.openers = openers[index * 3:index * 3 + 3].tolist()
+        stats.sessions = int(sessions[index])
+        stats.streaks = streaks[index * (MAX_STREAK + 1):(index + 1) * (MAX_STREAK + 1)].tolist()
+        stats.best_streak = int(best[index])
+        if not stats.rounds and not stats.sessions:
+            del analytics.players[name]
+    if carry:
+        analytics.current = analytics.players[next(name for name, index in ids.items() if index == carry_player)]
+        analytics.current.current_streak = carry
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-player statistics from a match history file")
+    parser.add_argument("history", nargs="?", default="rps_history.bin")
+    parser.add_argument("--csv", metavar="PATH", help="write one row per player to PATH")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    analytics = rebuild(args.history)
+    elapsed = time.perf_counter() - start
+    rounds = sum(stats.rounds for stats in analytics.players.values())
+    for name in sorted(analytics.players):
+        print(f"[{name or 'unknown'}]")
+        print(analytics.summary(name))
+    print(f"{rounds:,} rounds in {elapsed * 1000:.1f} ms")
+    if args.csv:
+        analytics.export_csv(args.csv)
+        print(f"Wrote {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""Central frame clock for every animation in the game.
+
+All animations register a step callback with one FrameClock. The clock keeps
+at most one Tk `after` pending, scheduled for the earliest due animation, and
+drops an animation from its registry as soon as the callback reports that it
+has finished.
+
+Steps are derived from elapsed monotonic time: step n is the frame that is
+due interval * n after the animation started. A late tick, whether from a
+slow frame or a busy event loop, skips ahead to the current step instead of
+playing every frame late, so an animation lasts equally long on any machine.
+max_fps caps how often any animation is called. A capped animation still
+sees the correct step numbers, with gaps between them.
+"""
+
+import itertools
+import math
+import time
+from tkinter import TclError
+
+import rps_log
+
+log = rps_log.get_logger("anim")
+
+
+class FrameClock:
+    DEFAULT_MAX_FPS = 60
+    LOW_POWER_FPS = 15
+
+    def __init__(self, root, max_fps=DEFAULT_MAX_FPS):
+        self.root = root
+        self.animations = {}  # handle -> [callback, interval_s, start, next_due, last_step]
+        self._handles = itertools.count(1)
+        self._after_id = None
+        self._scheduled_for = None
+        self.set_max_fps(max_fps)
+        self.ticks = 0
+        self.completed = 0
+        self.frames = 0
+        self.dropped = 0
+        # Optional observer(start, end) called after every tick, in perf_counter seconds (see rps_trace).
+        self.frame_observer = None
+
+    def set_max_fps(self, max_fps):
+        """Cap callbacks at max_fps per animation (None or 0 removes the cap)."""
+        if max_fps is not None and max_fps < 0:
+            raise ValueError(f"max_fps must be 0 or more, not {max_fps}")
+        self.max_fps = max_fps
+
+    def add(self, callback, interval_ms, delay_ms=0):
+        """Register callback(step) to run every interval_ms until it returns False.
+
+        Returns a handle that can be passed to cancel().
+        """
+        handle = next(self._handles)
+        start = time.monotonic() + delay_ms / 1000
+        self.animations[handle] = [callback, max(interval_ms, 1) / 1000, start, start, -1]
+        self._schedule()
+        return handle
+
+    def cancel(self, handle):
+        if self.animations.pop(handle, None) is not None and not self.animations:
+            self._stop()
+
+    def cancel_all(self):
+        self.animations.clear()
+        self._stop()
+
+    def live_count(self):
+        return len(self.animations)
+
+    def is_live(self, handle):
+        return handle in self.animations
+
+    def stats(self):
+        return {"live": len(self.animations), "ticks": self.ticks, "completed": self.completed,
+                "frames": self.frames, "dropped": self.dropped, "max_fps": self.max_fps}
+
+    def _stop(self):
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except TclError:
+                pass
+        self._after_id = None
+        self._scheduled_for = None
+
+    def _schedule(self):
+        if not self.animations:
+            self._stop()
+            return
+        next_due = min(entry[3] for entry in self.animations.values())
+        if self._after_id is not None and self._scheduled_for <= next_due:
+            return
+        self._stop()
+        delay = max(0, math.ceil((next_due - time.monotonic()) * 1000))
+        try:
+            self._after_id = self.root.after(delay, self._tick)
+            self._scheduled_for = next_due
+        except TclError:
+            self._after_id = None
+
+    def _tick(self):
+        self._after_id = None
+        self._scheduled_for = None
+        self.ticks += 1
+        observer = self.frame_observer
+        tick_start = time.perf_counter() if observer is not None else 0
+        now = time.monotonic()
+        # Tk timers have millisecond resolution; treat anything due within 1 ms as due now.
+        horizon = now + 0.001
+        min_gap = 1 / self.max_fps if self.max_fps else 0
+        for handle, entry in list(self.animations.items()):
+            if entry[3] > horizon or handle not in self.animations:
+                continue
+            callback, interval, start, _, last_step = entry
+            step = max(last_step + 1, int((horizon - start) / interval))
+            self.dropped += step - last_step - 1
+            self.frames += 1
+            try:
+                keep_going = callback(step)
+            except TclError:
+                keep_going = False
+            except Exception as e:
+                log.error("Error in animation %s: %s", handle, e)
+                keep_going = False
+            if handle not in self.animations:
+                continue
+            if keep_going:
+                entry[4] = step
+                next_step = step + 1
+                earliest = now + min_gap
+                if start + next_step * interval < earliest:
+                    next_step = math.ceil((earliest - start) / interval - 1e-9)
+                entry[3] = start + next_step * interval
+            else:
+                del self.animations[handle]
+                self.completed += 1
+        if observer is not None:
+            observer(tick_start, time.perf_counter())
+        self._schedule()
+
+
+class TextReveal:
+    """Typewriter-style text reveal for any number of widgets from one driver.
+
+    Each target's prefixes are sliced once up front, and the visible length
+    is derived from elapsed time, so a late frame catches up instead of
+    stretching the reveal. Widgets are only reconfigured when the visible
+    prefix actually changes.
+    """
+
+    def __init__(self, clock, interval_ms=33):
+        self.clock = clock
+        self.interval_ms = interval_ms
+        self.targets = {}  # key -> [widget, prefixes, start_time, chars_per_second, shown]
+        self._handle = None
+
+    def reveal(self, key, widget, text, chars_per_second=20):
+        """Start revealing text on widget, replacing any reveal already running under key."""
+        prefixes = tuple(text[:i] for i in range(len(text) + 1))
+        widget.configure(text="")
+        self.targets[key] = [widget, prefixes, time.monotonic(), chars_per_second, 0]
+        if self._handle is None or not self.clock.is_live(self._handle):
+            self._handle = self.clock.add(self._step, self.interval_ms)
+
+    def cancel(self, key):
+        """Stop revealing key, leaving whatever prefix is currently shown."""
+        self.targets.pop(key, None)
+
+    def finish(self, key):
+        target = self.targets.pop(key, None)
+        if target is not None:
+            try:
+                target[0].configure(text=target[1][-1])
+            except TclError:
+                pass
+
+    def is_active(self, key):
+        return key in self.targets
+
+    def _step(self, step):
+        now = time.monotonic()
+        for key, target in list(self.targets.items()):
+            widget, prefixes, start, chars_per_second, shown = target
+            last = len(prefixes) - 1
+            index = min(last, int((now - start) * chars_per_second) + 1)
+            if index != shown:
+                try:
+                    widget.configure(text=prefixes[index])
+                except TclError:
+                    del self.targets[key]
+                    continue
+                target[4] = index
+            if index == last:
+                del self.targets[key]
+        if not self.targets:
+            self._handle = None
+            return False
+        return True
+
+
+def _hex_to_rgb(color):
+    color = color.lstrip("#")
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def pulse_palette(base_color, glow_color, period=20):
+    """Colors for one sine pulse from base_color to glow_color and back.
+
+    Entry i is the color at step i of a pulse lasting `period` steps, so a
+    pulse animation can cycle through it with palette[step % period].
+    """
+    base = _hex_to_rgb(base_color)
+    glow = _hex_to_rgb(glow_color)
+    palette = []
+    for step in range(period):
+        t = 0.5 - 0.5 * math.cos(2 * math.pi * step / period)
+        palette.append("#" + "".join(f"{round(b + (g - b) * t):02x}" for b, g in zip(base, glow)))
+    return tuple(palette)
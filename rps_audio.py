@@ -0,0 +1,254 @@
+"""Background audio service for Rock Paper Scissors Deluxe.
+
+pygame is imported, the mixer initialized and every asset decoded on a
+worker thread, so the window can show its first frame straight away. The UI
+thread only ever puts commands on a queue. Commands issued before the mixer
+is ready simply wait in that queue and run once loading finishes.
+
+Sound effects live in a SoundBank: every effect is decoded into memory up
+front and played on a fixed pool of reserved channels for its category, so
+overlapping clicks never compete with stingers for a channel.
+"""
+
+import queue
+import threading
+import time
+
+import rps_log
+
+log = rps_log.get_logger("audio")
+
+_STOP = object()
+
+# Reserved channels per effect category.
+DEFAULT_POOLS = {"ui": 3, "stinger": 2}
+
+
+class _Voice:
+    __slots__ = ("channel", "effect", "started")
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.effect = None
+        self.started = 0.0
+
+
+class _Effect:
+    __slots__ = ("name", "sound", "category", "max_voices")
+
+    def __init__(self, name, sound, category, max_voices):
+        self.name = name
+        self.sound = sound
+        self.category = category
+        self.max_voices = max_voices
+
+
+class SoundBank:
+    """Pre-decoded effects played on reserved per-category channel pools.
+
+    An effect never plays on more than max_voices channels at once; past
+    that limit its oldest voice is restarted. When every channel in a
+    category is busy, the oldest voice in the pool is stolen.
+    """
+
+    def __init__(self, mixer, pools=None):
+        self.mixer = mixer
+        pools = dict(DEFAULT_POOLS if pools is None else pools)
+        total = sum(pools.values())
+        # Keep a couple of unreserved channels for anything played ad hoc.
+        if mixer.get_num_channels() < total + 2:
+            mixer.set_num_channels(total + 2)
+        mixer.set_reserved(total)
+        self.pools = {}
+        first = 0
+        for category, count in pools.items():
+            self.pools[category] = [_Voice(mixer.Channel(first + i)) for i in range(count)]
+            first += count
+        self.effects = {}
+        self.stats = {"plays": 0, "steals": 0, "voice_limited": 0, "unknown": 0}
+
+    def load(self, name, path, category="ui", max_voices=1, volume=1.0):
+        if category not in self.pools:
+            raise ValueError(f"Unknown sound category '{category}'")
+        sound = self.mixer.Sound(path)
+        sound.set_volume(volume)
+        self.effects[name] = _Effect(name, sound, category, max_voices)
+        return sound
+
+    def play(self, name):
+        effect = self.effects.get(name)
+        if effect is None:
+            self.stats["unknown"] += 1
+            return None
+        now = time.monotonic()
+        free = None
+        oldest = None
+        oldest_same = None
+        same_voices = 0
+        for voice in self.pools[effect.category]:
+            if not voice.channel.get_busy():
+                if free is None:
+                    free = voice
+                continue
+            if oldest is None or voice.started < oldest.started:
+                oldest = voice
+            if voice.effect is effect:
+                same_voices += 1
+                if oldest_same is None or voice.started < oldest_same.started:
+                    oldest_same = voice
+        if same_voices >= effect.max_voices:
+            target = oldest_same
+            self.stats["voice_limited"] += 1
+        elif free is not None:
+            target = free
+        else:
+            target = oldest
+            self.stats["steals"] += 1
+        target.channel.play(effect.sound)
+        target.effect = effect
+        target.started = now
+        self.stats["plays"] += 1
+        return target.channel
+
+
+class AudioService:
+    # One-shot effects that waited longer than this for the mixer are dropped
+    # rather than played late; music requests are always honored.
+    MAX_EFFECT_DELAY = 0.3
+
+    def __init__(self, effects, music=None, music_volume=0.2, pools=None):
+        # effects: {name: (path, category, max_voices)}
+        self.effects = dict(effects)
+        self.pools = pools
+        self.music_path = music
+        self.music_volume = music_volume
+        self.bank = None
+        self.music_loaded = False
+        self.music_playing = False
+        self.ready = threading.Event()
+        self.commands = queue.SimpleQueue()
+        self.metrics = {
+            "import_ms": None,
+            "mixer_init_ms": None,
+            "decode_ms": {},
+            "ready_ms": None,
+            "queued_before_ready": 0,
+            "dropped_late": 0,
+            "played": 0,
+        }
+        self._pygame = None
+        self._thread = None
+        self._started_at = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="rps-audio", daemon=True)
+        self._thread.start()
+
+    def is_ready(self):
+        return self.ready.is_set()
+
+    def play(self, name):
+        self._submit(("play", name, time.monotonic()))
+
+    def play_music(self):
+        self._submit(("music_play", None, None))
+
+    def stop_music(self):
+        self._submit(("music_stop", None, None))
+
+    def shutdown(self, timeout=1.0):
+        if self._thread is None:
+            return
+        self.commands.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _submit(self, command):
+        if not self.ready.is_set():
+            self.metrics["queued_before_ready"] += 1
+        self.commands.put(command)
+
+    def _elapsed_ms(self, since):
+        return (time.perf_counter() - since) * 1000
+
+    def _run(self):
+        self._load()
+        self.metrics["ready_ms"] = self._elapsed_ms(self._started_at)
+        self.ready.set()
+        log.info("Audio ready after %.0f ms", self.metrics['ready_ms'])
+        while True:
+            command = self.commands.get()
+            if command is _STOP:
+                break
+            self._execute(*command)
+        self._stop_music_now()
+
+    def _load(self):
+        start = time.perf_counter()
+        try:
+            import pygame
+        except ImportError as e:
+            log.warning("pygame not available, audio disabled: %s", e)
+            return
+        self.metrics["import_ms"] = self._elapsed_ms(start)
+
+        start = time.perf_counter()
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            log.error("Error initializing pygame.mixer: %s", e)
+            return
+        self.metrics["mixer_init_ms"] = self._elapsed_ms(start)
+        self._pygame = pygame
+
+        self.bank = SoundBank(pygame.mixer, self.pools)
+        for name, (path, category, max_voices) in self.effects.items():
+            start = time.perf_counter()
+            try:
+                self.bank.load(name, path, category, max_voices)
+                self.metrics["decode_ms"][name] = self._elapsed_ms(start)
+                log.debug("Sound '%s' loaded", name)
+            except (pygame.error, FileNotFoundError) as e:
+                log.error("Error loading sound '%s': %s, skipping sound", path, e)
+
+        if self.music_path:
+            start = time.perf_counter()
+            try:
+                pygame.mixer.music.load(self.music_path)
+                pygame.mixer.music.set_volume(self.music_volume)
+                self.music_loaded = True
+                self.metrics["decode_ms"]["music"] = self._elapsed_ms(start)
+            except (pygame.error, FileNotFoundError) as e:
+                log.error("Error loading background music '%s': %s, skipping music", self.music_path, e)
+
+    def _execute(self, action, name, issued_at):
+        if self._pygame is None:
+            return
+        try:
+            if action == "play":
+                if time.monotonic() - issued_at > self.MAX_EFFECT_DELAY:
+                    self.metrics["dropped_late"] += 1
+                    return
+                if self.bank.play(name) is not None:
+                    self.metrics["played"] += 1
+            elif action == "music_play" and self.music_loaded:
+                self._pygame.mixer.music.play(-1)
+                self.music_playing = True
+                log.debug("Background music started")
+            elif action == "music_stop":
+                self._stop_music_now()
+        except self._pygame.error as e:
+            log.error("Error in audio command %s: %s", action, e)
+
+    def _stop_music_now(self):
+        if self._pygame is None or not self.music_playing:
+            return
+        try:
+            self._pygame.mixer.music.stop()
+            self.music_playing = False
+            log.debug("Background music stopped")
+        except self._pygame.error as e:
+            log.error("Error stopping background music: %s", e)
@@ -0,0 +1,180 @@
+"""Headless batch play: player moves stream in, outcomes and running scores stream out.
+
+    python rps_cli.py [INPUT] [--format lines|packed] [--opponent NAME] [--seed N]
+                      [--match-rounds N] [--output rounds|matches|none] [--chunk-size BYTES]
+
+INPUT is a file, or stdin when omitted or "-". Formats:
+    lines   one move per line: R/P/S, rock/paper/scissors (any case) or 0/1/2; blank lines are skipped
+    packed  one byte per move: 0x00-0x02 or one of RPSrps; whitespace is ignored
+
+Each round is written to stdout as "<player><computer> <W|L|T> <wins> <losses> <ties>", e.g.
+"RS W 3 1 0", with the scores counted over the current match. With --match-rounds N the
+stream is cut into matches of N rounds, scored by rps_engine.MatchState as in the app,
+and each match ends with "= <win|lose|tie> <wins> <losses> <ties>". Invalid moves are
+skipped and counted. The totals and rounds/sec go to stderr.
+
+Input is read in fixed-size chunks and flows through generators (chunks -> move codes ->
+output text), so memory stays constant however long the stream is. The opponent is any
+rps_opponent difficulty or strategy. A difficulty with --seed S plays the same moves as
+the app's session with seed S. This tool never imports customtkinter, pygame or NumPy,
+so it starts in milliseconds.
+"""
+
+import argparse
+import sys
+import time
+
+import rps_engine
+import rps_opponent
+import rps_replay
+
+CHUNK_SIZE = 1 << 16
+MAX_LINE = 64
+OUTCOME_LETTERS = "TWL"  # indexed by rps_engine outcome code
+WINNER_WORDS = {"You": "win", "Computer": "lose"}
+LINE_CODES = {}
+for _code, _gesture in enumerate(rps_engine.GESTURES):
+    for _token in (_gesture, _gesture[0], str(_code)):
+        LINE_CODES[_token.lower().encode()] = _code
+# packed: RPSrps and 0x00-0x02 become codes 0-2, whitespace is dropped, anything else is > 2.
+PACKED_TABLE = bytes.maketrans(b"RPSrps", b"\x00\x01\x02\x00\x01\x02")
+WHITESPACE = b" \t\r\n\f\v"
+INVALID_BYTES = bytes(range(3, 256))
+
+
+def read_chunks(stream, chunk_size=CHUNK_SIZE):
+    return iter(lambda: stream.read(chunk_size), b"")
+
+
+def parse_lines(chunks, stats):
+    """Move codes (as bytes) from newline-separated tokens; a line split across chunks is carried over.
+
+    A line longer than MAX_LINE counts as one invalid move, and the rest of it is skipped up to its newline.
+    """
+    tail = b""
+    discarding = False
+    for chunk in chunks:
+        if discarding:
+            newline = chunk.find(b"\n")
+            if newline < 0:
+                continue
+            chunk = chunk[newline + 1:]
+            discarding = False
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        if len(tail) > MAX_LINE:
+            stats["invalid"] += 1
+            tail = b""
+            discarding = True
+        yield _line_codes(lines, stats)
+    if tail:
+        yield _line_codes([tail], stats)
+
+
+def _line_codes(lines, stats):
+    codes = bytearray()
+    get = LINE_CODES.get
+    for line in lines:
+        token = line.strip()
+        if not token:
+            continue
+        code = get(token.lower())
+        if code is None:
+            stats["invalid"] += 1
+        else:
+            codes.append(code)
+    return codes
+
+
+def parse_packed(chunks, stats):
+    for chunk in chunks:
+        codes = chunk.translate(PACKED_TABLE, WHITESPACE)
+        valid = codes.translate(None, INVALID_BYTES)
+        stats["invalid"] += len(codes) - len(valid)
+        yield valid
+
+
+def play(code_chunks, opponent, stats, match_rounds=0, output="rounds"):
+    """Resolve every move against `opponent`; yields one string of output per input chunk."""
+    next_move, observe = opponent.next_move, opponent.observe
+    table = [rps_engine.OUTCOME_TABLE[p][c] for p in range(3) for c in range(3)]
+    pairs = [rps_engine.GESTURES[p][0] + rps_engine.GESTURES[c][0] for p in range(3) for c in range(3)]
+    letters = OUTCOME_LETTERS
+    state = rps_engine.MatchState(match_rounds) if match_rounds else None
+    scores = [0, 0, 0]  # this match, by outcome code
+    totals = stats["outcomes"]
+    rounds = output == "rounds"
+    for codes in code_chunks:
+        out = []
+        for player in codes:
+            computer = next_move()
+            index = player * 3 + computer
+            outcome = table[index]
+            observe(player, computer)
+            scores[outcome] += 1
+            totals[outcome] += 1
+            if rounds:
+                out.append(f"{pairs[index]} {letters[outcome]} {scores[1]} {scores[2]} {scores[0]}\n")
+            if state is not None:
+                state.record(outcome)
+                if not state.advance():
+                    stats["matches"] += 1
+                    if output != "none":
+                        out.append(f"= {WINNER_WORDS.get(state.winner(), 'tie')} {scores[1]} {scores[2]} {scores[0]}\n")
+                    state.reset()
+                    scores = [0, 0, 0]
+        stats["rounds"] += len(codes)
+        yield "".join(out)
+
+
+def make_opponent(name, seed):
+    rng = rps_replay.SessionRNG(seed).logic
+    if name in rps_opponent.DIFFICULTIES:
+        return rps_opponent.make_opponent(name, rng)
+    return rps_opponent.STRATEGIES[name](rng)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play Rock Paper Scissors headless from a stream of moves")
+    parser.add_argument("input", nargs="?", default="-", help="moves file, or - for stdin")
+    parser.add_argument("--format", choices=("lines", "packed"), default="lines")
+    parser.add_argument("--opponent", default=rps_opponent.DEFAULT_DIFFICULTY,
+                        choices=sorted(set(rps_opponent.DIFFICULTIES) | set(rps_opponent.STRATEGIES)))
+    parser.add_argument("--seed", type=int, default=0, help="session seed for the opponent")
+    parser.add_argument("--match-rounds", type=int, default=0, help="rounds per match (0: one endless match)")
+    parser.add_argument("--output", choices=("rounds", "matches", "none"), default="rounds")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="bytes read at a time")
+    args = parser.parse_args(argv)
+    if args.match_rounds < 0:
+        parser.error("--match-rounds must be 0 or more")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    stats = {"rounds": 0, "invalid": 0, "matches": 0, "outcomes": [0, 0, 0]}
+    stream = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    parse = parse_packed if args.format == "packed" else parse_lines
+    write = sys.stdout.write
+    start = time.perf_counter()
+    try:
+        codes = parse(read_chunks(stream, args.chunk_size), stats)
+        for text in play(codes, make_opponent(args.opponent, args.seed), stats, args.match_rounds, args.output):
+            if text:
+                write(text)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        sys.stderr.close()  # e.g. piped into head; nothing more to report
+        return 0
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+    elapsed = time.perf_counter() - start
+    ties, wins, losses = stats["outcomes"]
+    print(f"{stats['rounds']:,} rounds vs {args.opponent} (seed {args.seed}): {wins} W / {losses} L / {ties} T"
+          + (f", {stats['matches']} matches" if args.match_rounds else "")
+          + (f", {stats['invalid']} invalid moves skipped" if stats["invalid"] else "")
+          + f" in {elapsed:.3f} s ({stats['rounds'] / elapsed if elapsed else 0:,.0f} rounds/sec)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
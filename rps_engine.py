@@ -0,0 +1,149 @@
+"""Headless round-resolution engine for Rock Paper Scissors Deluxe.
+
+Gestures are small integers and every outcome comes from one precomputed
+3x3 table, so a round can be resolved without a Tk window. resolve_batch
+resolves whole arrays of rounds at once with NumPy when it is installed.
+NumPy is imported on the first batch call, not with the module: it costs
+about 100 ms, which per-round users such as rps_cli never need to pay.
+"""
+
+from array import array
+
+ROCK, PAPER, SCISSORS = 0, 1, 2
+GESTURES = ("Rock", "Paper", "Scissors")
+GESTURE_CODES = {name: code for code, name in enumerate(GESTURES)}
+
+# Outcomes are always from the player's point of view.
+TIE, WIN, LOSE = 0, 1, 2
+OUTCOME_NAMES = ("tie", "win", "lose")
+
+# OUTCOME_TABLE[player][computer]; (player - computer) % 3 gives 0 tie, 1 win, 2 lose.
+OUTCOME_TABLE = tuple(tuple((p - c) % 3 for c in range(3)) for p in range(3))
+_FLAT_TABLE = bytes(OUTCOME_TABLE[p][c] for p in range(3) for c in range(3))
+
+# COUNTER_MOVE[g] is the gesture that beats g.
+COUNTER_MOVE = (PAPER, SCISSORS, ROCK)
+
+_np = False  # not imported yet
+_NP_TABLE = None
+
+
+def _numpy():
+    """The numpy module, or None when it is not installed."""
+    global _np, _NP_TABLE
+    if _np is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        if numpy is not None:
+            _NP_TABLE = numpy.frombuffer(_FLAT_TABLE, dtype=numpy.uint8)
+        _np = numpy
+    return _np
+
+
+def __getattr__(name):
+    # rps_engine.np stays available as an attribute, resolved on first access.
+    if name == "np":
+        return _numpy()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def encode(gesture):
+    return GESTURE_CODES[gesture]
+
+
+def decode(code):
+    return GESTURES[code]
+
+
+def resolve(player, computer):
+    return _FLAT_TABLE[player * 3 + computer]
+
+
+def resolve_names(player_choice, computer_choice):
+    return _FLAT_TABLE[GESTURE_CODES[player_choice] * 3 + GESTURE_CODES[computer_choice]]
+
+
+def resolve_batch(players, computers):
+    """Resolve many rounds at once.
+
+    Takes two equal-length sequences of gesture codes and returns an array of
+    outcome codes: a NumPy uint8 array when NumPy is available, otherwise an
+    array('B').
+    """
+    np = _numpy()
+    if np is not None:
+        p = np.asarray(players, dtype=np.uint8)
+        c = np.asarray(computers, dtype=np.uint8)
+        if p.shape != c.shape:
+            raise ValueError("players and computers must have the same length")
+        return _NP_TABLE[p * np.uint8(3) + c]
+    if len(players) != len(computers):
+        raise ValueError("players and computers must have the same length")
+    table = _FLAT_TABLE
+    return array("B", [table[p * 3 + c] for p, c in zip(players, computers)])
+
+
+def tally(outcomes):
+    """Return (ties, player_wins, computer_wins) for a sequence of outcomes."""
+    np = _numpy()
+    if np is not None:
+        counts = np.bincount(np.asarray(outcomes, dtype=np.uint8), minlength=3)
+        return int(counts[TIE]), int(counts[WIN]), int(counts[LOSE])
+    counts = [0, 0, 0]
+    for outcome in outcomes:
+        counts[outcome] += 1
+    return counts[TIE], counts[WIN], counts[LOSE]
+
+
+def match_winner(round_wins):
+    """Map a {'player': n, 'computer': m} tally to the end-of-game winner string."""
+    if round_wins['player'] > round_wins['computer']:
+        return "You"
+    if round_wins['computer'] > round_wins['player']:
+        return "Computer"
+    return "It's a Tie"
+
+
+class MatchState:
+    """Round bookkeeping for one match, mirroring the app's score fields."""
+
+    __slots__ = ("max_rounds", "player_score", "computer_score", "current_round", "round_wins")
+
+    def __init__(self, max_rounds=5):
+        self.max_rounds = max_rounds
+        self.reset()
+
+    def reset(self):
+        self.player_score = 0
+        self.computer_score = 0
+        self.current_round = 1
+        self.round_wins = {'player': 0, 'computer': 0}
+
+    def record(self, outcome):
+        if outcome == WIN:
+            self.player_score += 1
+            self.round_wins['player'] += 1
+        elif outcome == LOSE:
+            self.computer_score += 1
+            self.round_wins['computer'] += 1
+        return outcome
+
+    def play_round(self, player, computer):
+        return self.record(resolve(player, computer))
+
+    def is_over(self):
+        return self.current_round >= self.max_rounds
+
+    def advance(self):
+        """Move to the next round. Returns False once the match is finished."""
+        if self.is_over():
+            return False
+        self.current_round += 1
+        self.player_score = 0
+        self.computer_score = 0
+        return True
+
+    def winner(self):
+        return match_winner(self.round_wins)
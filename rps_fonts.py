@@ -0,0 +1,85 @@
+"""Shared cache of Tk font objects for animated text.
+
+Animations that pulse a font size used to hand Tk a fresh ("Arial", size)
+tuple every frame, which Tk resolves into a new font each time. FontCache
+maps a font spec such as ("Impact", 16, "bold") to one named font object
+that is created once and then reused. prepare() creates the sizes an
+animation can reach before it starts, so its frames only do lookups. At most
+max_fonts fonts are kept; the least recently used one is released first.
+Tk keeps a released named font alive for as long as a widget still shows it.
+"""
+
+from collections import OrderedDict
+
+DEFAULT_MAX_FONTS = 48
+
+
+def pulse_sizes(base, amplitude):
+    """Every size int(base * (1 + amplitude * s)) reaches for s in [-1, 1]."""
+    return range(int(base * (1 - amplitude)), int(base * (1 + amplitude)) + 1)
+
+
+def split_spec(spec):
+    """(family, size, weight, slant) from a Tk font tuple like ("Impact", 16, "bold")."""
+    family, size, *style = spec
+    return family, int(size), "bold" if "bold" in style else "normal", "italic" if "italic" in style else "roman"
+
+
+def tk_font_factory(root=None):
+    def create(name, family, size, weight, slant):
+        import tkinter.font
+        return tkinter.font.Font(root=root, name=name, family=family, size=size, weight=weight, slant=slant)
+    return create
+
+
+def ctk_font_factory():
+    """CTkFont objects, which CustomTkinter widgets need instead of plain Tk fonts."""
+    def create(name, family, size, weight, slant):
+        import customtkinter
+        return customtkinter.CTkFont(family=family, size=size, weight=weight, slant=slant)
+    return create
+
+
+class FontCache:
+    def __init__(self, factory=None, max_fonts=DEFAULT_MAX_FONTS, prefix="rps"):
+        self.factory = factory if factory is not None else tk_font_factory()
+        self.max_fonts = max_fonts
+        self.prefix = prefix
+        self.fonts = OrderedDict()  # spec -> font, least recently used first
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def _name(self, spec):
+        return "-".join([self.prefix] + [str(part).replace(" ", "_") for part in spec])
+
+    def _create(self, spec):
+        font = self.factory(self._name(spec), *split_spec(spec))
+        self.fonts[spec] = font
+        while len(self.fonts) > self.max_fonts:
+            self.fonts.popitem(last=False)
+            self.stats["evictions"] += 1
+        return font
+
+    def get(self, spec):
+        """The font for `spec`, created on first use."""
+        font = self.fonts.get(spec)
+        if font is None:
+            self.stats["misses"] += 1
+            return self._create(spec)
+        self.stats["hits"] += 1
+        self.fonts.move_to_end(spec)
+        return font
+
+    def prepare(self, specs):
+        """Create any missing fonts in `specs` ahead of the animation that uses them."""
+        for spec in specs:
+            if spec in self.fonts:
+                self.fonts.move_to_end(spec)
+            else:
+                self._create(spec)
+
+    def sizes(self, family, sizes, *style):
+        """Specs for one family/style over a range of sizes, for prepare()."""
+        return [(family, size, *style) for size in sizes]
+
+    def clear(self):
+        self.fonts.clear()
@@ -0,0 +1,232 @@
+"""Compact match history: one packed 32-bit record per round.
+
+Record layout (little-endian uint32):
+    bits 0-1    player move (rps_engine gesture code)
+    bits 2-3    computer move
+    bits 4-5    outcome (rps_engine outcome code)
+    bits 8-15   flags (FLAG_SESSION_START marks the first round of a session)
+    bits 16-31  milliseconds since the previous round, saturating at 65535
+
+MatchHistory buffers records in an array('I') and appends them to a binary
+file with a small header; after each flush the buffer is emptied, so memory
+stays constant however long a session runs. HistoryFile memory-maps that
+file and exposes the records zero-copy.
+
+Player names are kept out of the records: each session's player is appended
+as one line to a roster file next to the history (PATH + ".players"), in
+session order, so the n-th FLAG_SESSION_START record belongs to line n.
+Sessions recorded before the roster existed get blank lines (an unknown
+player) the first time a MatchHistory writes to it.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+
+import rps_log
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+log = rps_log.get_logger("history")
+
+MAGIC = b"RPSH"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")  # magic, version, record size
+RECORD_SIZE = 4
+FLAG_SESSION_START = 0x01
+MAX_DELTA_MS = 0xFFFF
+ROSTER_SUFFIX = ".players"
+
+
+def pack(player, computer, outcome, delta_ms=0, flags=0):
+    return player | computer << 2 | outcome << 4 | flags << 8 | min(int(delta_ms), MAX_DELTA_MS) << 16
+
+
+def unpack(record):
+    """Return (player, computer, outcome, delta_ms, flags)."""
+    return record & 3, record >> 2 & 3, record >> 4 & 3, record >> 16, record >> 8 & 0xFF
+
+
+def count_session_starts(path):
+    """Number of FLAG_SESSION_START records in a history file (0 if it is missing or empty)."""
+    try:
+        history = HistoryFile(path)
+    except (FileNotFoundError, ValueError):
+        return 0
+    with history:
+        if np is not None:
+            records = history.as_array()
+            count = int(np.count_nonzero(records >> 8 & FLAG_SESSION_START))
+            del records
+            return count
+        return sum(1 for record in history.records if record >> 8 & FLAG_SESSION_START)
+
+
+def _native_records(records):
+    if sys.byteorder != "little":
+        records = array("I", records)
+        records.byteswap()
+    return records
+
+
+class MatchHistory:
+    def __init__(self, path="rps_history.bin", flush_every=256):
+        self.path = path
+        self.flush_every = flush_every
+        self.buffer = array("I")
+        self.rounds_recorded = 0
+        self.rounds_flushed = 0
+        self._last_time = None
+        self._pending_flags = FLAG_SESSION_START
+        self._pending_player = ""
+        self.roster = []  # players of the sessions started in the buffer
+        self._roster_aligned = False
+
+    def begin_session(self, player=None):
+        self._pending_flags = FLAG_SESSION_START
+        self._pending_player = player or ""
+        self._last_time = None
+
+    def record(self, player, computer, outcome):
+        now = time.monotonic()
+        delta_ms = 0 if self._last_time is None else (now - self._last_time) * 1000
+        self._last_time = now
+        if self._pending_flags & FLAG_SESSION_START:
+            self.roster.append(self._pending_player)
+        self.buffer.append(pack(player, computer, outcome, delta_ms, self._pending_flags))
+        self._pending_flags = 0
+        self.rounds_recorded += 1
+        if len(self.buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return 0
+        try:
+            if self.roster and not self._roster_aligned:
+                self._align_roster()
+            # A file shorter than its header (a crash during the first write) holds no records yet.
+            new_file = not os.path.exists(self.path) or os.path.getsize(self.path) < HEADER.size
+            with open(self.path, "ab") as f:
+                if new_file:
+                    f.truncate(0)
+                    f.write(HEADER.pack(MAGIC, VERSION, RECORD_SIZE))
+                f.write(_native_records(self.buffer).tobytes())
+            if self.roster:
+                with open(self.path + ROSTER_SUFFIX, "a", encoding="utf-8", newline="") as f:
+                    f.write("".join(name.replace("\r", " ").replace("\n", " ") + "\n" for name in self.roster))
+        except OSError as e:
+            log.error("Error writing match history '%s': %s", self.path, e)
+            return 0
+        written = len(self.buffer)
+        self.rounds_flushed += written
+        # Reallocate rather than del buffer[:] so a long burst cannot pin a large allocation.
+        self.buffer = array("I")
+        self.roster = []
+        return written
+
+    def _align_roster(self):
+        """Pad the roster with blank names up to the sessions already in the history file."""
+        sessions = count_session_starts(self.path)
+        roster_path = self.path + ROSTER_SUFFIX
+        try:
+            with open(roster_path, encoding="utf-8", newline="") as f:
+                names = f.read().count("\n")
+        except FileNotFoundError:
+            names = 0
+        if names < sessions:
+            with open(roster_path, "a", encoding="utf-8", newline="") as f:
+                f.write("\n" * (sessions - names))
+        self._roster_aligned = True
+
+    def buffer_bytes(self):
+        return self.buffer.buffer_info()[1] * self.buffer.itemsize
+
+
+class HistoryFile:
+    """Read-only, memory-mapped view of a history file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._map = None  # empty file
+        self._views = []
+        self.records = memoryview(b"").cast("I")
+        if self._map is None:
+            return
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"'{path}' has a truncated history header")
+        magic, version, record_size = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or record_size != RECORD_SIZE:
+            self.close()
+            raise ValueError(f"'{path}' is not a match history file")
+        if sys.byteorder != "little":
+            self.close()
+            raise ValueError("memory-mapped history reading needs a little-endian machine")
+        whole = memoryview(self._map)
+        usable = (len(whole) - HEADER.size) // RECORD_SIZE * RECORD_SIZE
+        body = whole[HEADER.size:HEADER.size + usable]
+        self.records = body.cast("I")
+        self._views = [self.records, body, whole]
+
+    def __len__(self):
+        return len(self.records)
+
+    def players(self):
+        """Player name of every recorded session, in session order ("" when unknown)."""
+        try:
+            with open(self.path + ROSTER_SUFFIX, encoding="utf-8", newline="") as f:
+                lines = f.read().split("\n")
+        except FileNotFoundError:
+            return []
+        lines.pop()  # after the final newline
+        return [line[:-1] if line.endswith("\r") else line for line in lines]
+
+    def __getitem__(self, index):
+        return unpack(self.records[index])
+
+    def __iter__(self):
+        for record in self.records:
+            yield unpack(record)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def as_array(self):
+        """Zero-copy NumPy uint32 view of the records (needs NumPy).
+
+        The array borrows the mapping, so drop it before calling close().
+        """
+        return np.frombuffer(self.records, dtype="<u4")
+
+    def outcome_counts(self):
+        """(ties, player_wins, computer_wins) over the whole file."""
+        if np is not None:
+            counts = np.bincount((self.as_array() >> 4) & 3, minlength=3)
+            return int(counts[0]), int(counts[1]), int(counts[2])
+        counts = [0, 0, 0, 0]
+        for record in self.records:
+            counts[record >> 4 & 3] += 1
+        return counts[0], counts[1], counts[2]
+
+    def close(self):
+        for view in self._views:
+            view.release()
+        self._views = []
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
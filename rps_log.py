@@ -0,0 +1,204 @@
+"""Leveled, buffered logging for the app and its services.
+
+Each subsystem has its own named logger (get_logger("ui"), "audio", ...).
+Messages take %-style arguments and are formatted later, so a call such as
+
+    log.debug("Score updated: You=%s, CPU=%s", player, computer)
+
+costs one no-op call while DEBUG is off: set_level() rebinds each level
+method to a function that does nothing. Enabled records are appended as
+tuples to a bounded ring buffer. A daemon thread formats them and writes
+them in one batch every FLUSH_INTERVAL seconds, or sooner once the ring
+is half full or an ERROR is logged.
+Neither the Tk thread nor a round's result ever waits on the terminal or
+pipe. If the ring fills faster than it drains, the oldest records are
+dropped and counted. Pass values that will not change (numbers, strings),
+because arguments are read when the record is written, not when it is
+logged.
+
+INFO is the default level and keeps lifecycle messages and errors. DEBUG
+also gives the per-round and per-widget trace the app used to print.
+"""
+
+import atexit
+import collections
+import sys
+import threading
+import time
+
+DEBUG, INFO, WARNING, ERROR = 10, 20, 30, 40
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR}
+LEVEL_NAMES = {level: name.upper() for name, level in LEVELS.items()}
+DEFAULT_LEVEL = INFO
+RING_SIZE = 4096
+FLUSH_INTERVAL = 0.2
+
+
+def _off(message, *args):
+    pass
+
+
+class LogBuffer:
+    """Ring of pending records and the thread that writes them out."""
+
+    def __init__(self, stream=None, capacity=RING_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.stream = stream
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.ring = collections.deque(maxlen=capacity)
+        self.high_water = capacity // 2
+        self.wake = threading.Event()
+        self.started_at = time.perf_counter()
+        self.stats = {"records": 0, "dropped": 0, "flushes": 0}
+        self._write_lock = threading.Lock()
+        self._unreported = 0  # dropped since the last "records dropped" line
+        self._thread = None
+        self._closed = False
+
+    def append(self, record):
+        ring = self.ring
+        size = len(ring)
+        if size >= self.high_water:
+            if size == self.capacity:
+                self.stats["dropped"] += 1
+                self._unreported += 1
+            self.wake.set()
+        ring.append(record)
+        if self._thread is None:
+            if self._closed:
+                self.flush()  # after shutdown: write straight through
+            else:
+                self.start()
+
+    def start(self):
+        with self._write_lock:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name="rps-log", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self):
+        while not self._closed:
+            self.wake.wait(self.flush_interval)
+            self.wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Format and write everything pending; safe from any thread."""
+        with self._write_lock:
+            ring = self.ring
+            lines = []
+            started_at = self.started_at
+            try:
+                while True:
+                    when, level, name, message, args = ring.popleft()
+                    if args:
+                        try:
+                            message = message % args
+                        except (TypeError, ValueError) as e:
+                            message = f"{message} {args!r} (bad log arguments: {e})"
+                    lines.append(f"{when - started_at:9.3f} {LEVEL_NAMES[level]:<7} {name}: {message}\n")
+            except IndexError:
+                pass
+            dropped = self._unreported
+            if dropped:
+                self._unreported -= dropped
+                lines.append(f"{time.perf_counter() - started_at:9.3f} WARNING log: {dropped} records dropped, ring full\n")
+            if not lines:
+                return
+            self.stats["records"] += len(lines)
+            self.stats["flushes"] += 1
+            stream = self.stream or sys.stdout
+            try:
+                stream.write("".join(lines))
+                stream.flush()
+            except (OSError, ValueError):
+                pass  # closed or broken stream; nothing sensible to report to
+
+    def close(self):
+        self._closed = True
+        self.wake.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(1.0)
+        self.flush()
+
+
+class Logger:
+    def __init__(self, name, buffer, level=DEFAULT_LEVEL):
+        self.name = name
+        self.buffer = buffer
+        self.set_level(level)
+
+    def set_level(self, level):
+        self.level = level
+        for method, method_level in (("debug", DEBUG), ("info", INFO), ("warning", WARNING), ("error", ERROR)):
+            setattr(self, method, self._emitter(method_level) if method_level >= level else _off)
+
+    def enabled(self, level):
+        return level >= self.level
+
+    def _emitter(self, level):
+        append = self.buffer.append
+        name = self.name
+        clock = time.perf_counter
+        if level >= ERROR:
+            wake = self.buffer.wake.set
+
+            def emit(message, *args):
+                append((clock(), level, name, message, args))
+                wake()
+        else:
+            def emit(message, *args):
+                append((clock(), level, name, message, args))
+        return emit
+
+
+_buffer = LogBuffer()
+_loggers = {}
+_levels = {}  # subsystem name -> level; "" is the default for all others
+
+
+def get_logger(name):
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers[name] = Logger(name, _buffer, _levels.get(name, _levels.get("", DEFAULT_LEVEL)))
+    return logger
+
+
+def parse_levels(spec):
+    """'debug' or 'info,ui=debug,audio=error' -> {"": INFO, "ui": DEBUG, "audio": ERROR}."""
+    levels = {}
+    for part in spec.split(","):
+        name, _, level = part.strip().rpartition("=")
+        if level.lower() not in LEVELS:
+            raise ValueError(f"unknown log level '{level}' (expected one of {', '.join(LEVELS)})")
+        levels[name.strip()] = LEVELS[level.lower()]
+    return levels
+
+
+def configure(levels=None, stream=None):
+    """Set the default and per-subsystem levels (see parse_levels) and the output stream."""
+    if isinstance(levels, str):
+        levels = parse_levels(levels)
+    if levels is not None:
+        _levels.clear()
+        _levels.update(levels)
+    if stream is not None:
+        _buffer.flush()
+        _buffer.stream = stream
+    default = _levels.get("", DEFAULT_LEVEL)
+    for name, logger in _loggers.items():
+        logger.set_level(_levels.get(name, default))
+
+
+def flush():
+    _buffer.flush()
+
+
+def shutdown():
+    _buffer.close()
+
+
+def stats():
+    return dict(_buffer.stats)
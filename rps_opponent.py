@@ -0,0 +1,159 @@
+"""Computer opponents.
+
+An opponent answers next_move() with a gesture code and is told each finished
+round through observe(player, computer). All randomness comes from the rng it
+is given (the session's logic stream), so a seeded session replays exactly.
+
+MarkovOpponent learns the player's habits with n-gram counts over the last
+1..max_order moves, kept in fixed-size count tables: the context is a rolling
+base-3 code of the recent moves, so observing a move and refreshing the
+prediction touch max_order + 1 table rows, whatever the session length. The
+prediction for the next round is computed in observe(), straight after the
+result is shown, so next_move() is only a table lookup when the player clicks.
+"""
+
+from array import array
+
+from rps_engine import COUNTER_MOVE
+
+# Share of rounds played from the model; the rest are uniformly random.
+DIFFICULTIES = {"random": 0.0, "easy": 0.35, "normal": 0.65, "hard": 0.9}
+DEFAULT_DIFFICULTY = "normal"
+
+
+class RandomOpponent:
+    def __init__(self, rng):
+        self.rng = rng
+
+    def next_move(self):
+        return int(self.rng.random() * 3)
+
+    def observe(self, player, computer):
+        pass
+
+
+class MarkovOpponent:
+    def __init__(self, rng, model_rate=0.65, max_order=3, min_support=2, count_limit=1024):
+        self.rng = rng
+        self.model_rate = model_rate
+        self.max_order = max_order
+        self.min_support = min_support
+        self.count_limit = count_limit
+        # tables[k][context * 3 + move] counts `move` following the last k moves (context, base 3).
+        self.tables = [array("H", bytes(2 * 3 ** (order + 1))) for order in range(max_order + 1)]
+        self._modulus = [3 ** order for order in range(max_order + 1)]
+        self.context = 0  # last max_order player moves, most recent in the lowest digit
+        self.seen = 0
+        self.prediction = None  # the player's most likely next move, or None
+
+    def next_move(self):
+        rng = self.rng
+        # Always draw the mixing number first so the stream stays aligned for replays.
+        if rng.random() < self.model_rate and self.prediction is not None:
+            return COUNTER_MOVE[self.prediction]
+        return int(rng.random() * 3)
+
+    def observe(self, player, computer):
+        context = self.context
+        limit = self.count_limit
+        for order in range(min(self.seen, self.max_order) + 1):
+            table = self.tables[order]
+            row = context % self._modulus[order] * 3
+            table[row + player] += 1
+            if table[row + player] >= limit:
+                # Halve the row: counts stay bounded and older habits fade.
+                for i in range(row, row + 3):
+                    table[i] >>= 1
+        self.context = (context * 3 + player) % self._modulus[self.max_order]
+        self.seen += 1
+        self.prediction = self._predict()
+
+    def _predict(self):
+        context = self.context
+        for order in range(min(self.seen, self.max_order), -1, -1):
+            row = context % self._modulus[order] * 3
+            a, b, c = self.tables[order][row:row + 3]
+            if a + b + c >= self.min_support:
+                if a >= b and a >= c:
+                    return 0
+                return 1 if b >= c else 2
+        return None
+
+    def table_bytes(self):
+        return sum(table.buffer_info()[1] * table.itemsize for table in self.tables)
+
+
+class CycleOpponent:
+    """Rock, Paper, Scissors, Rock, ... from a random start."""
+
+    def __init__(self, rng):
+        self.move = int(rng.random() * 3)
+
+    def next_move(self):
+        move = self.move
+        self.move = (move + 1) % 3
+        return move
+
+    def observe(self, player, computer):
+        pass
+
+
+class MirrorOpponent:
+    """Copies the player's previous move."""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.last = None
+
+    def next_move(self):
+        return int(self.rng.random() * 3) if self.last is None else self.last
+
+    def observe(self, player, computer):
+        self.last = player
+
+
+class BeatLastOpponent:
+    """Plays whatever beats the player's previous move."""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.last = None
+
+    def next_move(self):
+        return int(self.rng.random() * 3) if self.last is None else COUNTER_MOVE[self.last]
+
+    def observe(self, player, computer):
+        self.last = player
+
+
+class ConstantOpponent:
+    def __init__(self, rng, move=0):
+        self.move = move
+
+    def next_move(self):
+        return self.move
+
+    def observe(self, player, computer):
+        pass
+
+
+# Every opponent by name, for tools that pick one on the command line (rps_tournament, rps_cli).
+STRATEGIES = {
+    "random": RandomOpponent,
+    "rock": ConstantOpponent,
+    "cycle": CycleOpponent,
+    "mirror": MirrorOpponent,
+    "beat-last": BeatLastOpponent,
+    "frequency": lambda rng: MarkovOpponent(rng, model_rate=1.0, max_order=0),
+    "markov-easy": lambda rng: MarkovOpponent(rng, model_rate=DIFFICULTIES["easy"]),
+    "markov-normal": lambda rng: MarkovOpponent(rng, model_rate=DIFFICULTIES["normal"]),
+    "markov-hard": lambda rng: MarkovOpponent(rng, model_rate=DIFFICULTIES["hard"]),
+}
+
+
+def make_opponent(difficulty, rng):
+    if difficulty not in DIFFICULTIES:
+        raise ValueError(f"Unknown difficulty '{difficulty}'")
+    if difficulty == "random":
+        return RandomOpponent(rng)
+    return MarkovOpponent(rng, model_rate=DIFFICULTIES[difficulty])
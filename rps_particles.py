@@ -0,0 +1,209 @@
+"""Pooled particle system for sparks and confetti.
+
+A ParticleSystem owns a fixed number of canvas items of one kind, created
+hidden the first time they are needed and then reused. Each slot's state
+(origin, velocity, gravity, birth time, lifetime, size, palette) lives in
+parallel array('d') columns. Bursts are a few dozen particles at most, too
+few for NumPy's per-call overhead to pay off, so the update is a plain loop.
+Positions are a closed-form function of age, so a dropped frame costs
+nothing extra.
+Emitters describe an effect. Once every slot is busy, further particles are
+dropped, so the canvas never holds more than `capacity` particle items
+however many rounds are played.
+"""
+
+import math
+import random
+import time
+from array import array
+
+PALETTE_STEPS = 16
+
+
+def _gradient(start, end, steps=PALETTE_STEPS):
+    """steps colors from end (index 0) to start (index steps - 1)."""
+    a = tuple(int(start.lstrip("#")[i:i + 2], 16) for i in (0, 2, 4))
+    b = tuple(int(end.lstrip("#")[i:i + 2], 16) for i in (0, 2, 4))
+    colors = []
+    for step in range(steps):
+        t = step / (steps - 1)
+        colors.append("#" + "".join(f"{round(e + (s - e) * t):02x}" for s, e in zip(a, b)))
+    return tuple(colors)
+
+
+class Emitter:
+    """One particle effect: how many particles a burst makes and how they move and fade."""
+
+    def __init__(self, count, life, speed=(0.0, 0.0), angle=(0.0, 2 * math.pi), velocity=None,
+                 gravity=0.0, size=(2.0, 2.0), color="#FFFFFF", fade_to=None, texts=None, font=None):
+        self.count = count
+        self.life = life  # seconds
+        self.speed = speed  # px/s, sampled with a uniform angle from `angle`
+        self.angle = angle
+        self.velocity = velocity  # ((vx_min, vx_max), (vy_min, vy_max)) instead of speed/angle
+        self.gravity = gravity  # px/s^2, downwards
+        self.size = size
+        self.palette = _gradient(color, fade_to if fade_to else color)
+        self.texts = texts
+        self.font = font
+
+
+# Gesture sparks: the old draw_particles look, five per side drifting out over the 1.2 s animation.
+SPARKS = Emitter(count=5, life=1.2, speed=(10 / 1.2, 30 / 1.2), size=(1, 4), color="#FFFFFF", fade_to="#0000FF")
+# A win on the game canvas: emoji thrown up from the top half that fall back down.
+WIN_CONFETTI = Emitter(count=10, life=1.6, velocity=((-20, 20), (-60, -20)), gravity=90,
+                       color="#FFFFFF", fade_to="#1C2526", texts=("🎉", "✨", "🌟", "🎊"), font=("Arial", 16))
+# The game-over popup: emoji drifting down behind the trophy.
+POPUP_CONFETTI = Emitter(count=20, life=1.55, velocity=((0, 0), (10, 20)), color="#FFFFFF",
+                         texts=("🎉", "✨", "🌟", "🎊"), font=("Arial", 20))
+
+
+def _floats(capacity):
+    return array("d", bytes(8 * capacity))
+
+
+class ParticleSystem:
+    def __init__(self, canvas, kind="oval", capacity=32, rng=random, clock=None, interval_ms=33,
+                 tags=("particle",)):
+        if kind not in ("oval", "text"):
+            raise ValueError(f"Unsupported particle kind '{kind}'")
+        self.canvas = canvas
+        self.kind = kind
+        self.capacity = capacity
+        self.rng = rng
+        self.clock = clock
+        self.interval_ms = interval_ms
+        self.tags = tags
+        self.x0 = _floats(capacity)
+        self.y0 = _floats(capacity)
+        self.vx = _floats(capacity)
+        self.vy = _floats(capacity)
+        self.gravity = _floats(capacity)
+        self.birth = _floats(capacity)
+        self.life = _floats(capacity)
+        self.size = _floats(capacity)
+        self.palettes = [None] * capacity
+        self.shown_color = [None] * capacity
+        self.items = []
+        self.live = set()
+        self.free = list(range(capacity - 1, -1, -1))
+        self._handle = None
+        self.stats = {"emitted": 0, "dropped": 0, "peak_live": 0, "items_created": 0, "updates": 0}
+
+    def live_count(self):
+        return len(self.live)
+
+    def _ensure_items(self):
+        if self.items:
+            return
+        create = self.canvas.create_oval if self.kind == "oval" else self.canvas.create_text
+        coords = (0, 0, 0, 0) if self.kind == "oval" else (0, 0)
+        options = {"state": "hidden", "tags": self.tags}
+        if self.kind == "oval":
+            options["outline"] = ""
+        self.items = [create(*coords, **options) for _ in range(self.capacity)]
+        self.stats["items_created"] += self.capacity
+
+    def emit(self, emitter, x, y, width=0, height=0, now=None):
+        """Start a burst from the point (x, y), or uniformly over the box at (x, y) of width x height."""
+        now = time.monotonic() if now is None else now
+        self._ensure_items()
+        rng = self.rng
+        emitted = 0
+        for _ in range(emitter.count):
+            if not self.free:
+                self.stats["dropped"] += emitter.count - emitted
+                break
+            slot = self.free.pop()
+            self.x0[slot] = x + rng.uniform(0, width) if width else x
+            self.y0[slot] = y + rng.uniform(0, height) if height else y
+            if emitter.velocity is not None:
+                (vx_min, vx_max), (vy_min, vy_max) = emitter.velocity
+                self.vx[slot] = rng.uniform(vx_min, vx_max)
+                self.vy[slot] = rng.uniform(vy_min, vy_max)
+            else:
+                angle = rng.uniform(*emitter.angle)
+                speed = rng.uniform(*emitter.speed)
+                self.vx[slot] = speed * math.cos(angle)
+                self.vy[slot] = speed * math.sin(angle)
+            self.gravity[slot] = emitter.gravity
+            self.birth[slot] = now
+            self.life[slot] = emitter.life
+            self.size[slot] = rng.uniform(*emitter.size)
+            self.palettes[slot] = emitter.palette
+            self.shown_color[slot] = None
+            item = self.items[slot]
+            if emitter.texts:
+                self.canvas.itemconfigure(item, text=rng.choice(emitter.texts), font=emitter.font)
+            self.live.add(slot)
+            emitted += 1
+        self.stats["emitted"] += emitted
+        self.stats["peak_live"] = max(self.stats["peak_live"], len(self.live))
+        if emitted:
+            if self.clock is not None and (self._handle is None or not self.clock.is_live(self._handle)):
+                self._handle = self.clock.add(self._tick, self.interval_ms)
+        return emitted
+
+    def _tick(self, step):
+        return self.update() > 0
+
+    def _positions(self, slots, now):
+        """Age, x, y, lifetime and size of the given slots, as plain lists."""
+        birth, x0, y0, vx, vy, gravity = self.birth, self.x0, self.y0, self.vx, self.vy, self.gravity
+        ages, xs, ys = [], [], []
+        for slot in slots:
+            age = now - birth[slot]
+            ages.append(age)
+            xs.append(x0[slot] + vx[slot] * age)
+            ys.append(y0[slot] + vy[slot] * age + 0.5 * gravity[slot] * age * age)
+        life, size = self.life, self.size
+        return ages, xs, ys, [life[slot] for slot in slots], [size[slot] for slot in slots]
+
+    def update(self, now=None):
+        """Move every live particle to its position at `now`; returns how many are still live."""
+        if not self.live:
+            return 0
+        now = time.monotonic() if now is None else now
+        self.stats["updates"] += 1
+        canvas = self.canvas
+        slots = list(self.live)
+        ages, xs, ys, lives, sizes = self._positions(slots, now)
+        oval = self.kind == "oval"
+        last_color = PALETTE_STEPS - 1
+        for slot, age, x, y, life, size in zip(slots, ages, xs, ys, lives, sizes):
+            item = self.items[slot]
+            if age >= life:
+                canvas.itemconfigure(item, state="hidden")
+                self.live.discard(slot)
+                self.free.append(slot)
+                continue
+            if oval:
+                canvas.coords(item, x - size, y - size, x + size, y + size)
+            else:
+                canvas.coords(item, x, y)
+            color = min(last_color, int((1 - age / life) * PALETTE_STEPS))
+            if color != self.shown_color[slot]:
+                if self.shown_color[slot] is None:
+                    canvas.itemconfigure(item, fill=self.palettes[slot][color], state="normal")
+                else:
+                    canvas.itemconfigure(item, fill=self.palettes[slot][color])
+                self.shown_color[slot] = color
+        return len(self.live)
+
+    def clear(self):
+        """Hide every particle and return all slots to the pool."""
+        for slot in self.live:
+            self.canvas.itemconfigure(self.items[slot], state="hidden")
+        self._reset_slots()
+
+    def invalidate(self):
+        """The canvas items were deleted (e.g. delete("all")); recreate them on the next emit."""
+        self.items = []
+        self._reset_slots()
+
+    def _reset_slots(self):
+        self.live.clear()
+        self.free = list(range(self.capacity - 1, -1, -1))
+        if self._handle is not None and self.clock is not None:
+            self.clock.cancel(self._handle)
+        self._handle = None
@@ -0,0 +1,185 @@
+"""In-memory leaderboard ranking by wins and by best streak.
+
+Each ranking key has a ScoreIndex: a Fenwick tree counting players per score
+plus one bucket of names per score. Rank lookups, top-K and page queries cost
+O(log S) in the score range S plus the size of the result, and updating a
+player's score is O(log S). Players with equal scores share a rank; their
+order inside a page is arbitrary but stable until one of them changes.
+"""
+
+import threading
+
+
+class ScoreIndex:
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.tree = [0] * (capacity + 1)
+        self.buckets = {}  # score -> list of names
+        self.positions = {}  # name -> (score, index in bucket)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, name):
+        return name in self.positions
+
+    def _add(self, score, delta):
+        i = score + 1
+        tree = self.tree
+        while i <= self.capacity:
+            tree[i] += delta
+            i += i & -i
+
+    def _count_upto(self, score):
+        """Number of players with a score <= score."""
+        i = min(score + 1, self.capacity)
+        total = 0
+        tree = self.tree
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _grow(self, score):
+        capacity = self.capacity
+        while capacity <= score:
+            capacity *= 2
+        self.capacity = capacity
+        self.tree = [0] * (capacity + 1)
+        for bucket_score, bucket in self.buckets.items():
+            if bucket:
+                self._add(bucket_score, len(bucket))
+
+    def _kth_smallest_score(self, k):
+        """Score of the k-th lowest player (1-based) by Fenwick descent."""
+        position = 0
+        remaining = k
+        step = 1 << (self.capacity.bit_length() - 1)
+        while step:
+            nxt = position + step
+            if nxt <= self.capacity and self.tree[nxt] < remaining:
+                position = nxt
+                remaining -= self.tree[nxt]
+            step >>= 1
+        # Tree index position + 1 holds the k-th player, and tree index i is score i - 1.
+        return position
+
+    def remove(self, name):
+        location = self.positions.pop(name, None)
+        if location is None:
+            return
+        score, index = location
+        bucket = self.buckets[score]
+        last = bucket.pop()
+        if last != name:
+            bucket[index] = last
+            self.positions[last] = (score, index)
+        if not bucket:
+            del self.buckets[score]
+        self._add(score, -1)
+        self.size -= 1
+
+    def set(self, name, score):
+        location = self.positions.get(name)
+        if location is not None:
+            if location[0] == score:
+                return
+            self.remove(name)
+        if score < 0:
+            raise ValueError("scores must be non-negative")
+        if score >= self.capacity:
+            self._grow(score)
+        bucket = self.buckets.setdefault(score, [])
+        self.positions[name] = (score, len(bucket))
+        bucket.append(name)
+        self._add(score, 1)
+        self.size += 1
+
+    def score(self, name):
+        location = self.positions.get(name)
+        return None if location is None else location[0]
+
+    def count_above(self, score):
+        return self.size - self._count_upto(score)
+
+    def rank(self, name):
+        """1-based competition rank (ties share a rank), or None for unknown players."""
+        location = self.positions.get(name)
+        if location is None:
+            return None
+        return self.count_above(location[0]) + 1
+
+    def page(self, start, count):
+        """Names at descending positions [start, start + count)."""
+        result = []
+        position = start
+        end = min(start + count, self.size)
+        while position < end:
+            score = self._kth_smallest_score(self.size - position)
+            bucket = self.buckets[score]
+            offset = position - self.count_above(score)
+            take = bucket[offset:offset + (end - position)]
+            result.extend(take)
+            position += len(take)
+        return result
+
+    def top(self, k):
+        return self.page(0, k)
+
+
+class RankingEngine:
+    KEYS = ("wins", "streak")
+
+    def __init__(self):
+        self.entries = {}
+        self.indexes = {key: ScoreIndex() for key in self.KEYS}
+        self.generation = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def update(self, entry):
+        with self._lock:
+            self._update(entry)
+            self.generation += 1
+
+    def update_many(self, entries):
+        with self._lock:
+            for entry in entries:
+                self._update(entry)
+            self.generation += 1
+
+    def _update(self, entry):
+        name = entry["name"]
+        stored = {"name": name, "wins": entry.get("wins", 0), "streak": entry.get("streak", 0)}
+        self.entries[name] = stored
+        for key, index in self.indexes.items():
+            index.set(name, stored[key])
+
+    def remove(self, name):
+        with self._lock:
+            if self.entries.pop(name, None) is not None:
+                for index in self.indexes.values():
+                    index.remove(name)
+                self.generation += 1
+
+    def rank(self, name, key="wins"):
+        with self._lock:
+            return self.indexes[key].rank(name)
+
+    def top(self, k=10, key="wins"):
+        with self._lock:
+            return [dict(self.entries[name]) for name in self.indexes[key].top(k)]
+
+    def page(self, page, page_size=10, key="wins"):
+        """Entries on 0-based page `page`, each with its rank under `key`."""
+        with self._lock:
+            index = self.indexes[key]
+            result = []
+            for name in index.page(page * page_size, page_size):
+                entry = dict(self.entries[name])
+                entry["rank"] = index.count_above(entry[key]) + 1
+                result.append(entry)
+            return result
@@ -0,0 +1,168 @@
+"""Tk-side client for rps_server.
+
+RemoteOpponent takes the place of the local CPU opponent. The Tk event loop
+cannot block on the network, so a daemon thread connects, then reads the
+server's lines into a queue, and the UI polls it from the frame clock. The
+connection's outcome arrives through the same queue, as a "connected" or
+"closed" event. A match is opened
+lazily: begin_match() only stores the rounds and opponent, and the first
+send_move() after it sends PLAY before its MOVE, so a match is only opened
+once the player actually moves. Only begin_match() allows another PLAY.
+Lines the server sends after a match's last ROUND (its END) may still be
+queued when the next match starts, so they must never cause a second PLAY,
+which the server would treat as a restart. START and END only track
+whether the server has a match live. Lines carry no match id, so the client
+counts the PLAYs still waiting for their START. While any are, ROUND and
+ABORT lines belong to an earlier match and are dropped.
+"""
+
+import queue
+import socket
+import threading
+
+import rps_log
+import rps_server
+
+log = rps_log.get_logger("remote")
+
+CONNECT_TIMEOUT = 5.0
+
+
+def parse_address(address):
+    """'host:port', 'host' or ':port' -> (host, port)."""
+    host, _, port = address.rpartition(":") if ":" in address else (address, "", "")
+    return host or "127.0.0.1", int(port) if port else rps_server.DEFAULT_PORT
+
+
+class RemoteOpponent:
+    def __init__(self, address, name):
+        host, port = parse_address(address)
+        self.address = f"{host}:{port}"
+        self.name = name or "player"
+        self.sock = None
+        self.lines = queue.SimpleQueue()  # server lines as word lists; tuples are connection events
+        self.connecting = True
+        self.connected = False
+        self.opponent_name = None
+        self.match_requested = False  # PLAY sent since the last begin_match()
+        self.starts_pending = 0  # PLAYs sent whose START (or refusal) has not arrived
+        self.match_live = False  # between the server's START and END
+        self.rounds = 5
+        self.opponent = rps_server.HUMAN
+        self._closed = False
+        self._reader = threading.Thread(target=self._read, args=(host, port), name="rps-remote", daemon=True)
+        self._reader.start()
+
+    def _connect(self, host, port):
+        try:
+            sock = socket.create_connection((host, port), timeout=CONNECT_TIMEOUT)
+        except OSError as e:
+            self.connecting = False
+            self.lines.put(("closed", f"connect-failed: {e}"))
+            return None
+        sock.settimeout(None)
+        self.sock = sock
+        if self._closed:  # close() ran while connecting
+            self.close()
+            return None
+        self.connected = True
+        self.connecting = False
+        self.send(f"HELLO {self.name}")
+        self.lines.put(("connected", self.address))
+        return sock
+
+    def _read(self, host, port):
+        sock = self._connect(host, port)
+        if sock is None:
+            return
+        try:
+            with sock.makefile("r", encoding="ascii", errors="replace") as stream:
+                for line in stream:
+                    self.lines.put(line.split())
+        except OSError as e:
+            log.error("Error reading from match server: %s", e)
+        self.lines.put(None)
+
+    def send(self, line):
+        if self.sock is None:
+            return
+        try:
+            self.sock.sendall(line.encode("ascii", "replace") + b"\n")
+        except OSError as e:
+            log.error("Error sending to match server: %s", e)
+            self.connected = False
+
+    def begin_match(self, rounds, opponent):
+        self.rounds = rounds
+        self.opponent = opponent
+        self.match_requested = False
+
+    def send_move(self, move):
+        if not self.match_requested:
+            self.send(f"PLAY {self.rounds} {self.opponent}")
+            self.match_requested = True
+            self.starts_pending += 1
+        self.send(f"MOVE {rps_server.MOVE_LETTERS[move]}")
+
+    def poll(self):
+        """Handle queued server lines; returns the next event or None.
+
+        Events: ("connected", address) once the connection is up,
+        ("round", their move), ("wait", None) while queued for a human
+        opponent, ("closed", reason) if the match or connection ended.
+        """
+        while True:
+            try:
+                words = self.lines.get_nowait()
+            except queue.Empty:
+                return None
+            if words is None:
+                self.connected = False
+                return "closed", "connection-lost"
+            if isinstance(words, tuple):
+                return words
+            if not words:
+                continue
+            verb = words[0]
+            if verb == "ROUND" and len(words) >= 4:
+                if self.starts_pending:
+                    continue  # an earlier match's round
+                move = rps_server.MOVE_LETTERS.find(words[3])
+                if move < 0 or len(words[3]) != 1:
+                    log.error("Bad ROUND line from match server: %s", " ".join(words))
+                    return "closed", "protocol-error"
+                return "round", move
+            if verb == "WAIT":
+                return "wait", None
+            if verb == "START":
+                self.opponent_name = " ".join(words[2:])
+                self.match_live = True
+                self.starts_pending = max(0, self.starts_pending - 1)
+            elif verb == "END":
+                self.match_live = False
+            elif verb == "ABORT" and self.starts_pending:
+                continue
+            elif verb in ("ABORT", "ERR"):
+                if verb == "ERR" and words[1:2] in (["bad-rounds"], ["bad-opponent"]):
+                    self.starts_pending = max(0, self.starts_pending - 1)  # the PLAY was refused
+                self.match_live = False
+                return "closed", " ".join(words[1:])
+
+    def next_move(self):
+        raise RuntimeError("RemoteOpponent moves arrive asynchronously; use send_move() and poll()")
+
+    def observe(self, player, computer):
+        pass
+
+    def close(self):
+        self._closed = True
+        self.connecting = False
+        if self.connected:
+            self.send("QUIT")
+        self.connected = False
+        if self.sock is None:
+            return
+        try:
+            self.sock.close()
+        except OSError:
+            pass
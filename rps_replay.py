@@ -0,0 +1,133 @@
+"""Seeded sessions and deterministic replay.
+
+Every match runs on a SessionRNG: one seed from which two independent
+random.Random streams are derived, `logic` for the computer's moves and
+`visual` for stars, particles and confetti. Animation code can draw as many
+visual numbers as it likes without shifting the computer's moves, so a
+SessionRecord (seed, round count, opponent difficulty and the player's moves)
+is enough to replay a match exactly. fast_forward replays a record through
+rps_engine alone, with no Tk and no rendering; the app's --replay option plays
+one back on screen.
+"""
+
+import json
+import random
+
+import rps_engine
+import rps_opponent
+
+RECORD_VERSION = 1
+
+
+def new_seed():
+    return random.SystemRandom().getrandbits(63)
+
+
+class SessionRNG:
+    def __init__(self, seed=None):
+        self.seed = new_seed() if seed is None else seed
+        # String seeds are hashed with SHA-512, so the streams do not depend on PYTHONHASHSEED.
+        self.logic = random.Random(f"{self.seed}:logic")
+        self.visual = random.Random(f"{self.seed}:visual")
+
+
+class SessionRecord:
+    """Everything needed to reproduce one match.
+
+    Computer moves are kept alongside the player's so a replay can report the
+    first round where the code under test stops reproducing the original.
+    A session played against a match server is not replayable: its computer
+    moves did not come from the seed. Such records are never saved.
+    """
+
+    def __init__(self, seed, max_rounds, player_moves=b"", computer_moves=b"", opponent="random"):
+        self.seed = seed
+        self.max_rounds = max_rounds
+        self.opponent = opponent
+        self.player_moves = bytearray(player_moves)
+        self.computer_moves = bytearray(computer_moves)
+        self.replayable = True
+
+    def __len__(self):
+        return len(self.player_moves)
+
+    def add(self, player, computer):
+        self.player_moves.append(player)
+        self.computer_moves.append(computer)
+
+    def to_dict(self):
+        digits = "0123"
+        return {
+            "version": RECORD_VERSION,
+            "seed": self.seed,
+            "max_rounds": self.max_rounds,
+            "opponent": self.opponent,
+            "player": "".join(digits[m] for m in self.player_moves),
+            "computer": "".join(digits[m] for m in self.computer_moves),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("version") != RECORD_VERSION:
+            raise ValueError(f"Unsupported session record version {data.get('version')}")
+        moves = data.get("player", "")
+        if any(ch not in "012" for ch in moves):
+            raise ValueError("Session record contains an invalid move")
+        return cls(data["seed"], data["max_rounds"],
+                   bytes(int(ch) for ch in moves),
+                   bytes(int(ch) for ch in data.get("computer", "")),
+                   data.get("opponent", "random"))
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=4)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+class ReplayResult:
+    __slots__ = ("match", "outcomes", "computer_moves", "diverged_at")
+
+    def __init__(self, match, outcomes, computer_moves, diverged_at):
+        self.match = match
+        self.outcomes = outcomes
+        self.computer_moves = computer_moves
+        self.diverged_at = diverged_at  # 0-based round index, or None if the replay matched
+
+    @property
+    def winner(self):
+        return self.match.winner()
+
+
+def fast_forward(record):
+    """Replay a record with no rendering and return a ReplayResult."""
+    if not record.replayable:
+        raise ValueError("Session record was played against a match server and cannot be replayed")
+    opponent = rps_opponent.make_opponent(record.opponent, SessionRNG(record.seed).logic)
+    next_move = opponent.next_move
+    observe = opponent.observe
+    match = rps_engine.MatchState(record.max_rounds)
+    resolve = rps_engine.resolve
+    recorded = record.computer_moves
+    outcomes = bytearray()
+    computer_moves = bytearray()
+    diverged_at = None
+    for index, player in enumerate(record.player_moves):
+        computer = next_move()
+        if diverged_at is None and index < len(recorded) and recorded[index] != computer:
+            diverged_at = index
+        outcomes.append(match.record(resolve(player, computer)))
+        observe(player, computer)
+        computer_moves.append(computer)
+        if not match.advance():
+            break
+    return ReplayResult(match, outcomes, computer_moves, diverged_at)
+
+
+def replay_many(records):
+    """fast_forward each record in turn; yields ReplayResults."""
+    for record in records:
+        yield fast_forward(record)
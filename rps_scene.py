@@ -0,0 +1,335 @@
+"""Retained-mode scene for the game canvas.
+
+The background, stars and gesture items are created once (stars and
+background once per canvas, gestures once per round) and then moved and
+restyled each frame with coords/itemconfigure instead of delete("all").
+Sparks and win confetti come from pooled rps_particles systems.
+Given a sprite atlas (rps_sprites), a side whose strip is ready is drawn as
+one image item plus its emoji text instead of the vector items. Given a
+rps_fonts.FontCache, the emoji font tuples are swapped for cached font objects.
+"""
+
+import math
+import random
+
+import rps_particles
+
+# Static options per gesture item; the per-frame ones come from gesture_frame.
+ITEM_LAYOUT = {
+    "Rock": (
+        ("oval", {"width": 4}),
+        ("oval", {"outline": "#FFFFFF", "width": 3}),
+        ("oval", {"outline": "#FFD700", "width": 2}),
+        ("text", {"text": "✊", "fill": "#FFD700"}),
+    ),
+    "Paper": (
+        ("rectangle", {"width": 4}),
+        ("rectangle", {"outline": "#FFFFFF", "width": 3}),
+        ("rectangle", {"outline": "#00FFFF", "width": 2}),
+        ("text", {"text": "📄", "fill": "#00FFFF"}),
+    ),
+    "Scissors": (
+        ("line", {"width": 7}),
+        ("line", {"width": 7}),
+        ("line", {"width": 5}),
+        ("line", {"width": 5}),
+        ("text", {"text": "✂️", "fill": "#FF4500"}),
+    ),
+}
+
+PARTICLES_PER_SIDE = rps_particles.SPARKS.count
+# clear_round() empties both pools, so each only needs room for one round's bursts.
+SPARK_CAPACITY = 2 * PARTICLES_PER_SIDE
+CONFETTI_CAPACITY = rps_particles.WIN_CONFETTI.count
+ANIMATION_FRAMES = 40
+
+
+def ease_out_sine(t):
+    return math.sin((t * math.pi) / 2)
+
+
+def side_anchor(player_type, canvas_width, canvas_height):
+    x_offset = canvas_width * 0.25 if player_type == "player" else canvas_width * 0.75
+    return x_offset, canvas_height * 0.5
+
+
+def gesture_frame(gesture, player_type, progress, canvas_width, canvas_height):
+    """Return [(coords, dynamic_options), ...] in ITEM_LAYOUT order for one frame."""
+    x_offset, y_offset = side_anchor(player_type, canvas_width, canvas_height)
+    eased = ease_out_sine(progress)
+    scale_factor = 0.8 + 0.5 * eased * (1 + 0.2 * math.sin(progress * 4 * math.pi))
+    alpha = min(1.0, progress * 2)
+    color_intensity = int(255 * alpha)
+    glow_intensity = int(255 * (0.5 + 0.4 * math.sin(progress * 6 * math.pi)))
+    font = ("Arial", int(20 * scale_factor))
+    text_coords = (x_offset, y_offset + 30)
+
+    if gesture == "Rock":
+        radius = 25 * scale_factor
+        color = f"#{color_intensity:02x}{color_intensity:02x}{color_intensity:02x}"
+        glow_color = f"#{glow_intensity:02x}{glow_intensity:02x}ff"
+        return [
+            ((x_offset - radius - 5, y_offset - radius - 5, x_offset + radius + 5, y_offset + radius + 5),
+             {"outline": glow_color}),
+            ((x_offset - radius - 3, y_offset - radius - 3, x_offset + radius + 3, y_offset + radius + 3), {}),
+            ((x_offset - radius, y_offset - radius, x_offset + radius, y_offset + radius), {"fill": color}),
+            (text_coords, {"font": font}),
+        ]
+
+    if gesture == "Paper":
+        half = 35 * scale_factor / 2
+        color = f"#{color_intensity:02x}{color_intensity:02x}ff"
+        glow_color = f"#{glow_intensity:02x}ff{glow_intensity:02x}"
+        return [
+            ((x_offset - half - 5, y_offset - half - 5, x_offset + half + 5, y_offset + half + 5),
+             {"outline": glow_color}),
+            ((x_offset - half - 3, y_offset - half - 3, x_offset + half + 3, y_offset + half + 3), {}),
+            ((x_offset - half, y_offset - half, x_offset + half, y_offset + half), {"fill": color}),
+            (text_coords, {"font": font}),
+        ]
+
+    angle = math.radians(15 * math.sin(progress * 3 * math.pi))
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    color = f"#{color_intensity:02x}0000"
+    glow_color = f"#ff{glow_intensity:02x}{glow_intensity:02x}"
+    outer = 30 * scale_factor
+    inner = 25 * scale_factor
+    return [
+        ((x_offset, y_offset, x_offset + outer * cos_a, y_offset + outer * sin_a), {"fill": glow_color}),
+        ((x_offset, y_offset, x_offset + outer * cos_a, y_offset - outer * sin_a), {"fill": glow_color}),
+        ((x_offset, y_offset, x_offset + inner * cos_a, y_offset + inner * sin_a), {"fill": color}),
+        ((x_offset, y_offset, x_offset + inner * cos_a, y_offset - inner * sin_a), {"fill": color}),
+        (text_coords, {"font": font}),
+    ]
+
+
+class KeyframeCache:
+    """Per-frame gesture geometry, built lazily per (gesture, side).
+
+    The gesture animation always runs ANIMATION_FRAMES frames with progress
+    frame / frame_count, so every frame is a pure function of (gesture, side,
+    frame) and the canvas size. Tables are dropped when the size changes or
+    invalidate() is called.
+    """
+
+    def __init__(self, frame_count=ANIMATION_FRAMES):
+        self.frame_count = frame_count
+        self.size = None
+        self.tables = {}
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self):
+        self.tables.clear()
+        self.size = None
+
+    def frames(self, gesture, side, canvas_width, canvas_height):
+        if self.size != (canvas_width, canvas_height):
+            self.tables.clear()
+            self.size = (canvas_width, canvas_height)
+        key = (gesture, side)
+        table = self.tables.get(key)
+        if table is None:
+            self.misses += 1
+            table = tuple(gesture_frame(gesture, side, frame / self.frame_count, canvas_width, canvas_height)
+                          for frame in range(self.frame_count + 1))
+            self.tables[key] = table
+        else:
+            self.hits += 1
+        return table
+
+    def frame(self, gesture, side, frame, canvas_width, canvas_height):
+        return self.frames(gesture, side, canvas_width, canvas_height)[frame]
+
+    def prebuild(self, canvas_width, canvas_height):
+        for gesture in ITEM_LAYOUT:
+            for side in ("player", "computer"):
+                self.frames(gesture, side, canvas_width, canvas_height)
+
+
+def gesture_font_specs(frame_count=ANIMATION_FRAMES):
+    """Every emoji font the gesture keyframes use, for FontCache.prepare()."""
+    specs = set()
+    for gesture in ITEM_LAYOUT:
+        for frame in range(frame_count + 1):
+            # The font depends only on progress, not on the side or canvas size.
+            specs.add(gesture_frame(gesture, "player", frame / frame_count, 400, 150)[-1][1]["font"])
+    return sorted(specs)
+
+
+def star_frames(star_positions, frame_count=ANIMATION_FRAMES):
+    """Twinkle coords for every star at every frame, indexed [frame][star]."""
+    table = []
+    for frame in range(frame_count + 1):
+        phase = frame / frame_count * 2 * math.pi
+        row = []
+        for x, y in star_positions:
+            size = 1.0 + 0.8 * math.sin(phase + x)
+            row.append((x - size, y - size, x + size, y + size))
+        table.append(tuple(row))
+    return tuple(table)
+
+
+def _create_item(canvas, kind, coords, options):
+    return getattr(canvas, "create_" + kind)(*coords, **options)
+
+
+def draw_gesture_immediate(canvas, gesture, player_type, progress, canvas_width, canvas_height):
+    """Create fresh items for one frame (the pre-scene drawing path)."""
+    frame = gesture_frame(gesture, player_type, progress, canvas_width, canvas_height)
+    for (kind, static), (coords, dynamic) in zip(ITEM_LAYOUT[gesture], frame):
+        _create_item(canvas, kind, coords, {**static, **dynamic})
+
+
+class GestureScene:
+    def __init__(self, canvas, rng=random, keyframes=None, atlas=None, clock=None, fonts=None):
+        self.canvas = canvas
+        self.fonts = fonts
+        self.rng = rng
+        self.sparks = rps_particles.ParticleSystem(canvas, "oval", SPARK_CAPACITY, rng=rng, tags=("particle",))
+        self.confetti = rps_particles.ParticleSystem(canvas, "text", CONFETTI_CAPACITY, rng=rng, clock=clock,
+                                                     tags=("confetti",))
+        self.keyframes = keyframes if keyframes is not None else KeyframeCache()
+        self.atlas = atlas
+        self.sprites = {}  # side -> [image item, text item, frame images, shown frame, shown font]
+        self.star_table = ()
+        self.background_item = None
+        self.star_items = []
+        self.star_positions = []
+        self.gesture_items = {"player": [], "computer": []}
+        self.gestures = {"player": None, "computer": None}
+
+    def canvas_size(self):
+        return max(self.canvas.winfo_width(), 400), max(self.canvas.winfo_height(), 150)
+
+    def build(self, star_positions):
+        """Create the persistent background and star items."""
+        self.canvas.delete("all")
+        self.sparks.invalidate()
+        self.confetti.invalidate()
+        canvas_width, canvas_height = self.canvas_size()
+        self.background_item = self.canvas.create_rectangle(0, 0, canvas_width, canvas_height,
+                                                            fill="#000000", stipple="gray25",
+                                                            tags=("background",))
+        self.star_positions = list(star_positions)
+        self.star_table = star_frames(self.star_positions, self.keyframes.frame_count)
+        self.star_items = [self.canvas.create_oval(x - 1, y - 1, x + 1, y + 1, fill="#FFFFFF", outline="",
+                                                   tags=("star",))
+                           for x, y in self.star_positions]
+        self.gesture_items = {"player": [], "computer": []}
+        self.gestures = {"player": None, "computer": None}
+        self.sprites = {}
+
+    def invalidate(self):
+        """Drop cached keyframes, e.g. from a <Configure> handler after a resize."""
+        self.keyframes.invalidate()
+        if self.background_item is not None:
+            canvas_width, canvas_height = self.canvas_size()
+            self.canvas.coords(self.background_item, 0, 0, canvas_width, canvas_height)
+
+    def clear_round(self):
+        self.canvas.delete("gesture")
+        self.sparks.clear()
+        self.confetti.clear()
+        self.gesture_items = {"player": [], "computer": []}
+        self.gestures = {"player": None, "computer": None}
+        self.sprites = {}
+
+    def begin_round(self, player_gesture, computer_gesture):
+        """Create this round's gesture items, hidden until the first render, and emit its sparks."""
+        self.clear_round()
+        canvas_width, canvas_height = self.canvas_size()
+        self.canvas.coords(self.background_item, 0, 0, canvas_width, canvas_height)
+        self.sparks.rng = self.rng
+        for side, gesture in (("player", player_gesture), ("computer", computer_gesture)):
+            self.gestures[side] = gesture
+            self.sparks.emit(rps_particles.SPARKS, *side_anchor(side, canvas_width, canvas_height))
+            images = self.atlas.frames(gesture) if self.atlas is not None else None
+            if images is not None:
+                self._begin_sprite(side, gesture, images, canvas_width, canvas_height)
+                continue
+            items = []
+            for kind, static in ITEM_LAYOUT[gesture]:
+                coords = (0, 0) if kind == "text" else (0, 0, 0, 0)
+                items.append(_create_item(self.canvas, kind, coords,
+                                          {**static, "state": "hidden", "tags": ("gesture",)}))
+            self.gesture_items[side] = items
+
+    def _begin_sprite(self, side, gesture, images, canvas_width, canvas_height):
+        x_offset, y_offset = side_anchor(side, canvas_width, canvas_height)
+        image_item = self.canvas.create_image(x_offset, y_offset, image=images[0], anchor="center",
+                                              state="hidden", tags=("gesture",))
+        _, text_static = ITEM_LAYOUT[gesture][-1]
+        text_coords = self.keyframes.frame(gesture, side, 0, canvas_width, canvas_height)[-1][0]
+        text_item = _create_item(self.canvas, "text", text_coords,
+                                 {**text_static, "state": "hidden", "tags": ("gesture",)})
+        self.sprites[side] = [image_item, text_item, images, None, None]
+
+    def _render_sprite(self, side, frame, canvas_width, canvas_height):
+        sprite = self.sprites[side]
+        image_item, text_item, images, shown_frame, shown_font = sprite
+        if frame == shown_frame:
+            return
+        if shown_frame is None:
+            self.canvas.itemconfigure(image_item, image=images[frame], state="normal")
+        else:
+            self.canvas.itemconfigure(image_item, image=images[frame])
+        sprite[3] = frame
+        # Emoji re-layout goes through Tk's font fallback; only pay for it when the size changes.
+        font = self.keyframes.frame(self.gestures[side], side, frame, canvas_width, canvas_height)[-1][1]["font"]
+        if font != shown_font:
+            self.canvas.itemconfigure(text_item, font=self._font(font), state="normal")
+            sprite[4] = font
+
+    def _font(self, spec):
+        return self.fonts.get(spec) if self.fonts is not None else spec
+
+    def _configure(self, item, dynamic):
+        if "font" in dynamic and self.fonts is not None:
+            dynamic = {**dynamic, "font": self.fonts.get(dynamic["font"])}
+        self.canvas.itemconfigure(item, state="normal", **dynamic)
+
+    def celebrate(self):
+        """Throw win confetti over the top half of the canvas."""
+        canvas_width, canvas_height = self.canvas_size()
+        self.confetti.rng = self.rng
+        self.confetti.emit(rps_particles.WIN_CONFETTI, 0, 0, canvas_width, canvas_height / 2)
+
+    def render(self, progress):
+        canvas = self.canvas
+        canvas_width, canvas_height = self.canvas_size()
+        self.sparks.update()
+        for item, (x, y) in zip(self.star_items, self.star_positions):
+            size = 1.0 + 0.8 * math.sin(progress * 2 * math.pi + x)
+            canvas.coords(item, x - size, y - size, x + size, y + size)
+        for side in ("player", "computer"):
+            gesture = self.gestures[side]
+            if gesture is None:
+                continue
+            if side in self.sprites:
+                self._render_sprite(side, round(progress * self.keyframes.frame_count), canvas_width, canvas_height)
+                continue
+            frame = gesture_frame(gesture, side, progress, canvas_width, canvas_height)
+            for item, (coords, dynamic) in zip(self.gesture_items[side], frame):
+                canvas.coords(item, *coords)
+                self._configure(item, dynamic)
+
+    def render_frame(self, frame):
+        """Render keyframe `frame` (0..frame_count) from the cached tables."""
+        canvas = self.canvas
+        canvas_width, canvas_height = self.canvas_size()
+        self.sparks.update()
+        for item, coords in zip(self.star_items, self.star_table[frame]):
+            canvas.coords(item, *coords)
+        for side in ("player", "computer"):
+            gesture = self.gestures[side]
+            if gesture is None:
+                continue
+            if side in self.sprites:
+                self._render_sprite(side, frame, canvas_width, canvas_height)
+                continue
+            keyframe = self.keyframes.frame(gesture, side, frame, canvas_width, canvas_height)
+            for item, (coords, dynamic) in zip(self.gesture_items[side], keyframe):
+                canvas.coords(item, *coords)
+                self._configure(item, dynamic)
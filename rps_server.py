@@ -0,0 +1,256 @@
+"""Headless asyncio server for networked matches.
+
+Clients speak a line protocol over TCP, one ASCII command per line:
+
+    client -> server                 server -> client
+    HELLO <name>                     OK <client id>
+    PLAY <rounds> <opponent>         WAIT | START <rounds> <opponent name>
+    MOVE <R|P|S>                     ROUND <n> <mine> <theirs> <win|lose|tie> <my wins> <their wins>
+    QUIT                             END <win|lose|tie> <my wins> <their wins>
+                                     ABORT <reason> | ERR <reason>
+
+<opponent> is one of the rps_opponent difficulties, for a bot, or "human"
+to be paired with the next player asking for the same number of rounds. A
+MOVE may be sent before START. It is held until the match begins. PLAY
+during a match abandons it, and the other side receives ABORT.
+
+Every match keeps its score in an rps_engine.MatchState, the class behind
+the app's check_round_completion and end_game, seen from the first
+seat. So rounds, max_rounds and round_wins work exactly as they do against
+the local CPU. Match and client state live in __slots__ objects, and a
+bot's opponent model has fixed-size tables, so a match costs the same
+memory on its first round as on its hundredth.
+
+Run: python rps_server.py [--host 127.0.0.1] [--port 8765] [--seed N]
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import time
+
+import rps_engine
+import rps_opponent
+
+DEFAULT_PORT = 8765
+MOVE_LETTERS = "RPS"
+MAX_LINE = 256
+MAX_NAME = 32
+MAX_ROUNDS = 100
+HUMAN = "human"
+HIGH_WATER = 64 * 1024  # wait for the socket to drain above this many buffered bytes
+# The same round seen from the other seat.
+FLIPPED = {rps_engine.TIE: rps_engine.TIE, rps_engine.WIN: rps_engine.LOSE, rps_engine.LOSE: rps_engine.WIN}
+WINNER_WORDS = {"You": ("win", "lose"), "Computer": ("lose", "win")}
+
+
+class Client:
+    __slots__ = ("client_id", "name", "writer", "match", "seat", "pending_move", "wanted")
+
+    def __init__(self, client_id, writer):
+        self.client_id = client_id
+        self.name = f"player{client_id}"
+        self.writer = writer
+        self.match = None
+        self.seat = 0
+        self.pending_move = -1  # a move sent while waiting for an opponent
+        self.wanted = None  # rounds asked for while waiting
+
+
+class ServerMatch:
+    __slots__ = ("match_id", "state", "clients", "moves", "bot")
+
+    def __init__(self, match_id, rounds, first, second=None, bot=None):
+        self.match_id = match_id
+        self.state = rps_engine.MatchState(max_rounds=rounds)  # "player" is seat 0
+        self.clients = (first, second)
+        self.moves = [-1, -1]
+        self.bot = bot
+
+
+class MatchServer:
+    def __init__(self, seed=None):
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.matches = {}  # match id -> ServerMatch
+        self.waiting = {}  # rounds -> Client waiting for a human opponent
+        self.stats = {"connections": 0, "clients": 0, "matches_started": 0, "matches_finished": 0,
+                      "matches_aborted": 0, "rounds": 0, "peak_matches": 0, "errors": 0}
+        self._ids = itertools.count(1)
+
+    async def start(self, host="127.0.0.1", port=DEFAULT_PORT):
+        return await asyncio.start_server(self.handle, host, port, limit=MAX_LINE)
+
+    async def handle(self, reader, writer):
+        client = Client(next(self._ids), writer)
+        self.stats["connections"] += 1
+        self.stats["clients"] += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line or not self.command(client, line.decode("ascii", "replace").split()):
+                    break
+                if writer.transport.get_write_buffer_size() > HIGH_WATER:
+                    await writer.drain()
+        except ValueError:
+            self.stats["errors"] += 1  # line longer than MAX_LINE
+        except ConnectionError:
+            pass
+        finally:
+            self.leave(client, "opponent-left")
+            self.stats["clients"] -= 1
+            writer.close()
+
+    def send(self, client, line):
+        if client is not None and not client.writer.is_closing():
+            client.writer.write(line.encode("ascii", "replace") + b"\n")
+
+    def command(self, client, words):
+        """Handle one command; returns False to close the connection."""
+        if not words:
+            return True
+        verb = words[0].upper()
+        if verb == "MOVE" and len(words) == 2:
+            move = MOVE_LETTERS.find(words[1][:1].upper())
+            if move < 0:
+                self.error(client, "bad-move")
+            else:
+                self.move(client, move)
+        elif verb == "PLAY" and len(words) == 3:
+            self.play(client, words[1], words[2].lower())
+        elif verb == "HELLO" and len(words) >= 2:
+            client.name = " ".join(words[1:])[:MAX_NAME]
+            self.send(client, f"OK {client.client_id}")
+        elif verb == "QUIT":
+            return False
+        else:
+            self.error(client, "bad-command")
+        return True
+
+    def error(self, client, reason):
+        self.stats["errors"] += 1
+        self.send(client, f"ERR {reason}")
+
+    def play(self, client, rounds, opponent):
+        try:
+            rounds = int(rounds)
+        except ValueError:
+            rounds = 0
+        if not 1 <= rounds <= MAX_ROUNDS:
+            return self.error(client, "bad-rounds")
+        if opponent != HUMAN and opponent not in rps_opponent.DIFFICULTIES:
+            return self.error(client, "bad-opponent")
+        self.leave(client, "opponent-restarted")
+        match_id = next(self._ids)
+        if opponent != HUMAN:
+            bot = rps_opponent.make_opponent(opponent, random.Random(f"{self.seed}:{match_id}"))
+            self.begin(ServerMatch(match_id, rounds, client, bot=bot), f"cpu-{opponent}")
+            return
+        partner = self.waiting.pop(rounds, None)
+        if partner is None:
+            client.wanted = rounds
+            self.waiting[rounds] = client
+            self.send(client, "WAIT")
+            return
+        partner.wanted = None
+        self.begin(ServerMatch(match_id, rounds, partner, client))
+
+    def begin(self, match, bot_name=None):
+        self.matches[match.match_id] = match
+        self.stats["matches_started"] += 1
+        self.stats["peak_matches"] = max(self.stats["peak_matches"], len(self.matches))
+        first, second = match.clients
+        first.match, first.seat = match, 0
+        self.send(first, f"START {match.state.max_rounds} {bot_name or second.name}")
+        if second is not None:
+            second.match, second.seat = match, 1
+            self.send(second, f"START {match.state.max_rounds} {first.name}")
+        for client in match.clients:
+            if client is not None and client.pending_move >= 0:
+                move, client.pending_move = client.pending_move, -1
+                self.move(client, move)
+
+    def move(self, client, move):
+        match = client.match
+        if match is None:
+            if client.wanted is None:
+                return self.error(client, "no-match")
+            client.pending_move = move
+            return
+        if match.moves[client.seat] >= 0:
+            return self.error(client, "already-moved")
+        match.moves[client.seat] = move
+        if match.bot is not None:
+            match.moves[1] = match.bot.next_move()
+        if match.moves[0] >= 0 and match.moves[1] >= 0:
+            self.finish_round(match)
+
+    def finish_round(self, match):
+        first, second = match.moves
+        match.moves[0] = match.moves[1] = -1
+        state = match.state
+        outcome = state.record(rps_engine.resolve(first, second))
+        if match.bot is not None:
+            match.bot.observe(first, second)
+        self.stats["rounds"] += 1
+        wins = state.round_wins["player"], state.round_wins["computer"]
+        names = rps_engine.OUTCOME_NAMES
+        self.send(match.clients[0], f"ROUND {state.current_round} {MOVE_LETTERS[first]} {MOVE_LETTERS[second]} "
+                                    f"{names[outcome]} {wins[0]} {wins[1]}")
+        self.send(match.clients[1], f"ROUND {state.current_round} {MOVE_LETTERS[second]} {MOVE_LETTERS[first]} "
+                                    f"{names[FLIPPED[outcome]]} {wins[1]} {wins[0]}")
+        if not state.advance():
+            first_word, second_word = WINNER_WORDS.get(state.winner(), ("tie", "tie"))
+            self.send(match.clients[0], f"END {first_word} {wins[0]} {wins[1]}")
+            self.send(match.clients[1], f"END {second_word} {wins[1]} {wins[0]}")
+            self.stats["matches_finished"] += 1
+            self.close_match(match)
+
+    def close_match(self, match):
+        self.matches.pop(match.match_id, None)
+        for client in match.clients:
+            if client is not None and client.match is match:
+                client.match = None
+
+    def leave(self, client, reason):
+        """Drop the client's queue place or current match, telling the other side."""
+        if client.wanted is not None:
+            if self.waiting.get(client.wanted) is client:
+                del self.waiting[client.wanted]
+            client.wanted = None
+        client.pending_move = -1
+        match = client.match
+        if match is None:
+            return
+        self.close_match(match)
+        self.stats["matches_aborted"] += 1
+        self.send(match.clients[1 - client.seat], f"ABORT {reason}")
+
+
+async def serve(host, port, seed, stats_interval):
+    server = MatchServer(seed)
+    listener = await server.start(host, port)
+    address = listener.sockets[0].getsockname()
+    print(f"RPS match server on {address[0]}:{address[1]} (seed {server.seed})")
+    async with listener:
+        while True:
+            await asyncio.sleep(stats_interval)
+            print(f"{time.strftime('%H:%M:%S')} clients={server.stats['clients']} matches={len(server.matches)} "
+                  f"waiting={len(server.waiting)} rounds={server.stats['rounds']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Rock Paper Scissors match server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--seed", type=int, default=None, help="seed for the bots' random streams")
+    parser.add_argument("--stats-interval", type=float, default=30.0, help="seconds between status lines")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.seed, args.stats_interval))
+    except KeyboardInterrupt:
+        print("Server stopped")
+
+
+if __name__ == "__main__":
+    main()
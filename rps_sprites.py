@@ -0,0 +1,253 @@
+"""Pre-rasterized sprite atlas for the gesture animation.
+
+The vector part of every gesture keyframe (the rings, squares and blades from
+rps_scene.gesture_frame) is rasterized once, in pure Python, into one PNG
+strip per gesture: ANIMATION_FRAMES + 1 cells side by side. Strips are
+written to a cache directory under a key derived from the cell size, frame
+count and the gesture styling, so a later run, or a change of theme, finds
+the right files or builds new ones. Tk then loads each strip and cuts it
+into one PhotoImage per frame. After that, animating a side is a single
+itemconfigure(image=...) per frame instead of coords + itemconfigure on
+four or five vector items.
+
+Emoji are not part of the sprites. Rendering colour emoji needs the
+platform's font stack, which Tk does not expose as an image, so the scene
+keeps one text item per side and only restyles it when its font size changes.
+"""
+
+import hashlib
+import math
+import os
+import struct
+import threading
+import time
+import zlib
+
+import rps_log
+import rps_scene
+
+log = rps_log.get_logger("sprites")
+
+CELL = 96  # covers the largest keyframe: rock's glow ring at scale 1.4 plus its stroke
+RASTER_VERSION = 1
+DEFAULT_CACHE_DIR = "rps_sprites"
+
+
+def _rgba(color):
+    color = color.lstrip("#")
+    return bytes((int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16), 255))
+
+
+class _Raster:
+    """An RGBA buffer with the handful of span fills the gesture shapes need."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(width * height * 4)
+
+    def span(self, y, x0, x1, rgba):
+        if y < 0 or y >= self.height:
+            return
+        x0 = max(0, x0)
+        x1 = min(self.width, x1)
+        if x1 > x0:
+            start = (y * self.width + x0) * 4
+            self.pixels[start:start + (x1 - x0) * 4] = rgba * (x1 - x0)
+
+    def _rows(self, top, bottom):
+        return range(max(0, math.floor(top)), min(self.height, math.ceil(bottom)))
+
+    @staticmethod
+    def _pixel_span(left, right):
+        """Pixels whose centres lie in [left, right)."""
+        return math.ceil(left - 0.5), math.floor(right - 0.5) + 1
+
+    def ellipse(self, x0, y0, x1, y1, rgba, inner_inset=None):
+        """Fill an ellipse, or the ring between it and the ellipse inset by inner_inset."""
+        cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+        rx, ry = (x1 - x0) / 2, (y1 - y0) / 2
+        if rx <= 0 or ry <= 0:
+            return
+        irx = iry = None
+        if inner_inset is not None:
+            irx, iry = rx - inner_inset, ry - inner_inset
+        for y in self._rows(cy - ry, cy + ry):
+            dy = (y + 0.5 - cy) / ry
+            if abs(dy) >= 1:
+                continue
+            dx = rx * math.sqrt(1 - dy * dy)
+            left, right = self._pixel_span(cx - dx, cx + dx)
+            if irx is not None and irx > 0 and iry > 0:
+                idy = (y + 0.5 - cy) / iry
+                if abs(idy) < 1:
+                    idx = irx * math.sqrt(1 - idy * idy)
+                    inner_left, inner_right = self._pixel_span(cx - idx, cx + idx)
+                    self.span(y, left, inner_left, rgba)
+                    self.span(y, inner_right, right, rgba)
+                    continue
+            self.span(y, left, right, rgba)
+
+    def rectangle(self, x0, y0, x1, y1, rgba, inner_inset=None):
+        left, right = self._pixel_span(x0, x1)
+        inner = None
+        if inner_inset is not None and x1 - x0 > 2 * inner_inset and y1 - y0 > 2 * inner_inset:
+            inner = self._pixel_span(x0 + inner_inset, x1 - inner_inset)
+        for y in self._rows(y0, y1):
+            if inner is not None and y0 + inner_inset <= y + 0.5 < y1 - inner_inset:
+                self.span(y, left, inner[0], rgba)
+                self.span(y, inner[1], right, rgba)
+            else:
+                self.span(y, left, right, rgba)
+
+    def thick_line(self, x0, y0, x1, y1, width, rgba):
+        length = math.hypot(x1 - x0, y1 - y0)
+        if length == 0:
+            return
+        nx, ny = -(y1 - y0) / length * width / 2, (x1 - x0) / length * width / 2
+        corners = ((x0 + nx, y0 + ny), (x1 + nx, y1 + ny), (x1 - nx, y1 - ny), (x0 - nx, y0 - ny))
+        top = min(p[1] for p in corners)
+        bottom = max(p[1] for p in corners)
+        for y in self._rows(top, bottom):
+            py = y + 0.5
+            crossings = []
+            for (ax, ay), (bx, by) in zip(corners, corners[1:] + corners[:1]):
+                if (ay <= py < by) or (by <= py < ay):
+                    crossings.append(ax + (py - ay) * (bx - ax) / (by - ay))
+            if len(crossings) >= 2:
+                self.span(y, *self._pixel_span(min(crossings), max(crossings)), rgba)
+
+
+def _outlined(raster, kind, coords, width, outline, fill):
+    """Draw a Tk-style oval/rectangle: fill first, then an outline centred on the edge."""
+    draw = raster.ellipse if kind == "oval" else raster.rectangle
+    x0, y0, x1, y1 = coords
+    if fill:
+        draw(x0, y0, x1, y1, _rgba(fill))
+    if outline and width:
+        half = width / 2
+        draw(x0 - half, y0 - half, x1 + half, y1 + half, _rgba(outline), inner_inset=width)
+
+
+def rasterize_frame(gesture, progress, cell=CELL):
+    """RGBA bytes of one gesture keyframe, centred on the cell."""
+    raster = _Raster(cell, cell)
+    # A 2*cell x cell canvas puts the player-side anchor at the cell centre.
+    frame = rps_scene.gesture_frame(gesture, "player", progress, cell * 2, cell)
+    for (kind, static), (coords, dynamic) in zip(rps_scene.ITEM_LAYOUT[gesture], frame):
+        options = {**static, **dynamic}
+        if kind == "text":
+            continue
+        if kind == "line":
+            raster.thick_line(*coords, options.get("width", 1), _rgba(options.get("fill", "#000000")))
+        else:
+            _outlined(raster, kind, coords, options.get("width", 1), options.get("outline", "#000000"),
+                      options.get("fill"))
+    return raster.pixels
+
+
+def rasterize_strip(gesture, frame_count=rps_scene.ANIMATION_FRAMES, cell=CELL):
+    """Rows of RGBA bytes for frames 0..frame_count laid out left to right."""
+    frames = [rasterize_frame(gesture, frame / frame_count, cell) for frame in range(frame_count + 1)]
+    row_bytes = cell * 4
+    return [b"".join(frame[y * row_bytes:(y + 1) * row_bytes] for frame in frames) for y in range(cell)]
+
+
+def encode_png(width, height, rows):
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    raw = b"".join(b"\x00" + row for row in rows)
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw, 6))
+            + chunk(b"IEND", b""))
+
+
+def atlas_key(cell=CELL, frame_count=rps_scene.ANIMATION_FRAMES):
+    """Cache key covering everything that changes the pixels."""
+    theme = repr((RASTER_VERSION, cell, frame_count, sorted(rps_scene.ITEM_LAYOUT.items())))
+    return f"{cell}px-{frame_count}f-{hashlib.sha1(theme.encode()).hexdigest()[:12]}"
+
+
+def tk_frames(path, frame_count, cell):
+    """Load a strip into Tk and cut it into one PhotoImage per frame (UI thread only)."""
+    import tkinter
+    strip = tkinter.PhotoImage(file=path)
+    frames = []
+    for frame in range(frame_count + 1):
+        image = tkinter.PhotoImage(width=cell, height=cell)
+        image.tk.call(image, "copy", strip, "-from", frame * cell, 0, (frame + 1) * cell, cell, "-to", 0, 0)
+        frames.append(image)
+    return frames
+
+
+class SpriteAtlas:
+    """Gesture sprite strips on disk plus the per-frame images built from them.
+
+    prepare_async() writes any missing strips from a background thread.
+    frames() never rasterizes on the UI thread; it returns None until the
+    gesture's strip exists, and the scene draws that gesture with vectors
+    until then.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, frame_count=rps_scene.ANIMATION_FRAMES, cell=CELL,
+                 image_loader=tk_frames):
+        self.frame_count = frame_count
+        self.cell = cell
+        self.directory = os.path.join(cache_dir, atlas_key(cell, frame_count))
+        self.image_loader = image_loader
+        self.images = {}  # gesture -> per-frame images
+        self.stats = {"hits": 0, "loads": 0, "not_ready": 0, "rasterized": 0, "raster_ms": 0.0}
+        self._thread = None
+
+    def strip_path(self, gesture):
+        return os.path.join(self.directory, f"{gesture.lower()}.png")
+
+    def has_strip(self, gesture):
+        return os.path.exists(self.strip_path(gesture))
+
+    def build_strip(self, gesture):
+        """Rasterize and write one strip (safe to call off the UI thread)."""
+        start = time.perf_counter()
+        rows = rasterize_strip(gesture, self.frame_count, self.cell)
+        data = encode_png(self.cell * (self.frame_count + 1), self.cell, rows)
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.strip_path(gesture)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self.stats["rasterized"] += 1
+        self.stats["raster_ms"] += (time.perf_counter() - start) * 1000
+        return path
+
+    def build_missing(self):
+        for gesture in rps_scene.ITEM_LAYOUT:
+            if not self.has_strip(gesture):
+                try:
+                    self.build_strip(gesture)
+                except OSError as e:
+                    log.error("Error writing sprite strip for %s: %s", gesture, e)
+
+    def prepare_async(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.build_missing, name="rps-sprites", daemon=True)
+            self._thread.start()
+
+    def frames(self, gesture):
+        images = self.images.get(gesture)
+        if images is not None:
+            self.stats["hits"] += 1
+            return images
+        if not self.has_strip(gesture):
+            self.stats["not_ready"] += 1
+            return None
+        try:
+            images = self.image_loader(self.strip_path(gesture), self.frame_count, self.cell)
+        except Exception as e:
+            log.error("Error loading sprite strip for %s: %s", gesture, e)
+            return None
+        self.stats["loads"] += 1
+        self.images[gesture] = images
+        return images
@@ -0,0 +1,252 @@
+"""Durable leaderboard and save store backed by rps_leaderboard.json / rps_save.json.
+
+The JSON files are snapshots. Every finished game is appended to a journal
+next to the leaderboard as one JSON line holding the player's complete
+updated entry, so replaying the journal over the snapshot is idempotent: a
+crash at any point, including half-way through a compaction, never counts a
+game twice. A single background thread owns all file I/O. It loads the
+snapshot and journal, then batches appends and periodically compacts the
+journal back into the snapshots with an atomic replace.
+"""
+
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+
+import rps_log
+
+log = rps_log.get_logger("store")
+
+_CLOSE = object()
+
+
+def _atomic_write_json(path, data):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+            json.dump(data, tmp, indent=4)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class GameStore:
+    def __init__(self, leaderboard_path="rps_leaderboard.json", save_path="rps_save.json", journal_path=None,
+                 batch_size=64, flush_interval=0.5, compact_every=10_000, fsync=True):
+        self.leaderboard_path = leaderboard_path
+        self.save_path = save_path
+        self.journal_path = journal_path or os.path.splitext(leaderboard_path)[0] + ".journal"
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.entries = {}  # name -> {"name", "wins", "streak", "current_streak"}
+        self.save = {"player_name": None, "win_streak": 0}
+        self.loaded = threading.Event()
+        self.listeners = []
+        self.metrics = {"load_ms": None, "records_loaded": 0, "appended": 0, "batches": 0, "compactions": 0}
+        self._lock = threading.Lock()
+        self._queue = queue.SimpleQueue()
+        self._journal = None
+        self._journal_records = 0
+        self._thread = None
+
+    # UI-thread API: everything here is O(1) or a copy under a short lock.
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="rps-store", daemon=True)
+            self._thread.start()
+
+    def record_game(self, name, winner):
+        """Queue a finished game; winner is the end_game string ("You", "Computer", "It's a Tie")."""
+        if name:
+            self._queue.put((name, winner == "You"))
+
+    def entry(self, name):
+        with self._lock:
+            entry = self.entries.get(name)
+            return dict(entry) if entry else None
+
+    def leaderboard(self):
+        with self._lock:
+            return [dict(entry) for entry in self.entries.values()]
+
+    def last_save(self):
+        with self._lock:
+            return dict(self.save)
+
+    def close(self, timeout=5.0):
+        """Flush pending records, compact, and stop the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(_CLOSE)
+        self._thread.join(timeout)
+        self._thread = None
+
+    # Writer thread.
+
+    def _run(self):
+        start = time.perf_counter()
+        try:
+            self._load()
+        except Exception as e:
+            log.error("Error loading game store: %s", e)
+        self.metrics["load_ms"] = (time.perf_counter() - start) * 1000
+        self._notify(self.leaderboard())
+        self.loaded.set()
+        log.info("Game store loaded %s players in %.0f ms", len(self.entries), self.metrics['load_ms'])
+        try:
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+        except OSError as e:
+            log.error("Error opening journal '%s': %s, results will not be saved", self.journal_path, e)
+        closing = False
+        while not closing:
+            batch = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is _CLOSE:
+                    closing = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write_batch(batch)
+            if self._journal_records >= self.compact_every or (closing and self._journal_records):
+                self._compact()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _load(self):
+        if os.path.exists(self.leaderboard_path):
+            with open(self.leaderboard_path, encoding="utf-8") as f:
+                for entry in json.load(f):
+                    self._apply(entry)
+        if os.path.exists(self.save_path):
+            with open(self.save_path, encoding="utf-8") as f:
+                self.save.update(json.load(f))
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, "rb") as f:
+                data = f.read()
+            lines = data.split(b"\n")
+            valid_end = len(data)
+            try:
+                # One C-level parse for the whole journal instead of one json.loads per line.
+                records = json.loads(b"[" + b",".join(line for line in lines if line.strip()) + b"]")
+            except ValueError:
+                # A crash mid-append leaves a torn final line. Each line holds a complete entry, so
+                # any bad line can be skipped; a torn tail is also cut off by _repair_journal.
+                records = []
+                offset = 0
+                skipped = 0
+                for line in lines:
+                    if line.strip():
+                        try:
+                            records.append(json.loads(line))
+                            valid_end = len(data)
+                        except ValueError:
+                            skipped += 1
+                            valid_end = offset
+                    offset += len(line) + 1
+                if skipped:
+                    log.warning("Skipped %s unreadable journal lines in '%s'", skipped, self.journal_path)
+            self._repair_journal(data, valid_end)
+            for entry in records:
+                self._apply(entry)
+            if records:
+                last = records[-1]
+                self.save = {"player_name": last["name"], "win_streak": last.get("current_streak", 0)}
+            self._journal_records = len(records)
+            self.metrics["records_loaded"] = len(records)
+
+    def _repair_journal(self, data, valid_end):
+        """Cut a torn tail off the journal and make it end in a newline, so appends start a fresh line."""
+        if valid_end == len(data) and (not data or data.endswith(b"\n")):
+            return
+        with open(self.journal_path, "r+b") as f:
+            f.truncate(valid_end)
+            if valid_end and data[valid_end - 1:valid_end] != b"\n":
+                f.seek(valid_end)
+                f.write(b"\n")
+
+    def _apply(self, entry):
+        entry.setdefault("streak", 0)
+        entry.setdefault("current_streak", 0)
+        self.entries[entry["name"]] = entry
+
+    def _write_batch(self, batch):
+        lines = []
+        updated = []
+        with self._lock:
+            for name, won in batch:
+                entry = self.entries.get(name)
+                if entry is None:
+                    entry = {"name": name, "wins": 0, "streak": 0, "current_streak": 0}
+                    self.entries[name] = entry
+                if won:
+                    entry["wins"] += 1
+                    entry["current_streak"] += 1
+                    entry["streak"] = max(entry["streak"], entry["current_streak"])
+                else:
+                    entry["current_streak"] = 0
+                self.save = {"player_name": name, "win_streak": entry["current_streak"]}
+                lines.append(json.dumps(entry, separators=(",", ":")))
+                updated.append(dict(entry))
+        if self._journal is not None:
+            try:
+                self._journal.write("\n".join(lines) + "\n")
+                self._journal.flush()
+                if self.fsync:
+                    os.fsync(self._journal.fileno())
+            except OSError as e:
+                log.error("Error appending to journal: %s", e)
+        self._journal_records += len(lines)
+        self.metrics["appended"] += len(lines)
+        self.metrics["batches"] += 1
+        self._notify(updated)
+
+    def _notify(self, entries):
+        """Hand updated entries to listeners (called on the writer thread)."""
+        for listener in self.listeners:
+            try:
+                listener(entries)
+            except Exception as e:
+                log.error("Error in game store listener: %s", e)
+
+    def _compact(self):
+        with self._lock:
+            snapshot = [dict(entry) for entry in self.entries.values()]
+            save = dict(self.save)
+        try:
+            _atomic_write_json(self.leaderboard_path, snapshot)
+            _atomic_write_json(self.save_path, save)
+            if self._journal is not None:
+                self._journal.truncate(0)
+                self._journal.seek(0)
+            else:
+                open(self.journal_path, "w").close()
+            self._journal_records = 0
+            self.metrics["compactions"] += 1
+            log.info("Game store compacted %s players", len(snapshot))
+        except OSError as e:
+            log.error("Error compacting game store: %s", e)
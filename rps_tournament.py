@@ -0,0 +1,169 @@
+"""Round-robin tournament between computer strategies, spread over a process pool.
+
+Every pair of strategies in STRATEGIES plays `rounds` rounds. The rounds are
+split into independent matches of `match_rounds` rounds, each with fresh
+strategy instances and its own seed derived from (seed, pairing, match
+index). That makes results identical for any number of workers, and the
+spread of per-match win rates gives a confidence interval that holds for
+adaptive strategies, whose rounds are not independent. Outcomes come from
+rps_engine.OUTCOME_TABLE, the table behind resolve() and display_result.
+
+Run: python rps_tournament.py [--rounds N] [--match-rounds N] [--workers N] [--seed N]
+"""
+
+import argparse
+import itertools
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import rps_engine
+import rps_opponent
+
+# name -> factory(rng). Workers look factories up by name, so tasks only carry strings.
+STRATEGIES = rps_opponent.STRATEGIES
+
+Z_95 = 1.96
+
+
+def play_match(task):
+    """Worker: play one match and return (pairing, wins_a, wins_b, ties)."""
+    name_a, name_b, rounds, seed = task
+    a = STRATEGIES[name_a](random.Random(f"{seed}:a"))
+    b = STRATEGIES[name_b](random.Random(f"{seed}:b"))
+    next_a, observe_a = a.next_move, a.observe
+    next_b, observe_b = b.next_move, b.observe
+    table = rps_engine.OUTCOME_TABLE
+    counts = [0, 0, 0]  # indexed by outcome from a's point of view
+    for _ in range(rounds):
+        move_a = next_a()
+        move_b = next_b()
+        counts[table[move_a][move_b]] += 1
+        # Each side sees the other as "player" and itself as "computer".
+        observe_a(move_b, move_a)
+        observe_b(move_a, move_b)
+    return (name_a, name_b), counts[rps_engine.WIN], counts[rps_engine.LOSE], counts[rps_engine.TIE]
+
+
+def make_tasks(names, rounds, match_rounds, seed):
+    tasks = []
+    for name_a, name_b in itertools.combinations(names, 2):
+        remaining = rounds
+        index = 0
+        while remaining > 0:
+            size = min(match_rounds, remaining)
+            tasks.append((name_a, name_b, size, f"{seed}:{name_a}:{name_b}:{index}"))
+            remaining -= size
+            index += 1
+    return tasks
+
+
+class MatchupResult:
+    __slots__ = ("wins_a", "wins_b", "ties", "rates")
+
+    def __init__(self):
+        self.wins_a = 0
+        self.wins_b = 0
+        self.ties = 0
+        self.rates = []  # per-match win rate of a
+
+    def add(self, wins_a, wins_b, ties):
+        self.wins_a += wins_a
+        self.wins_b += wins_b
+        self.ties += ties
+        self.rates.append(wins_a / (wins_a + wins_b + ties))
+
+    @property
+    def rounds(self):
+        return self.wins_a + self.wins_b + self.ties
+
+    def win_rate(self):
+        return self.wins_a / self.rounds
+
+    def loss_rate(self):
+        return self.wins_b / self.rounds
+
+    def interval(self):
+        """Half-width of the 95% confidence interval on a's win rate."""
+        n = len(self.rates)
+        if n < 2:
+            # One match: fall back to the binomial interval, exact only for memoryless strategies.
+            p = self.win_rate()
+            return Z_95 * math.sqrt(p * (1 - p) / self.rounds)
+        mean = sum(self.rates) / n
+        variance = sum((rate - mean) ** 2 for rate in self.rates) / (n - 1)
+        return Z_95 * math.sqrt(variance / n)
+
+
+def run_tournament(names=None, rounds=1_000_000, match_rounds=50_000, workers=None, seed=0):
+    """Play every pairing and return {(name_a, name_b): MatchupResult}."""
+    names = list(STRATEGIES) if names is None else list(names)
+    for name in names:
+        if name not in STRATEGIES:
+            raise ValueError(f"Unknown strategy '{name}'")
+    tasks = make_tasks(names, rounds, match_rounds, seed)
+    results = {pairing: MatchupResult() for pairing in itertools.combinations(names, 2)}
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        outputs = map(play_match, tasks)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        outputs = executor.map(play_match, tasks, chunksize=max(1, len(tasks) // (workers * 8)))
+    try:
+        for pairing, wins_a, wins_b, ties in outputs:
+            results[pairing].add(wins_a, wins_b, ties)
+    finally:
+        if workers != 1:
+            executor.shutdown()
+    return results
+
+
+def format_table(names, results):
+    """Row strategy's win rate against each column strategy, with 95% intervals."""
+    width = max(14, max(len(name) for name in names) + 1)
+    lines = [" " * width + "".join(f"{name:>{width}}" for name in names)]
+    for row in names:
+        cells = []
+        for column in names:
+            if row == column:
+                cells.append(f"{'-':>{width}}")
+                continue
+            if (row, column) in results:
+                result = results[(row, column)]
+                rate = result.win_rate()
+            else:
+                result = results[(column, row)]
+                rate = result.loss_rate()
+            cells.append(f"{f'{rate:.1%}±{result.interval():.1%}':>{width}}")
+        lines.append(f"{row:<{width}}" + "".join(cells))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Round-robin tournament between RPS strategies")
+    parser.add_argument("--rounds", type=int, default=1_000_000, help="rounds per pairing")
+    parser.add_argument("--match-rounds", type=int, default=50_000, help="rounds per independent match")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--strategies", nargs="+", default=None, choices=list(STRATEGIES))
+    args = parser.parse_args()
+    if args.rounds < 1:
+        parser.error("--rounds must be at least 1")
+    if args.match_rounds < 1:
+        parser.error("--match-rounds must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    names = args.strategies or list(STRATEGIES)
+    start = time.perf_counter()
+    results = run_tournament(names, args.rounds, args.match_rounds, args.workers, args.seed)
+    elapsed = time.perf_counter() - start
+    total = sum(result.rounds for result in results.values())
+    print(format_table(names, results))
+    print(f"{total:,} rounds in {elapsed:.1f} s ({total / elapsed:,.0f} rounds/sec)")
+
+
+if __name__ == "__main__":
+    main()
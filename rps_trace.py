@@ -0,0 +1,191 @@
+"""Hot-path tracing: timed spans, a frame-time histogram and Chrome trace export.
+
+A Tracer is either on or off for the life of the app. When it is off,
+instrument() and wrap() leave methods untouched and the begin/end markers
+are bound to a no-op, so the traced paths run exactly as before.
+When it is on, instrument() replaces the named methods on one instance
+with wrappers that record a complete ("X") event each time they run.
+Events go into a bounded deque, so a long session keeps only its latest
+MAX_EVENTS events. export_chrome() writes them as trace-event JSON that
+chrome://tracing and Perfetto open directly.
+
+Frame times come from FrameClock's frame_observer hook, one sample per clock
+tick. They feed a FrameHistogram, and FrameOverlay shows the recent FPS and
+p95 frame time on a canvas. The histogram and overlay work with span
+tracing off (--fps-overlay) or on (--trace).
+"""
+
+import collections
+import json
+import os
+import threading
+import time
+from array import array
+
+MAX_EVENTS = 200_000
+BUCKET_MS = 0.25
+HISTOGRAM_MS = 100  # one overflow bucket above this
+RECENT_FRAMES = 240
+OVERLAY_INTERVAL_MS = 500
+
+
+def _off(*args):
+    pass
+
+
+class FrameHistogram:
+    """Frame durations in fixed BUCKET_MS buckets, plus the last RECENT_FRAMES samples."""
+
+    def __init__(self, bucket_ms=BUCKET_MS, max_ms=HISTOGRAM_MS, recent=RECENT_FRAMES):
+        self.bucket_ms = bucket_ms
+        self.counts = array("I", bytes(4 * (int(max_ms / bucket_ms) + 1)))
+        self.recent = collections.deque(maxlen=recent)  # (start, duration) in seconds
+        self.total = 0
+        self.max_ms = 0.0
+
+    def add(self, start, duration):
+        ms = duration * 1000
+        index = int(ms / self.bucket_ms)
+        counts = self.counts
+        counts[index if index < len(counts) else -1] += 1
+        self.total += 1
+        if ms > self.max_ms:
+            self.max_ms = ms
+        self.recent.append((start, duration))
+
+    def percentile(self, fraction):
+        """Upper edge of the bucket holding the given fraction of all frames (at most the max), in ms."""
+        if not self.total:
+            return 0.0
+        target = fraction * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return self.max_ms if index == len(self.counts) - 1 else min((index + 1) * self.bucket_ms, self.max_ms)
+        return self.max_ms
+
+    def recent_stats(self, now, window=1.0):
+        """(frames per second, p95 ms) over the recent frames that started within `window` seconds."""
+        samples = [duration for start, duration in self.recent if now - start <= window]
+        if not samples:
+            return 0.0, 0.0
+        samples.sort()
+        return len(samples) / window, samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000
+
+    def summary(self):
+        return {"frames": self.total, "p50_ms": self.percentile(0.5), "p95_ms": self.percentile(0.95),
+                "p99_ms": self.percentile(0.99), "max_ms": round(self.max_ms, 3)}
+
+
+class Tracer:
+    def __init__(self, enabled=False, max_events=MAX_EVENTS):
+        self.enabled = enabled
+        self.events = collections.deque(maxlen=max_events)  # (phase, name, category, start, duration or id)
+        self.frames = FrameHistogram()
+        self.origin = time.perf_counter()
+        self.tid = threading.get_native_id()
+        if enabled:
+            self.begin = self._begin
+            self.end = self._end
+        else:
+            self.begin = self.end = _off
+
+    def wrap(self, func, name, category="app"):
+        """func, timed as span `name` when tracing is on; func itself when it is off."""
+        if not self.enabled:
+            return func
+        events = self.events
+        clock = time.perf_counter
+
+        def traced(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                events.append(("X", name, category, start, clock() - start))
+
+        traced.__wrapped__ = func
+        return traced
+
+    def instrument(self, obj, names, category="app"):
+        """Trace the named methods of this one instance; names may map method -> span name."""
+        if not self.enabled:
+            return
+        items = names.items() if isinstance(names, dict) else ((name, name) for name in names)
+        for method, span in items:
+            setattr(obj, method, self.wrap(getattr(obj, method), span, category))
+
+    def _begin(self, name, span_id, category="app"):
+        """Start an async span that ends in another callback, e.g. a click and its result."""
+        self.events.append(("b", name, category, time.perf_counter(), span_id))
+
+    def _end(self, name, span_id, category="app"):
+        self.events.append(("e", name, category, time.perf_counter(), span_id))
+
+    def frame(self, start, end):
+        """FrameClock.frame_observer: one clock tick from start to end (perf_counter seconds)."""
+        self.frames.add(start, end - start)
+        if self.enabled:
+            self.events.append(("X", "frame", "clock", start, end - start))
+
+    def span_stats(self):
+        """name -> [count, total ms, max ms] over the recorded complete spans."""
+        stats = {}
+        for phase, name, _, _, duration in self.events:
+            if phase != "X":
+                continue
+            entry = stats.setdefault(name, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += duration * 1000
+            entry[2] = max(entry[2], duration * 1000)
+        return stats
+
+    def chrome_events(self):
+        pid = os.getpid()
+        origin = self.origin
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": self.tid,
+                   "args": {"name": "Rock Paper Scissors Deluxe"}},
+                  {"name": "thread_name", "ph": "M", "pid": pid, "tid": self.tid, "args": {"name": "Tk"}}]
+        for phase, name, category, start, extra in self.events:
+            event = {"name": name, "cat": category, "ph": phase, "ts": round((start - origin) * 1e6, 3),
+                     "pid": pid, "tid": self.tid}
+            if phase == "X":
+                event["dur"] = round(extra * 1e6, 3)
+            else:
+                event["id"] = extra
+            events.append(event)
+        return events
+
+    def export_chrome(self, path):
+        """Write the recorded events as Chrome trace-event JSON; returns the event count."""
+        events = self.chrome_events()
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms",
+                       "otherData": {"frame_histogram": self.frames.summary()}}, trace_file)
+        return len(events)
+
+
+class FrameOverlay:
+    """FPS and p95 frame time drawn in a corner of a canvas, refreshed from the frame clock."""
+
+    def __init__(self, canvas, histogram, clock, interval_ms=OVERLAY_INTERVAL_MS):
+        self.canvas = canvas
+        self.histogram = histogram
+        self.item = None
+        self.handle = clock.add(self.update, interval_ms)
+
+    def update(self, step):
+        canvas = self.canvas
+        if not canvas.winfo_exists():
+            return False
+        fps, p95 = self.histogram.recent_stats(time.perf_counter())
+        text = f"{fps:.0f} FPS  p95 {p95:.1f} ms"
+        # The scene's build() deletes every item, so recreate the label when it is gone.
+        if self.item is None or not canvas.find_withtag("overlay"):
+            self.item = canvas.create_text(6, 4, text=text, anchor="nw", fill="#00FF00",
+                                           font=("Consolas", 9), tags=("overlay",))
+        else:
+            canvas.itemconfigure(self.item, text=text)
+            canvas.tag_raise(self.item)
+        return True